@@ -0,0 +1,124 @@
+"""
+Generators of synthetic PynamoDB codebases, for benchmarking.
+
+Each generator returns the codebase as a mapping of module names to module sources.
+"""
+from __future__ import annotations
+
+from typing import Dict
+
+Codebase = Dict[str, str]
+
+_ATTRIBUTE_CLASSES = [
+    ("UnicodeAttribute", "'value'"),
+    ("NumberAttribute", "42"),
+    ("BooleanAttribute", "True"),
+    ("UTCDateTimeAttribute", "datetime.now()"),
+    ("BinaryAttribute", "b'value'"),
+]
+
+_IMPORTS = [
+    "from datetime import datetime",
+    "",
+    *(f"from pynamodb.attributes import {attr_cls}" for attr_cls, _ in _ATTRIBUTE_CLASSES),
+    "from pynamodb.models import Model",
+    "",
+]
+
+
+def _attribute(index: int) -> tuple[str, str]:
+    """
+    Returns an attribute declaration and an example value for it.
+    """
+    attr_cls, value = _ATTRIBUTE_CLASSES[index % len(_ATTRIBUTE_CLASSES)]
+    return f"{attr_cls}({'null=True' if index % 3 == 0 else ''})", value
+
+
+def _model(name: str, base: str, num_attributes: int, *, attr_prefix: str = "attr") -> list[str]:
+    lines = [f"class {name}({base}):"]
+    if base == "Model":
+        lines.append("    key = UnicodeAttribute(hash_key=True)")
+    for i in range(num_attributes):
+        lines.append(f"    {attr_prefix}_{i} = {_attribute(i)[0]}")
+    if len(lines) == 1:
+        lines.append("    pass")
+    return [*lines, ""]
+
+
+def _call_sites(model_module: str, model_name: str, num_attributes: int, num_call_sites: int) -> list[str]:
+    """
+    Generates a function with constructor call sites and attribute reads of a model.
+    """
+    lines = [f"def use_{model_name}() -> None:"]
+    for i in range(num_call_sites):
+        attr_idx = i % max(num_attributes, 1)
+        value = _attribute(attr_idx)[1]
+        kwargs = f"attr_{attr_idx}={value}" if num_attributes else ""
+        lines.append(f"    m{i} = {model_module}.{model_name}('key', {kwargs})")
+        if num_attributes:
+            lines.append(f"    _ = m{i}.attr_{attr_idx}")
+    return [*lines, ""]
+
+
+def generate_models(num_models: int, num_attributes: int, *, num_call_sites: int = 10) -> Codebase:
+    """
+    N models of M attributes each, spread across modules of (at most) 10 models, and as many modules using them.
+    """
+    codebase = {}
+    for module_idx in range(0, num_models, 10):
+        module_name = f"models_{module_idx // 10}"
+        lines = list(_IMPORTS)
+        usage = ["from datetime import datetime", "", f"import {module_name}", ""]
+        for model_idx in range(module_idx, min(module_idx + 10, num_models)):
+            lines += _model(f"Model{model_idx}", "Model", num_attributes)
+            usage += _call_sites(module_name, f"Model{model_idx}", num_attributes, num_call_sites)
+        codebase[module_name] = "\n".join(lines)
+        codebase[f"usage_{module_idx // 10}"] = "\n".join(usage)
+    return codebase
+
+
+def generate_inheritance(depth: int, num_attributes: int, *, num_call_sites: int = 10) -> Codebase:
+    """
+    A chain of models, each deriving from the previous one and adding its own attributes.
+    """
+    lines = list(_IMPORTS)
+    for level in range(depth):
+        base = "Model" if level == 0 else f"Level{level - 1}"
+        lines += _model(f"Level{level}", base, num_attributes, attr_prefix=f"level{level}_attr")
+    leaf = f"Level{depth - 1}"
+    usage = ["from datetime import datetime", "", "import models", "", f"def use_{leaf}() -> None:"]
+    for i in range(num_call_sites):
+        level, attr_idx = i % depth, i % max(num_attributes, 1)
+        kwargs = f"level{level}_attr_{attr_idx}={_attribute(attr_idx)[1]}" if num_attributes else ""
+        usage.append(f"    m{i} = models.{leaf}(key='key', {kwargs})")
+        if num_attributes:
+            usage.append(f"    _ = m{i}.level{level}_attr_{attr_idx}")
+    return {"models": "\n".join(lines), "usage": "\n".join([*usage, ""])}
+
+
+def generate_wide_model(num_attributes: int) -> Codebase:
+    """
+    A single model with many attributes (plus a constructor call and attribute reads).
+    """
+    lines = [
+        "from pynamodb.attributes import NumberAttribute",
+        "from pynamodb.attributes import UnicodeAttribute",
+        "from pynamodb.models import Model",
+        "",
+        "class WideModel(Model):",
+        "    key = UnicodeAttribute(hash_key=True)",
+    ]
+    for i in range(num_attributes):
+        attr_cls = "NumberAttribute" if i % 2 else "UnicodeAttribute"
+        null = ", null=True" if i % 3 == 0 else ""
+        lines.append(f"    attr_{i} = {attr_cls}(attr_name='a{i}'{null})")
+    lines += [
+        "",
+        "    def method(self) -> None:",
+        "        pass",
+        "",
+        "model = WideModel('key', attr_1=1.0)",
+        *(f"_ = model.attr_{i}" for i in range(0, num_attributes, 10)),
+        "",
+    ]
+    return {"wide_model": "\n".join(lines)}
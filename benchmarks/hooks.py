@@ -0,0 +1,113 @@
+"""
+Benchmark of the plugin's hooks, compiled with mypyc (see setup.py) against interpreted.
+
+Type-checks a synthetic codebase with the plugin as built (which needs to be compiled), then with its pure-Python
+sources, timing the hooks mypy calls (see `benchmarks.timed_plugin`), and reports the time spent in each of them
+by either, along with the speedup:
+
+    PYNAMODB_MYPY_USE_MYPYC=1 python setup.py build_ext --inplace
+    python -m benchmarks.hooks [--models 200] [--attributes 20] [--repeat 3] [--output hooks.json]
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import importlib.machinery
+import json
+import os
+import shutil
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from benchmarks import codegen
+from benchmarks.timed_plugin import OUTPUT_ENV_VAR
+
+
+def _is_compiled() -> bool:
+    module = importlib.import_module("pynamodb_mypy.plugin")
+    return (module.__file__ or "").endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES))
+
+
+def time_hooks(files: list[str], cwd: str, *, pythonpath: list[str], repeat: int) -> dict[str, dict[str, Any]]:
+    """
+    Type-checks the files (from scratch) with the hooks timed and returns the calls and best wall time of each hook.
+    """
+    output_path = os.path.join(cwd, "hooks.json")
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(pythonpath),
+        OUTPUT_ENV_VAR: output_path,
+    }
+    hooks: dict[str, dict[str, Any]] = {}
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-m", "mypy", "--config-file", "mypy.ini", "--no-incremental", *files],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"mypy failed:\n{proc.stdout}{proc.stderr}")
+        with open(output_path) as f:
+            for name, stats in json.load(f)["hooks"].items():
+                if name not in hooks or stats["time"] < hooks[name]["time"]:
+                    hooks[name] = stats
+    return hooks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="where to write the results (JSON)")
+    parser.add_argument("--models", type=int, default=200, help="number of models")
+    parser.add_argument("--attributes", type=int, default=20, help="number of attributes per model")
+    parser.add_argument("--call-sites", type=int, default=20, help="number of call sites per model")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs (the best one is reported)")
+    args = parser.parse_args()
+    if not _is_compiled():
+        parser.error("pynamodb_mypy isn't compiled; build it with PYNAMODB_MYPY_USE_MYPYC=1 (see setup.py)")
+
+    codebase = codegen.generate_models(args.models, args.attributes, num_call_sites=args.call_sites)
+    with TemporaryDirectory() as tempdirname:
+        for module_name, source in codebase.items():
+            with open(os.path.join(tempdirname, f"{module_name}.py"), "w") as f:
+                f.write(source)
+        with open(os.path.join(tempdirname, "mypy.ini"), "w") as f:
+            f.write("[mypy]\nplugins = benchmarks.timed_plugin\n")
+        # the pure-Python sources, to be imported ahead of the compiled modules
+        package_dir = os.path.dirname(importlib.import_module("pynamodb_mypy").__file__ or "")
+        pure_dir = os.path.join(tempdirname, "pure")
+        shutil.copytree(
+            package_dir,
+            os.path.join(pure_dir, "pynamodb_mypy"),
+            ignore=shutil.ignore_patterns(*(f"*{suffix}" for suffix in importlib.machinery.EXTENSION_SUFFIXES)),
+        )
+
+        files = [f"{module_name}.py" for module_name in codebase]
+        pythonpath = [os.getcwd(), *sys.path]
+        compiled = time_hooks(files, tempdirname, pythonpath=pythonpath, repeat=args.repeat)
+        interpreted = time_hooks(files, tempdirname, pythonpath=[pure_dir, *pythonpath], repeat=args.repeat)
+
+    results = {
+        name: {
+            "calls": stats["calls"],
+            "interpreted": interpreted[name]["time"],
+            "compiled": stats["time"],
+            "speedup": interpreted[name]["time"] / stats["time"] if stats["time"] else None,
+        }
+        for name, stats in sorted(compiled.items())
+        if name in interpreted
+    }
+    print(f"{'hook':<64}{'calls':>10}{'interpreted (s)':>18}{'compiled (s)':>15}{'speedup':>10}")
+    for name, result in results.items():
+        speedup = f"{result['speedup']:.2f}x" if result["speedup"] is not None else "-"
+        print(f"{name:<64}{result['calls']:>10}{result['interpreted']:>18.3f}{result['compiled']:>15.3f}{speedup:>10}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"parameters": vars(args), "hooks": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark suite measuring the plugin's overhead against plain mypy.
+
+Generates synthetic codebases and type-checks each of them with and without the plugin, in several modes:
+
+- cold: no incremental cache
+- warm: with the cache left behind by the cold run, after a module using the models changed
+- dmypy: a (in-process) mypy daemon rechecking after a module using the models changed
+
+and writes the wall times, peak RSS and the number of calls to each of the plugin's hooks in a JSON file:
+
+    python -m benchmarks.run [--output benchmark.json] [--scenario models] [--mode cold] ...
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from importlib.metadata import version
+from tempfile import TemporaryDirectory
+from typing import Any
+from typing import Callable
+
+from benchmarks import codegen
+
+MODES = ["cold", "warm", "dmypy"]
+
+
+def _scenarios(args: argparse.Namespace) -> dict[str, Callable[[], codegen.Codebase]]:
+    return {
+        "models": lambda: codegen.generate_models(args.models, args.attributes, num_call_sites=args.call_sites),
+        "inheritance": lambda: codegen.generate_inheritance(
+            args.depth, args.attributes, num_call_sites=args.call_sites
+        ),
+        "wide_model": lambda: codegen.generate_wide_model(args.wide_attributes),
+    }
+
+
+def _run_worker(worker_args: list[str], cwd: str) -> dict[str, Any]:
+    """
+    Runs a measurement in a subprocess; the subprocess's peak RSS is added to the measurement.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([os.getcwd(), *sys.path])}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.worker", *worker_args],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    stdout, stderr = proc.stdout.read(), proc.stderr.read()
+    _, status, rusage = os.wait4(proc.pid, 0)
+    if os.waitstatus_to_exitcode(status) != 0:
+        raise RuntimeError(f"benchmark worker failed:\n{stdout}{stderr}")
+    result: dict[str, Any] = json.loads(stdout.splitlines()[-1])
+    # ru_maxrss is in kilobytes on Linux, but in bytes on macOS
+    result["peak_rss_mib"] = rusage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    return result
+
+
+def run_scenario(name: str, codebase: codegen.Codebase, modes: list[str]) -> list[dict[str, Any]]:
+    results = []
+    for plugin in (False, True):
+        with TemporaryDirectory() as tempdirname:
+            for module_name, source in codebase.items():
+                with open(os.path.join(tempdirname, f"{module_name}.py"), "w") as f:
+                    f.write(source)
+            with open(os.path.join(tempdirname, "mypy.ini"), "w") as f:
+                f.write("[mypy]\n" + ("plugins = pynamodb_mypy\n" if plugin else ""))
+
+            # the last module is the one changed for the warm and dmypy runs (it's a module using the models)
+            files = [f"{module_name}.py" for module_name in codebase]
+            worker_args = ["--config-file", "mypy.ini", "--cache-dir", ".mypy_cache", "--touch", files[-1], *files]
+            # a warm run needs the cache left behind by a cold run
+            for mode in ["cold", *modes] if "warm" in modes and "cold" not in modes else modes:
+                result = _run_worker(["--mode", mode, *worker_args], cwd=tempdirname)
+                if mode in modes:
+                    results.append({"scenario": name, "mode": mode, "plugin": plugin, **result})
+                    print(
+                        f"{name:<12} {mode:<6} {'plugin' if plugin else 'plain':<7}"
+                        f"{result['wall_time']:8.2f}s {result['peak_rss_mib']:8.1f} MiB",
+                        file=sys.stderr,
+                    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="benchmark.json", help="where to write the results (JSON)")
+    parser.add_argument("--scenario", action="append", help="scenario(s) to run (default: all)")
+    parser.add_argument("--mode", action="append", choices=MODES, help="mode(s) to run (default: all)")
+    parser.add_argument("--models", type=int, default=200, help="number of models ('models' scenario)")
+    parser.add_argument("--attributes", type=int, default=20, help="number of attributes per model")
+    parser.add_argument("--depth", type=int, default=20, help="depth of model inheritance ('inheritance' scenario)")
+    parser.add_argument("--call-sites", type=int, default=20, help="number of call sites per model")
+    parser.add_argument("--wide-attributes", type=int, default=1000, help="attributes of the 'wide_model' scenario")
+    args = parser.parse_args()
+
+    scenarios = _scenarios(args)
+    results = []
+    for name in args.scenario or scenarios:
+        results += run_scenario(name, scenarios[name](), args.mode or MODES)
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "mypy": version("mypy"),
+            "pynamodb": version("pynamodb"),
+            "pynamodb-mypy": version("pynamodb-mypy"),
+        },
+        "parameters": {name: value for name, value in vars(args).items() if name not in ("output", "scenario", "mode")},
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+mypy plugin entry point for `benchmarks.hooks`: the plugin (as imported, compiled or not), with the hooks mypy
+calls timed, and their calls and wall time written as JSON to the file named by `PYNAMODB_MYPY_BENCHMARK_OUTPUT`
+once mypy is done.
+
+It wraps the plugin rather than deriving from it (as `ProfilingPynamodbPlugin` does), as overriding the plugin's
+methods would have its compiled code call back into interpreted overrides from within the very hooks being timed.
+So only what mypy calls is timed: the dispatchers, and the hooks they return (along with whatever they call).
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import weakref
+from typing import Any
+from typing import Callable
+from typing import Type
+
+import mypy.nodes
+import mypy.options
+from mypy.plugin import Plugin
+from mypy.plugin import ReportConfigContext
+
+from pynamodb_mypy._profiling import Profiler
+from pynamodb_mypy.plugin import PynamodbPlugin
+
+OUTPUT_ENV_VAR = "PYNAMODB_MYPY_BENCHMARK_OUTPUT"
+
+Hook = Callable[[Any], Any]
+
+
+def _report(profiler: Profiler, plugin: PynamodbPlugin, output_path: str) -> None:
+    with open(output_path, "w") as f:
+        json.dump(profiler.summary(plugin._memos), f, indent=2)
+
+
+class TimedPynamodbPlugin(Plugin):
+    def __init__(self, options: mypy.options.Options) -> None:
+        super().__init__(options)
+        # mypy normally exits without running exit handlers; we need them to report at the end of the build
+        options.fast_exit = False
+        self._plugin = PynamodbPlugin(options)
+        self._profiler = Profiler()
+        # compiled functions have no names of their own, so they're named after the plugin's class attributes
+        self._hook_names = {function: name for name, function in vars(PynamodbPlugin).items() if callable(function)}
+        weakref.finalize(self, _report, self._profiler, self._plugin, os.environ[OUTPUT_ENV_VAR])
+
+    def set_modules(self, modules: dict[str, mypy.nodes.MypyFile]) -> None:
+        super().set_modules(modules)
+        self._plugin.set_modules(modules)
+
+    def get_additional_deps(self, file: mypy.nodes.MypyFile) -> list[tuple[int, str, int]]:
+        return self._plugin.get_additional_deps(file)
+
+    def report_config_data(self, ctx: ReportConfigContext) -> Any:
+        return self._plugin.report_config_data(ctx)
+
+    def get_function_signature_hook(self, fullname: str) -> Hook | None:
+        return self._dispatch("get_function_signature_hook", self._plugin.get_function_signature_hook, fullname)
+
+    def get_attribute_hook(self, fullname: str) -> Hook | None:
+        return self._dispatch("get_attribute_hook", self._plugin.get_attribute_hook, fullname)
+
+    def get_function_hook(self, fullname: str) -> Hook | None:
+        return self._dispatch("get_function_hook", self._plugin.get_function_hook, fullname)
+
+    def get_method_signature_hook(self, fullname: str) -> Hook | None:
+        return self._dispatch("get_method_signature_hook", self._plugin.get_method_signature_hook, fullname)
+
+    def get_method_hook(self, fullname: str) -> Hook | None:
+        return self._dispatch("get_method_hook", self._plugin.get_method_hook, fullname)
+
+    def get_base_class_hook(self, fullname: str) -> Hook | None:
+        return self._dispatch("get_base_class_hook", self._plugin.get_base_class_hook, fullname)
+
+    def _dispatch(self, name: str, dispatcher: Callable[[str], Hook | None], fullname: str) -> Hook | None:
+        with self._profiler.measure(name):
+            hook = dispatcher(fullname)
+        if hook is None:
+            return None
+        # the dispatchers return bound methods, some of them partially applied
+        method = hook.func if isinstance(hook, functools.partial) else hook
+        hook_name = self._hook_names[method.__func__]  # type: ignore[attr-defined]
+        return functools.partial(self._call, hook_name, hook)
+
+    def _call(self, name: str, hook: Hook, ctx: Any) -> Any:
+        with self._profiler.measure(name):
+            return hook(ctx)
+
+
+def plugin(version: str) -> Type[TimedPynamodbPlugin]:
+    return TimedPynamodbPlugin
@@ -0,0 +1,63 @@
+"""
+Regression benchmark for models with many attributes.
+
+Type-checks a synthetic model with 1,000 attributes (plus a constructor call and attribute reads)
+and reports how long mypy takes to recheck it, with and without the plugin. The dependencies
+(typeshed, pynamodb) are loaded from a warmed-up incremental cache, so that the time is dominated
+by the model's module:
+
+    python -m benchmarks.wide_model [--attributes 1000] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from tempfile import TemporaryDirectory
+
+import mypy.api
+
+from benchmarks.codegen import generate_wide_model
+
+
+def run_mypy(path: str, source: str, *, plugin: bool, repeat: int) -> float:
+    """
+    Rechecks the given module (its dependencies coming from a warm cache) and returns the best wall time.
+    """
+    dirname = os.path.dirname(path)
+    config_file = os.path.join(dirname, "plugin.ini" if plugin else "plain.ini")
+    with open(config_file, "w") as f:
+        f.write("[mypy]\n" + ("plugins = pynamodb_mypy\n" if plugin else ""))
+    mypy_args = [path, "--cache-dir", os.path.join(dirname, ".mypy_cache"), "--config-file", config_file]
+
+    timings = []
+    for run in range(repeat + 1):
+        # change the module for each run, so it's rechecked (and the first run is only for warming up the cache)
+        with open(path, "w") as f:
+            f.write(f"{source}\n# run {run}\n")
+        start = time.perf_counter()
+        stdout, stderr, exit_status = mypy.api.run(mypy_args)
+        timings.append(time.perf_counter() - start)
+        if exit_status != 0:
+            raise RuntimeError(f"mypy failed:\n{stdout}{stderr}")
+    return min(timings[1:])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attributes", type=int, default=1000, help="number of attributes in the model")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs (the best one is reported)")
+    args = parser.parse_args()
+
+    source = generate_wide_model(args.attributes)["wide_model"]
+    with TemporaryDirectory() as tempdirname:
+        plain = run_mypy(os.path.join(tempdirname, "wide_model.py"), source, plugin=False, repeat=args.repeat)
+    with TemporaryDirectory() as tempdirname:
+        with_plugin = run_mypy(os.path.join(tempdirname, "wide_model.py"), source, plugin=True, repeat=args.repeat)
+
+    print(f"{args.attributes} attributes: mypy {plain:.2f}s, mypy with plugin {with_plugin:.2f}s")
+    print(f"plugin overhead: {with_plugin - plain:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Runs a single benchmark measurement; meant to be run in a subprocess by `benchmarks.run`,
+which measures the subprocess's peak RSS.
+
+Prints the measurement as JSON on the last line of stdout.
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import os
+import time
+from collections import Counter
+from typing import Any
+from typing import Callable
+
+import mypy.api
+from mypy.config_parser import parse_config_file
+from mypy.dmypy_server import Server
+from mypy.find_sources import create_source_list
+from mypy.options import Options
+
+from pynamodb_mypy.plugin import PynamodbPlugin
+
+hook_calls: Counter[str] = Counter()
+
+
+def _count_hook_calls() -> None:
+    """
+    Counts calls to the plugin's hooks (both the dispatchers and the hooks they return).
+    """
+
+    def _counted(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            hook_calls[name] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    for name, value in list(vars(PynamodbPlugin).items()):
+        if callable(value) and "_hook" in name:
+            setattr(PynamodbPlugin, name, _counted(name, value))
+
+
+def _touch(path: str) -> None:
+    with open(path, "a") as f:
+        f.write("\n# touched\n")
+
+
+def run_mypy(files: list[str], config_file: str, cache_dir: str) -> float:
+    start = time.perf_counter()
+    stdout, stderr, exit_status = mypy.api.run([*files, "--config-file", config_file, "--cache-dir", cache_dir])
+    elapsed = time.perf_counter() - start
+    if exit_status != 0:
+        raise RuntimeError(f"mypy failed:\n{stdout}{stderr}")
+    return elapsed
+
+
+def run_dmypy(files: list[str], config_file: str, touch: str) -> float:
+    """
+    Runs an in-process mypy daemon: an initial check, then a check after a module changed.
+    Returns the time the latter took.
+    """
+    options = Options()
+    parse_config_file(options, lambda: None, config_file)
+    server = Server(options, status_file=os.devnull)
+    sources = create_source_list(files, options)
+    response = server.check(sources, export_types=False, is_tty=False, terminal_width=-1)
+    if response["status"] != 0:
+        raise RuntimeError(f"mypy failed:\n{response['out']}{response['err']}")
+
+    _touch(touch)
+    start = time.perf_counter()
+    response = server.check(sources, export_types=False, is_tty=False, terminal_width=-1)
+    elapsed = time.perf_counter() - start
+    if response["status"] != 0:
+        raise RuntimeError(f"mypy failed:\n{response['out']}{response['err']}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", choices=["cold", "warm", "dmypy"], required=True)
+    parser.add_argument("--config-file", required=True)
+    parser.add_argument("--cache-dir", required=True)
+    parser.add_argument("--touch", required=True, help="module to change before a warm or daemon run")
+    parser.add_argument("files", nargs="+")
+    args = parser.parse_args()
+
+    _count_hook_calls()
+    if args.mode == "dmypy":
+        wall_time = run_dmypy(args.files, args.config_file, args.touch)
+    else:
+        if args.mode == "warm":
+            _touch(args.touch)
+        wall_time = run_mypy(args.files, args.config_file, args.cache_dir)
+
+    print(json.dumps({"wall_time": wall_time, "hook_calls": dict(sorted(hook_calls.items()))}))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,4 +4,10 @@ from .plugin import PynamodbPlugin
 
 
 def plugin(version: str) -> Type[PynamodbPlugin]:
+    from ._profiling import is_profiling_enabled
+
+    if is_profiling_enabled():
+        from ._profiling import ProfilingPynamodbPlugin
+
+        return ProfilingPynamodbPlugin
     return PynamodbPlugin
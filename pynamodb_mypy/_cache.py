@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import Hashable
+from typing import Tuple
+from typing import TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class Memo(Generic[_K, _V]):
+    """
+    Memoizes values computed by the plugin, keeping track of the memo's hit rate.
+
+    Each value is stored along with a token standing for what it was computed from (e.g. the serialized type
+    a type was rehydrated from); a lookup only hits when made with an equal token.
+
+    A memo holds up to `maxsize` entries (if given), evicting the least recently used ones beyond that,
+    so that it doesn't grow without bound in a long-running process (e.g. a dmypy daemon) as the code changes.
+    """
+
+    def __init__(self, name: str, maxsize: int | None = None) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[_K, Tuple[Any, _V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: _K, token: Any = None) -> _V:
+        """
+        Returns the value memoized for the key, raising `KeyError` if there's none (for this token).
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != token:
+            self.misses += 1
+            raise KeyError(key)
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def store(self, key: _K, value: _V, token: Any = None) -> _V:
+        self._entries[key] = (token, value)
+        self._entries.move_to_end(key)
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def discard(self, key: _K) -> None:
+        self._entries.pop(key, None)
+
+    def discard_if(self, predicate: Callable[[_K], bool]) -> None:
+        """
+        Discards the entries whose keys satisfy a predicate, e.g. the ones of a module's classes.
+        """
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
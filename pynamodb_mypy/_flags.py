@@ -0,0 +1,18 @@
+"""
+Flags of models' attributes.
+
+It's kept out of the modules compiled with mypyc (see setup.py), which miscompiles references to `IntFlag` members.
+"""
+import enum
+
+
+class AttributeFlags(enum.IntFlag):
+    """
+    Flags of a model's attribute, persisted as a bit-field.
+    """
+
+    HASH_KEY = 1
+    RANGE_KEY = 2
+    NULLABLE = 4
+    # The attribute's type is yet to be resolved (i.e. it's the attribute's own type, see `plugin.LAZY_ENV_VAR`).
+    LAZY = 8
@@ -0,0 +1,99 @@
+"""
+Finding the calls that are made within loops, e.g. for telling N+1 query patterns.
+"""
+from __future__ import annotations
+
+import contextlib
+from typing import Iterator
+from typing import Union
+
+from mypy.nodes import CallExpr
+from mypy.nodes import DictionaryComprehension
+from mypy.nodes import Expression
+from mypy.nodes import ForStmt
+from mypy.nodes import FuncItem
+from mypy.nodes import GeneratorExpr
+from mypy.nodes import MypyFile
+from mypy.nodes import WhileStmt
+from mypy.traverser import TraverserVisitor
+
+
+class _LoopCallsFinder(TraverserVisitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: set[int] = set()
+        self._loop_depth = 0
+
+    @contextlib.contextmanager
+    def _loop(self) -> Iterator[None]:
+        self._loop_depth += 1
+        try:
+            yield
+        finally:
+            self._loop_depth -= 1
+
+    def visit_call_expr(self, o: CallExpr) -> None:
+        if self._loop_depth:
+            self.calls.add(id(o))
+        super().visit_call_expr(o)
+
+    def visit_func(self, o: FuncItem) -> None:
+        # a function (or lambda) defined within a loop only runs when it's called
+        loop_depth, self._loop_depth = self._loop_depth, 0
+        super().visit_func(o)
+        self._loop_depth = loop_depth
+
+    def visit_for_stmt(self, o: ForStmt) -> None:
+        # the iterable is evaluated once, and the 'else' clause runs once
+        o.index.accept(self)
+        o.expr.accept(self)
+        with self._loop():
+            o.body.accept(self)
+        if o.else_body:
+            o.else_body.accept(self)
+
+    def visit_while_stmt(self, o: WhileStmt) -> None:
+        # the condition is evaluated on each iteration, while the 'else' clause runs once
+        with self._loop():
+            o.expr.accept(self)
+            o.body.accept(self)
+        if o.else_body:
+            o.else_body.accept(self)
+
+    def visit_generator_expr(self, o: GeneratorExpr) -> None:
+        self._visit_comprehension(o, o.left_expr)
+
+    def visit_dictionary_comprehension(self, o: DictionaryComprehension) -> None:
+        self._visit_comprehension(o, o.key, o.value)
+
+    def _visit_comprehension(
+        self,
+        o: Union[GeneratorExpr, DictionaryComprehension],
+        *exprs: Expression,
+    ) -> None:
+        # the outermost iterable is evaluated once, before iterating
+        o.sequences[0].accept(self)
+        with self._loop():
+            for sequence in o.sequences[1:]:
+                sequence.accept(self)
+            for index in o.indices:
+                index.accept(self)
+            for conditions in o.condlists:
+                for condition in conditions:
+                    condition.accept(self)
+            for expr in exprs:
+                expr.accept(self)
+
+
+def find_calls_in_loops(tree: MypyFile) -> set[int]:
+    """
+    Finds the calls that are lexically within a loop (a 'for' or 'while' loop, or a comprehension) in a module,
+    i.e. could be made on each of the loop's iterations.
+
+    Calls in functions defined within loops aren't considered to be within the loops.
+
+    :return: the identities of the call expressions
+    """
+    finder = _LoopCallsFinder()
+    tree.accept(finder)
+    return finder.calls
@@ -0,0 +1,303 @@
+"""
+Opt-in instrumentation of the plugin, for telling how much of mypy's time is spent in it.
+
+Set the `PYNAMODB_MYPY_PROFILE` environment variable (e.g. `PYNAMODB_MYPY_PROFILE=1 mypy ...`) to have
+the plugin count the calls and measure the wall time of its hooks, and report them (along with its memos'
+hit rates) at the end of the build. The report goes to stderr, or as JSON to the file named by
+`PYNAMODB_MYPY_PROFILE_OUTPUT`.
+
+It's an environment variable rather than a mypy config option since the plugin's class is chosen
+before the config is available, and only the instrumented class pays for the instrumentation.
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import time
+import weakref
+from collections import defaultdict
+from typing import Any
+from typing import Callable
+from typing import Iterator
+
+import mypy.checker
+import mypy.nodes
+import mypy.options
+import mypy.plugin
+import mypy.types
+from mypy.plugin import AttributeContext
+from mypy.plugin import ClassDefContext
+from mypy.plugin import FunctionContext
+from mypy.plugin import FunctionSigContext
+from mypy.plugin import MethodContext
+from mypy.plugin import MethodSigContext
+
+from pynamodb_mypy._cache import Memo
+from pynamodb_mypy.plugin import PynamodbMetadataDict
+from pynamodb_mypy.plugin import PynamodbPlugin
+from pynamodb_mypy.plugin import SerializedType
+
+PROFILE_ENV_VAR = "PYNAMODB_MYPY_PROFILE"
+PROFILE_OUTPUT_ENV_VAR = "PYNAMODB_MYPY_PROFILE_OUTPUT"
+
+
+def is_profiling_enabled() -> bool:
+    return os.environ.get(PROFILE_ENV_VAR, "").lower() not in ("", "0", "false", "no")
+
+
+class _HookStats:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.time = 0.0
+
+    def to_json(self) -> dict[str, Any]:
+        return {"calls": self.calls, "time": self.time}
+
+
+class Profiler:
+    """
+    Accumulates the calls and wall time of each measured hook, overall and broken down by model.
+    """
+
+    def __init__(self) -> None:
+        self.hooks: defaultdict[str, _HookStats] = defaultdict(_HookStats)
+        self.hooks_by_model: defaultdict[str, defaultdict[str, _HookStats]] = defaultdict(
+            lambda: defaultdict(_HookStats)
+        )
+
+    @contextlib.contextmanager
+    def measure(self, hook_name: str, model_fullname: str | None = None) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            for stats in (
+                self.hooks[hook_name],
+                *([self.hooks_by_model[model_fullname][hook_name]] if model_fullname else []),
+            ):
+                stats.calls += 1
+                stats.time += elapsed
+
+    def summary(self, memos: list[Memo[Any, Any]]) -> dict[str, Any]:
+        return {
+            "hooks": {name: stats.to_json() for name, stats in sorted(self.hooks.items())},
+            "models": {
+                model: {name: stats.to_json() for name, stats in sorted(hooks.items())}
+                for model, hooks in sorted(self.hooks_by_model.items())
+            },
+            "memos": {
+                memo.name: {
+                    "hits": memo.hits,
+                    "misses": memo.misses,
+                    "hit_rate": memo.hits / (memo.hits + memo.misses) if memo.hits + memo.misses else None,
+                    "entries": len(memo),
+                }
+                for memo in memos
+            },
+        }
+
+
+def _format_summary(summary: dict[str, Any], *, max_models: int = 20) -> str:
+    lines = ["pynamodb-mypy profile:", f"  {'hook':<56}{'calls':>10}{'time (s)':>12}"]
+    for name, stats in summary["hooks"].items():
+        lines.append(f"  {name:<56}{stats['calls']:>10}{stats['time']:>12.3f}")
+
+    lines += ["", f"  {'memo':<56}{'hits':>10}{'misses':>12}{'hit rate':>10}{'entries':>10}"]
+    for name, stats in summary["memos"].items():
+        hit_rate = f"{stats['hit_rate']:.1%}" if stats["hit_rate"] is not None else "-"
+        lines.append(f"  {name:<56}{stats['hits']:>10}{stats['misses']:>12}{hit_rate:>10}{stats['entries']:>10}")
+
+    models = sorted(
+        summary["models"].items(),
+        key=lambda item: sum(stats["time"] for stats in item[1].values()),
+        reverse=True,
+    )
+    lines += ["", f"  {'model (slowest first)':<56}{'calls':>10}{'time (s)':>12}"]
+    for model, hooks in models[:max_models]:
+        calls, total_time = sum(stats["calls"] for stats in hooks.values()), sum(
+            stats["time"] for stats in hooks.values()
+        )
+        lines.append(f"  {model:<56}{calls:>10}{total_time:>12.3f}")
+    if len(models) > max_models:
+        lines.append(f"  ... and {len(models) - max_models} more")
+    return "\n".join(lines)
+
+
+def _report(profiler: Profiler, memos: list[Memo[Any, Any]], output_path: str | None) -> None:
+    summary = profiler.summary(memos)
+    if output_path:
+        with open(output_path, "w") as f:
+            json.dump(summary, f, indent=2)
+    else:
+        print(_format_summary(summary), file=sys.stderr)
+
+
+def _model_of_signature(ctx: FunctionSigContext) -> str | None:
+    ret_type = ctx.default_signature.ret_type
+    return ret_type.type.fullname if isinstance(ret_type, mypy.types.Instance) else None
+
+
+def _model_of_attribute_init(ctx: FunctionContext) -> str | None:
+    assert isinstance(ctx.api, mypy.checker.TypeChecker)
+    scope_cls = ctx.api.scope.active_class()
+    return scope_cls.fullname if scope_cls else None
+
+
+class ProfilingPynamodbPlugin(PynamodbPlugin):
+    """
+    The plugin, instrumented: each measured hook is timed and counted, and a summary is reported
+    once the build is over (i.e. when the plugin's gone, or at the latest when the process exits).
+    """
+
+    def __init__(self, options: mypy.options.Options) -> None:
+        super().__init__(options)
+        # mypy normally exits without running exit handlers; we need them to report at the end of the build
+        options.fast_exit = False
+        self._profiler = Profiler()
+        weakref.finalize(self, _report, self._profiler, self._memos, os.environ.get(PROFILE_OUTPUT_ENV_VAR))
+
+    # dispatchers
+
+    def get_function_signature_hook(
+        self,
+        fullname: str,
+    ) -> Callable[[FunctionSigContext], mypy.types.FunctionLike] | None:
+        with self._profiler.measure("get_function_signature_hook"):
+            return super().get_function_signature_hook(fullname)
+
+    def get_attribute_hook(self, fullname: str) -> Callable[[AttributeContext], mypy.types.Type] | None:
+        with self._profiler.measure("get_attribute_hook"):
+            return super().get_attribute_hook(fullname)
+
+    def get_function_hook(self, fullname: str) -> Callable[[FunctionContext], mypy.types.Type] | None:
+        with self._profiler.measure("get_function_hook"):
+            return super().get_function_hook(fullname)
+
+    def get_method_signature_hook(
+        self,
+        fullname: str,
+    ) -> Callable[[MethodSigContext], mypy.types.FunctionLike] | None:
+        with self._profiler.measure("get_method_signature_hook"):
+            return super().get_method_signature_hook(fullname)
+
+    def get_method_hook(self, fullname: str) -> Callable[[MethodContext], mypy.types.Type] | None:
+        with self._profiler.measure("get_method_hook"):
+            return super().get_method_hook(fullname)
+
+    def get_base_class_hook(self, fullname: str) -> Callable[[ClassDefContext], None] | None:
+        with self._profiler.measure("get_base_class_hook"):
+            return super().get_base_class_hook(fullname)
+
+    # hooks
+
+    def _get_base_class_hook__pynamodb(self, ctx: ClassDefContext) -> None:
+        with self._profiler.measure("_get_base_class_hook__pynamodb", ctx.cls.fullname):
+            super()._get_base_class_hook__pynamodb(ctx)
+
+    def _get_function_signature_hook__pynamodb_model__init__(self, ctx: FunctionSigContext) -> mypy.types.FunctionLike:
+        with self._profiler.measure("_get_function_signature_hook__pynamodb_model__init__", _model_of_signature(ctx)):
+            return super()._get_function_signature_hook__pynamodb_model__init__(ctx)
+
+    def _get_function_hook__pynamodb_attribute__init__(self, ctx: FunctionContext) -> mypy.types.Type:
+        with self._profiler.measure("_get_function_hook__pynamodb_attribute__init__", _model_of_attribute_init(ctx)):
+            return super()._get_function_hook__pynamodb_attribute__init__(ctx)
+
+    def _get_attribute_hook__pynamodb_model(
+        self,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        attr_name: str,
+        ctx: AttributeContext,
+    ) -> mypy.types.Type:
+        with self._profiler.measure("_get_attribute_hook__pynamodb_model", model_typeinfo.fullname):
+            return super()._get_attribute_hook__pynamodb_model(model_typeinfo, attr_name, ctx)
+
+    def _get_method_hook__pynamodb_model__single_item_operation(
+        self,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        method_name: str,
+        ctx: MethodContext,
+    ) -> mypy.types.Type:
+        with self._profiler.measure("_get_method_hook__pynamodb_model__single_item_operation", model_typeinfo.fullname):
+            return super()._get_method_hook__pynamodb_model__single_item_operation(model_typeinfo, method_name, ctx)
+
+    def _get_method_signature_hook__pynamodb_query(
+        self,
+        typeinfo: mypy.nodes.TypeInfo,
+        ctx: MethodSigContext,
+    ) -> mypy.types.FunctionLike:
+        with self._profiler.measure("_get_method_signature_hook__pynamodb_query", typeinfo.fullname):
+            return super()._get_method_signature_hook__pynamodb_query(typeinfo, ctx)
+
+    def _get_method_signature_hook__pynamodb_model__keyed_read(
+        self,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        method_name: str,
+        ctx: MethodSigContext,
+    ) -> mypy.types.FunctionLike:
+        with self._profiler.measure("_get_method_signature_hook__pynamodb_model__keyed_read", model_typeinfo.fullname):
+            return super()._get_method_signature_hook__pynamodb_model__keyed_read(model_typeinfo, method_name, ctx)
+
+    def _get_method_hook__pynamodb_query(self, typeinfo: mypy.nodes.TypeInfo, ctx: MethodContext) -> mypy.types.Type:
+        with self._profiler.measure("_get_method_hook__pynamodb_query", typeinfo.fullname):
+            return super()._get_method_hook__pynamodb_query(typeinfo, ctx)
+
+    def _get_method_hook__pynamodb_scan(self, typeinfo: mypy.nodes.TypeInfo, ctx: MethodContext) -> mypy.types.Type:
+        with self._profiler.measure("_get_method_hook__pynamodb_scan", typeinfo.fullname):
+            return super()._get_method_hook__pynamodb_scan(typeinfo, ctx)
+
+    def _get_method_hook__pynamodb_model__batch_get(
+        self,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        ctx: MethodContext,
+    ) -> mypy.types.Type:
+        with self._profiler.measure("_get_method_hook__pynamodb_model__batch_get", model_typeinfo.fullname):
+            return super()._get_method_hook__pynamodb_model__batch_get(model_typeinfo, ctx)
+
+    def _get_method_signature_hook__pynamodb_attribute__update(
+        self,
+        method_name: str,
+        ctx: MethodSigContext,
+    ) -> mypy.types.FunctionLike:
+        with self._profiler.measure("_get_method_signature_hook__pynamodb_attribute__update"):
+            return super()._get_method_signature_hook__pynamodb_attribute__update(method_name, ctx)
+
+    def _get_method_hook__pynamodb_attribute__update(self, method_name: str, ctx: MethodContext) -> mypy.types.Type:
+        with self._profiler.measure("_get_method_hook__pynamodb_attribute__update"):
+            return super()._get_method_hook__pynamodb_attribute__update(method_name, ctx)
+
+    def _get_function_hook__materializing(self, function_name: str, ctx: FunctionContext) -> mypy.types.Type:
+        with self._profiler.measure("_get_function_hook__materializing"):
+            return super()._get_function_hook__materializing(function_name, ctx)
+
+    # helpers
+
+    def _get_attribute_type(
+        self,
+        api: mypy.plugin.CheckerPluginInterface,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        attr_name: str,
+        metadata: PynamodbMetadataDict,
+        context: mypy.nodes.Context,
+    ) -> mypy.types.Type:
+        with self._profiler.measure("_get_attribute_type", model_typeinfo.fullname):
+            return super()._get_attribute_type(api, model_typeinfo, attr_name, metadata, context)
+
+    def _rehydrate_type(self, api: mypy.plugin.CheckerPluginInterface, data: SerializedType) -> mypy.types.Type:
+        with self._profiler.measure("_rehydrate_type"):
+            return super()._rehydrate_type(api, data)
+
+    def _analyze_descriptor_access(
+        self,
+        ctx: mypy.nodes.Context,
+        chk: mypy.checker.TypeChecker,
+        descriptor: mypy.types.Type,
+    ) -> mypy.types.Type | None:
+        with self._profiler.measure("get_descriptor_access_type"):
+            return super()._analyze_descriptor_access(ctx, chk, descriptor)
+
+    def _inspect_pynamodb_attribute_init(self, ctx: FunctionContext) -> None:
+        with self._profiler.measure("_inspect_pynamodb_attribute_init", _model_of_attribute_init(ctx)):
+            super()._inspect_pynamodb_attribute_init(ctx)
@@ -0,0 +1,162 @@
+"""
+Static estimates of the sizes of models' items, and of the capacity units reading and writing them consumes,
+made from the models' attribute types (see `python -m pynamodb_mypy.dump --capacity`).
+
+The estimates are rough: the size of a value is assumed after its type alone (e.g. strings are assumed to be
+short, as keys and names mostly are, so the estimates of items with strings are lower bounds), and the values
+of some types (e.g. binary, lists, maps and JSON) can be of any size, up to DynamoDB's item size limit.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+
+from pynamodb_mypy.plugin import SerializedType
+
+# DynamoDB's limit on an item's size (its attributes' names and values).
+ITEM_SIZE_LIMIT = 400 * 1024
+
+# The size units of reading (strongly consistent) and writing an item: one capacity unit per unit (or part).
+READ_UNIT_SIZE = 4 * 1024
+WRITE_UNIT_SIZE = 1024
+
+# The typical and maximal sizes of a value, in bytes, and whether the maximal size is only assumed (as values
+# can be longer, e.g. strings, up to DynamoDB's item size limit); the maximal size is None when the value can be
+# of any size.
+ValueSize = Tuple[int, Optional[int], bool]
+
+# The sizes of values, by their types.
+VALUE_SIZES: dict[str, ValueSize] = {
+    "builtins.str": (32, 256, True),
+    "builtins.float": (4, 21, False),  # numbers have up to 38 significant digits, stored two to a byte
+    "builtins.int": (4, 21, False),
+    "builtins.bool": (1, 1, False),
+    "datetime.datetime": (31, 31, False),  # e.g. '2020-01-01T00:00:00.000000+0000'
+    "None": (1, 1, False),
+    "builtins.bytes": (64, None, False),
+    "builtins.list": (64, None, False),
+    "builtins.dict": (64, None, False),
+    "builtins.set": (64, None, False),
+    "Any": (64, None, False),  # e.g. JSON
+}
+
+# The sizes of values of types that aren't listed above (e.g. maps, or values of custom attributes).
+DEFAULT_VALUE_SIZE: ValueSize = (64, None, False)
+
+# The sizes of the values of attributes that store them otherwise than their types tell, by attribute class.
+ATTRIBUTE_VALUE_SIZES: dict[str, ValueSize] = {
+    # a datetime, stored as a number of seconds since the epoch (10 digits)
+    "pynamodb.attributes.TTLAttribute": (6, 6, False),
+}
+
+# The types of the values of attributes, by attribute class (for attributes whose types weren't resolved,
+# see `LAZY_ENV_VAR`).
+ATTRIBUTE_VALUE_TYPES = {
+    "pynamodb.attributes.UnicodeAttribute": "builtins.str",
+    "pynamodb.attributes.NumberAttribute": "builtins.float",
+    "pynamodb.attributes.VersionAttribute": "builtins.int",
+    "pynamodb.attributes.BooleanAttribute": "builtins.bool",
+    "pynamodb.attributes.UTCDateTimeAttribute": "datetime.datetime",
+    "pynamodb.attributes.TTLAttribute": "datetime.datetime",
+    "pynamodb.attributes.NullAttribute": "None",
+    "pynamodb.attributes.BinaryAttribute": "builtins.bytes",
+    "pynamodb.attributes.ListAttribute": "builtins.list",
+    "pynamodb.attributes.UnicodeSetAttribute": "builtins.set",
+    "pynamodb.attributes.NumberSetAttribute": "builtins.set",
+    "pynamodb.attributes.BinarySetAttribute": "builtins.set",
+    "pynamodb.attributes.JSONAttribute": "Any",
+}
+
+
+def estimate_value_size(
+    data: SerializedType,
+    *,
+    lazy: bool = False,
+    attribute_class: str | None = None,
+) -> ValueSize:
+    """
+    Estimates the size of an attribute's values after the attribute's (serialized) type.
+
+    :param lazy: whether the type is of the attribute itself, rather than its values
+    :param attribute_class: the attribute's class, if known (e.g. 'pynamodb.attributes.TTLAttribute')
+    """
+    if attribute_class in ATTRIBUTE_VALUE_SIZES:
+        return ATTRIBUTE_VALUE_SIZES[attribute_class]
+    if isinstance(data, str):  # an Instance without arguments
+        type_name = data
+    elif data[".class"] == "Instance":
+        type_name = data["type_ref"]
+    elif data[".class"] == "UnionType":
+        # e.g. Optional[...]; absent values take no space
+        sizes = [estimate_value_size(item) for item in data["items"] if item != {".class": "NoneType"}]
+        return max(size[0] for size in sizes), _max_size(size[1] for size in sizes), any(size[2] for size in sizes)
+    elif data[".class"] == "NoneType":
+        type_name = "None"
+    elif data[".class"] == "AnyType":
+        type_name = "Any"
+    else:
+        return DEFAULT_VALUE_SIZE
+    if lazy:
+        type_name = ATTRIBUTE_VALUE_TYPES.get(type_name, type_name)
+    return VALUE_SIZES.get(type_name, DEFAULT_VALUE_SIZE)
+
+
+def _max_size(sizes: Iterable[int | None]) -> int | None:
+    max_size = 0
+    for size in sizes:
+        if size is None:
+            return None
+        max_size = max(max_size, size)
+    return max_size
+
+
+def _capacity_units(size: int, unit_size: int) -> int:
+    return max(1, math.ceil(size / unit_size))
+
+
+def estimate_capacity(attributes: Iterable[tuple[str, ValueSize, bool]]) -> dict[str, Any]:
+    """
+    Estimates the size of a model's items, and the capacity units reading or writing an item consumes.
+
+    The typical item has its nullable attributes absent, while the largest item has all of its attributes present,
+    at their maximal sizes; the capacity units reading or writing it consumes are capped by the item size limit.
+    When the maximal sizes of any of the attributes are only assumed (e.g. of strings), the largest item's size
+    and capacity units are lower bounds.
+
+    :param attributes: the model's attributes: for each, its name in DynamoDB, its value size and whether it's nullable
+    """
+    typical_size, max_size = 0, 0
+    unbounded_attributes, assumed_size_attributes = [], []
+    for name, (typical_value_size, max_value_size, assumed), nullable in attributes:
+        name_size = len(name.encode())
+        if not nullable:
+            typical_size += name_size + typical_value_size
+        if max_value_size is None:
+            unbounded_attributes.append(name)
+        else:
+            max_size += name_size + max_value_size
+            if assumed:
+                assumed_size_attributes.append(name)
+
+    bounded_max_size = min(max_size, ITEM_SIZE_LIMIT) if not unbounded_attributes else ITEM_SIZE_LIMIT
+    return {
+        "typical_size": typical_size,
+        "max_size": max_size if not unbounded_attributes else None,
+        # attributes whose values can push an item past the item size limit
+        "unbounded_attributes": sorted(unbounded_attributes),
+        # attributes whose values' maximal sizes are only assumed, making the maximal estimates lower bounds
+        "assumed_size_attributes": sorted(assumed_size_attributes),
+        "lower_bound": bool(assumed_size_attributes) and not unbounded_attributes,
+        "exceeds_item_size_limit": max_size > ITEM_SIZE_LIMIT,
+        "read_units": {
+            "typical": _capacity_units(typical_size, READ_UNIT_SIZE),
+            "max": _capacity_units(bounded_max_size, READ_UNIT_SIZE),
+        },
+        "write_units": {
+            "typical": _capacity_units(typical_size, WRITE_UNIT_SIZE),
+            "max": _capacity_units(bounded_max_size, WRITE_UNIT_SIZE),
+        },
+    }
@@ -0,0 +1,248 @@
+"""
+Dumps a catalogue of the PynamoDB models in a mypy cache, without type-checking anything:
+
+    python -m pynamodb_mypy.dump [.mypy_cache] > models.jsonl
+
+The models are read from the metadata the plugin keeps in the cache, so mypy must have been run (with the plugin)
+for the cache to be current. Each line of the catalogue is a model, e.g.
+
+    {"model": "app.models.User", "hash_key": "user_id", "range_key": null,
+     "attributes": [{"name": "user_id", "type": "builtins.str", "nullable": false}, ...]}
+
+including the attributes the model inherits. The type of an attribute recorded in lazy mode (see `LAZY_ENV_VAR`)
+and never resolved is not known; it's given as null, with the attribute's own type under "attribute".
+Models whose metadata (or whose bases') was written by another version of the plugin are dumped without
+the attributes it holds, marked "stale", and named in a warning on stderr.
+
+With --capacity, each model also has an estimate of its items' sizes and of the capacity units reading and writing
+an item consumes (see `estimate_capacity`), e.g. for telling in CI the model changes that would make them costlier.
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import glob
+import json
+import os
+import sys
+from typing import Any
+from typing import IO
+from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
+
+from pynamodb_mypy.capacity import estimate_capacity
+from pynamodb_mypy.capacity import estimate_value_size
+from pynamodb_mypy.plugin import AttributeFlags
+from pynamodb_mypy.plugin import METADATA_KEY
+from pynamodb_mypy.plugin import METADATA_VERSION
+from pynamodb_mypy.plugin import PYNAMODB_MODEL_FULL_NAME
+from pynamodb_mypy.plugin import SerializedType
+
+
+# The fields of the attributes in class records which aren't part of the catalogue's attributes.
+_INTERNAL_ATTRIBUTE_FIELDS = ("hash_key", "range_key", "stored_name", "size")
+
+
+class _ClassRecord(NamedTuple):
+    fullname: str
+    mro: list[str]
+    # the class's own attributes, as they appear in the catalogue
+    attributes: dict[str, dict[str, Any]]
+    # whether the class's metadata is of another layout version (see `METADATA_VERSION`), and so left unread
+    stale: bool
+
+
+def format_type(data: SerializedType) -> str:
+    """
+    Formats a serialized type for the catalogue, e.g. 'Optional[builtins.str]'.
+    """
+    if isinstance(data, str):  # an Instance without arguments
+        return data
+    kind = data[".class"]
+    if kind == "Instance":
+        args = data["args"]
+        return f"{data['type_ref']}[{', '.join(map(format_type, args))}]" if args else data["type_ref"]
+    if kind == "UnionType":
+        items = [format_type(item) for item in data["items"]]
+        if "None" in items:
+            items.remove("None")
+            return f"Optional[{items[0]}]" if len(items) == 1 else f"Optional[Union[{', '.join(items)}]]"
+        return f"Union[{', '.join(items)}]"
+    if kind == "TupleType":
+        return f"Tuple[{', '.join(map(format_type, data['items']))}]"
+    if kind == "NoneType":
+        return "None"
+    if kind == "AnyType":
+        return "Any"
+    return kind
+
+
+def _format_attribute(data: SerializedType, flags: int) -> dict[str, Any]:
+    if flags & AttributeFlags.LAZY:
+        return {"type": None, "attribute": format_type(data), "nullable": bool(flags & AttributeFlags.NULLABLE)}
+    return {"type": format_type(data), "nullable": bool(flags & AttributeFlags.NULLABLE)}
+
+
+def _get_attribute_class(symbol: dict[str, Any]) -> str | None:
+    """
+    Returns the class of a model's attribute, from the attribute's symbol (e.g. 'pynamodb.attributes.TTLAttribute').
+    """
+    attr_type = symbol.get("node", {}).get("type")
+    if isinstance(attr_type, dict) and attr_type.get(".class") == "Instance":
+        return attr_type["type_ref"]
+    return attr_type if isinstance(attr_type, str) else None
+
+
+def _iter_type_infos(names: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    for name, symbol in names.items():
+        if name == ".class" or symbol.get("plugin_generated"):
+            continue  # e.g. a model narrowed to an index's projection
+        node = symbol.get("node")  # symbols imported from elsewhere are cross-references, without a node
+        if node and node[".class"] == "TypeInfo":
+            yield node
+            yield from _iter_type_infos(node["names"])
+
+
+def _read_cache_file(path: str) -> list[_ClassRecord]:
+    """
+    Reads the models, and any other classes with PynamoDB attributes, from a mypy cache data file.
+    """
+    with open(path) as f:
+        text = f.read()
+    if METADATA_KEY not in text and PYNAMODB_MODEL_FULL_NAME not in text:
+        return []  # most modules have nothing to do with PynamoDB; no need to parse them
+
+    records = []
+    for info in _iter_type_infos(json.loads(text)["names"]):
+        metadata = info["metadata"].get(METADATA_KEY)
+        stale = bool(metadata) and metadata.get("version") != METADATA_VERSION
+        if metadata and not stale:
+            types, attr_names = metadata["types"], metadata["attr_names"]
+            attributes = {
+                attr_name: {
+                    **_format_attribute(types[type_idx], flags),
+                    "hash_key": bool(flags & AttributeFlags.HASH_KEY),
+                    "range_key": bool(flags & AttributeFlags.RANGE_KEY),
+                    "stored_name": attr_names.get(attr_name, attr_name),
+                    "size": estimate_value_size(
+                        types[type_idx],
+                        lazy=bool(flags & AttributeFlags.LAZY),
+                        attribute_class=_get_attribute_class(info["names"].get(attr_name, {})),
+                    ),
+                }
+                for attr_name, (type_idx, flags) in metadata["attributes"].items()
+            }
+        elif stale or PYNAMODB_MODEL_FULL_NAME in info["mro"]:
+            attributes = {}
+        else:
+            continue
+        records.append(_ClassRecord(info["fullname"], info["mro"], attributes, stale))
+    return records
+
+
+def _read_cache_files(paths: list[str], *, jobs: int) -> Iterable[list[_ClassRecord]]:
+    if jobs == 1:
+        return map(_read_cache_file, paths)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(_read_cache_file, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+
+
+def iter_models(cache_dir: str, *, jobs: int = 1, capacity: bool = False) -> Iterator[dict[str, Any]]:
+    """
+    Yields the catalogue entries of the models in a mypy cache (for a given Python version), by model fullname.
+
+    :param cache_dir: the cache for a Python version, e.g. '.mypy_cache/3.8'
+    :param jobs: the number of processes to read the cache with
+    :param capacity: whether to estimate the models' item sizes and capacity units
+    """
+    paths = glob.glob(os.path.join(cache_dir, "**", "*.data.json"), recursive=True)
+    records = {record.fullname: record for records in _read_cache_files(paths, jobs=jobs) for record in records}
+
+    for fullname in sorted(records):
+        record = records[fullname]
+        if PYNAMODB_MODEL_FULL_NAME not in record.mro or fullname == PYNAMODB_MODEL_FULL_NAME:
+            continue
+        # the model's attributes, including those it inherits (bases are possibly in other modules)
+        attributes: dict[str, dict[str, Any]] = {}
+        stale = False
+        for base_fullname in reversed(record.mro):
+            base = records.get(base_fullname)
+            if base:
+                attributes.update(base.attributes)
+                stale |= base.stale
+        model: dict[str, Any] = {
+            "model": fullname,
+            "hash_key": next((name for name, attr in attributes.items() if attr["hash_key"]), None),
+            "range_key": next((name for name, attr in attributes.items() if attr["range_key"]), None),
+            "attributes": [
+                {"name": name, **{k: v for k, v in attr.items() if k not in _INTERNAL_ATTRIBUTE_FIELDS}}
+                for name, attr in sorted(attributes.items())
+            ],
+        }
+        if capacity:
+            model["capacity"] = estimate_capacity(
+                (attr["stored_name"], attr["size"], attr["nullable"]) for attr in attributes.values()
+            )
+        if stale:
+            # the metadata of the model (or of a base) was written by another version of the plugin
+            model["stale"] = True
+        yield model
+
+
+def _write_catalogue(models: Iterable[dict[str, Any]], out: IO[str]) -> list[str]:
+    """
+    Writes the catalogue, returning the models it has stale metadata for.
+    """
+    stale_models = []
+    for model in models:
+        out.write(json.dumps(model) + "\n")
+        if model.get("stale"):
+            stale_models.append(model["model"])
+    return stale_models
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m pynamodb_mypy.dump",
+        description="Dumps a catalogue of the PynamoDB models in a mypy cache, as JSON lines.",
+    )
+    parser.add_argument("cache_dir", nargs="?", default=".mypy_cache", help="mypy's cache directory")
+    parser.add_argument(
+        "--python-version",
+        default=f"{sys.version_info[0]}.{sys.version_info[1]}",
+        help="the Python version the cache is for (default: the running Python's)",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of processes")
+    parser.add_argument("-o", "--output", help="the file to write to (default: stdout)")
+    parser.add_argument(
+        "--capacity",
+        action="store_true",
+        help="estimate the models' item sizes, and the capacity units of reading and writing an item",
+    )
+    args = parser.parse_args(argv)
+
+    cache_dir = os.path.join(args.cache_dir, args.python_version)
+    if not os.path.isdir(cache_dir):
+        print(f"No mypy cache for Python {args.python_version} in {args.cache_dir}", file=sys.stderr)
+        return 1
+
+    models = iter_models(cache_dir, jobs=args.jobs, capacity=args.capacity)
+    if args.output:
+        with open(args.output, "w") as f:
+            stale_models = _write_catalogue(models, f)
+    else:
+        stale_models = _write_catalogue(models, sys.stdout)
+    if stale_models:
+        print(
+            f"Warning: the cache holds metadata of another version of pynamodb-mypy for {len(stale_models)} models,"
+            " so their attributes are left out; clear the cache and re-run mypy to dump them:",
+            *(f"  {model}" for model in stale_models),
+            sep="\n",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
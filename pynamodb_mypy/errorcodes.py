@@ -0,0 +1,35 @@
+"""
+Codes of the errors the plugin reports, e.g. for ignoring them with `# type: ignore[<code>]` comments.
+"""
+from mypy.errorcodes import ErrorCode
+
+N_PLUS_ONE = ErrorCode(
+    "pynamodb-n-plus-one",
+    "Check for single-item PynamoDB operations within loops, where a batch operation would do",
+    "PynamoDB",
+)
+
+KEY_CONDITION = ErrorCode(
+    "pynamodb-key-condition",
+    "Check for query filter conditions that only constrain key attributes, where a key condition would do",
+    "PynamoDB",
+)
+
+PROJECTION = ErrorCode(
+    "pynamodb-projection",
+    "Check for reading attributes that are not projected into the items read (e.g. from an index), or saving the items",
+    "PynamoDB",
+)
+
+UPDATE_ACTION = ErrorCode(
+    "pynamodb-update-action",
+    "Check for update actions that DynamoDB would reject, or that would remove non-nullable attributes",
+    "PynamoDB",
+)
+
+UNBOUNDED_READ = ErrorCode(
+    "pynamodb-unbounded-read",
+    "Check for reading all of a query's or scan's results into memory, and for scans without a limit",
+    "PynamoDB",
+    default_enabled=False,
+)
@@ -1,50 +1,483 @@
 from __future__ import annotations
 
 import functools
+import json
+import os
+import sys
+from typing import Any
 from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import Sequence
 from typing import TypedDict
+from typing import TypeVar
 from typing import Union
 
 import mypy.checker
 import mypy.checkmember
 import mypy.options
 import mypy.types
+from mypy.erasetype import erase_typevars
 from mypy.fixup import TypeFixer
+from mypy.mro import calculate_mro
 from mypy.nodes import ArgKind
 from mypy.nodes import NameExpr
 from mypy.nodes import TypeInfo
 from mypy.plugin import AttributeContext
+from mypy.plugin import ClassDefContext
+from mypy.plugin import CommonPluginApi  # noqa: F401 (see `_python_class`)
 from mypy.plugin import FunctionContext
 from mypy.plugin import FunctionSigContext
+from mypy.plugin import MethodContext
+from mypy.plugin import MethodSigContext
 from mypy.plugin import Plugin
+from mypy.plugin import ReportConfigContext
+from mypy.server.trigger import make_trigger
 from mypy.typeanal import make_optional_type
+from mypy.util import hash_digest
 
+from pynamodb_mypy._cache import Memo
+from pynamodb_mypy._flags import AttributeFlags
+from pynamodb_mypy._loops import find_calls_in_loops
 from pynamodb_mypy._private_api import get_descriptor_access_type
+from pynamodb_mypy.errorcodes import KEY_CONDITION
+from pynamodb_mypy.errorcodes import N_PLUS_ONE
+from pynamodb_mypy.errorcodes import PROJECTION
+from pynamodb_mypy.errorcodes import UNBOUNDED_READ
+from pynamodb_mypy.errorcodes import UPDATE_ACTION
 
 PYNAMODB_MODEL_FULL_NAME = "pynamodb.models.Model"
 PYNAMODB_ATTRIBUTE_FULL_NAME = "pynamodb.attributes.Attribute"
+PYNAMODB_INDEX_FULL_NAME = "pynamodb.indexes.Index"
+PYNAMODB_MAP_ATTRIBUTE_FULL_NAME = "pynamodb.attributes.MapAttribute"
+PYNAMODB_DYNAMIC_MAP_ATTRIBUTE_FULL_NAME = "pynamodb.attributes.DynamicMapAttribute"
+PYNAMODB_RESULT_ITERATOR_FULL_NAME = "pynamodb.pagination.ResultIterator"
+PYNAMODB_OPERAND_FULL_NAME = "pynamodb.expressions.operand._Operand"
+
+_C = TypeVar("_C", bound=type)
+
+# Functions (and classes) that read all of an iterable into memory, e.g. all of a query's results.
+MATERIALIZING_FUNCTIONS = {"builtins.list", "builtins.tuple", "builtins.set", "builtins.sorted"}
+
+# Models' single-item operations, along with the batch operations to use instead (e.g. within loops).
+SINGLE_ITEM_OPERATIONS = {
+    "get": "batch_get",
+    "refresh": "batch_get",
+    "save": "batch_write",
+    "delete": "batch_write",
+}
+
+# The methods of attributes building update actions (or their operands), e.g. `MyModel.my_attr.set(42)`,
+# along with the kinds of attributes supporting them (None for all).
+UPDATE_ACTION_METHODS = {
+    "set": None,
+    "remove": None,
+    "add": "number and set",
+    "delete": "set",
+    "append": "list",
+    "prepend": "list",
+}
+
+# The types of index projections, by the fullnames of the projection classes.
+PROJECTION_TYPES = {
+    "pynamodb.indexes.AllProjection": "ALL",
+    "pynamodb.indexes.KeysOnlyProjection": "KEYS_ONLY",
+    "pynamodb.indexes.IncludeProjection": "INCLUDE",
+}
 
 # A serialized type. Use `_rehydrate_type` to rehydrate.
 SerializedType = Union[mypy.types.JsonDict, str]
 
+# The types that reading the built-in attributes gives, by attribute class, sparing the analysis of their
+# descriptors (see `_get_descriptor_access_type`). Subclasses aren't listed, as they could override `__get__`.
+BUILTIN_DESCRIPTOR_TYPES: dict[str, SerializedType] = {
+    "pynamodb.attributes.BinaryAttribute": "builtins.bytes",
+    "pynamodb.attributes.BinarySetAttribute": {
+        ".class": "Instance",
+        "type_ref": "builtins.set",
+        "args": ["builtins.bytes"],
+    },
+    "pynamodb.attributes.BooleanAttribute": "builtins.bool",
+    "pynamodb.attributes.NullAttribute": {".class": "NoneType"},
+    "pynamodb.attributes.NumberAttribute": "builtins.float",
+    "pynamodb.attributes.NumberSetAttribute": {
+        ".class": "Instance",
+        "type_ref": "builtins.set",
+        "args": ["builtins.float"],
+    },
+    "pynamodb.attributes.TTLAttribute": "datetime.datetime",
+    "pynamodb.attributes.UnicodeAttribute": "builtins.str",
+    "pynamodb.attributes.UnicodeSetAttribute": {
+        ".class": "Instance",
+        "type_ref": "builtins.set",
+        "args": ["builtins.str"],
+    },
+    "pynamodb.attributes.UTCDateTimeAttribute": "datetime.datetime",
+}
+
+# The version of the layout of the plugin's metadata (and of the symbols it generates). Bump it on any change to
+# the layout: metadata of another version (e.g. from an incremental cache written by another version of the plugin)
+# is disregarded.
+METADATA_VERSION = 7
+
+# The key of the plugin's metadata in a model type's metadata.
+METADATA_KEY = "pynamodb"
+
+# The suffix of the symbols generated for each attribute of a model (or an index), e.g. 'MyModel@my_attr@pynamodb',
+# typed after the attribute's flags. They're never referenced by code; rather, they tell dmypy's fine-grained mode
+# when an attribute's flags change (e.g. it's made nullable), which leaves the attribute's own type alone, so that
+# just the members whose types depend on them get rechecked (see `SCHEMA_DEPENDENT_MEMBERS`). They're generated in
+# the module's namespace rather than the class', where they'd be inherited, and classes deriving from several bases
+# declaring an attribute with different flags would be flagged for the bases' symbols being incompatible.
+SCHEMA_SYMBOL_SUFFIX = "@pynamodb"
+
+# The members of a model (or an index) whose types depend on its attributes' flags, besides the attributes themselves.
+SCHEMA_DEPENDENT_MEMBERS = ("__init__", "query", "get", "count", "batch_get")
+
+# Models' methods reading items by their keys (besides query), whose key arguments are typed after the key attributes.
+KEYED_READ_METHODS = ("get", "count", "batch_get")
+
+# The most entries each of the plugin's memos holds (see `Memo`), so that a long-running dmypy daemon's memos stay
+# bounded as models are edited, renamed and deleted. It's well beyond the models (and attributes) of large codebases,
+# so that a single build never evicts what it'll need again.
+MEMO_MAXSIZE = 65536
+
+# Set to defer resolving the types of models' attributes until they're needed: the attributes of models
+# that are never initialized nor have their attributes read (e.g. in a large shared library of models)
+# are then never resolved.
+LAZY_ENV_VAR = "PYNAMODB_MYPY_LAZY"
+
+# Set to enable the (otherwise opt-in) UNBOUNDED_READ checks in all modules; modules can still opt out
+# with a `# mypy: disable-error-code="pynamodb-unbounded-read"` comment.
+UNBOUNDED_READ_ENV_VAR = "PYNAMODB_MYPY_UNBOUNDED_READ"
+
+
+class PynamodbInitSignatureDict(TypedDict):
+    """
+    A model's initializer signature, persisted for warm incremental runs to reuse.
+    """
+
+    # Fingerprint of what the signature was built from (see `_init_signature_fingerprint`).
+    fingerprint: str
+
+    # The signature in serialized form, sans the argument types.
+    signature: mypy.types.JsonDict
+
+    # The argument types, as indexes into the interned types.
+    arg_types: list[int]
+
+
+class PynamodbMetadataDict(TypedDict):
+    """
+    The information persisted in a model type's metadata.
+
+    It's written to the incremental cache for every model, so it's kept compact: the types, most of which
+    are shared by many attributes (e.g. 'builtins.str' or 'Optional[builtins.int]'), are interned in a table
+    and referred to by their indexes.
+    """
+
+    # The layout version (see `METADATA_VERSION`).
+    version: int
+
+    # The interned types in serialized form.
+    types: list[SerializedType]
+
+    # The model's attributes: for each, the index of its type and its flags (see `AttributeFlags`).
+    # (They're pairs, but lists rather than tuples, as they're read back from JSON.)
+    attributes: dict[str, list[int]]
+
+    # The names in DynamoDB of the model's attributes which are named otherwise than in Python (e.g. shorter).
+    attr_names: dict[str, str]
+
+    # The model's initializer signature, once built.
+    init_signature: PynamodbInitSignatureDict | None
+
+    # An index's projection: its type (e.g. 'KEYS_ONLY'), followed by the non-key attributes it includes.
+    # A model type narrowed to a projection (see `_get_projected_model_type`) has one too, listing all of
+    # the attributes fetched (the keys included).
+    projection: list[str] | None
+
+
+def _read_pynamodb_metadata(info: mypy.nodes.TypeInfo) -> PynamodbMetadataDict | None:
+    """
+    Returns the plugin's metadata of a type, or None if there's none (of the current version).
+    """
+    metadata = info.metadata.get(METADATA_KEY)
+    if metadata is None or metadata.get("version") != METADATA_VERSION:
+        return None
+    return cast(PynamodbMetadataDict, metadata)
 
-class PynamodbAttributeDict(TypedDict):
+
+def _write_pynamodb_metadata(info: mypy.nodes.TypeInfo) -> PynamodbMetadataDict:
+    """
+    Returns the plugin's metadata of a type for writing, replacing any metadata of another version.
+    """
+    metadata = _read_pynamodb_metadata(info)
+    if metadata is None:
+        metadata = PynamodbMetadataDict(
+            version=METADATA_VERSION,
+            types=[],
+            attributes={},
+            attr_names={},
+            init_signature=None,
+            projection=None,
+        )
+        info.metadata[METADATA_KEY] = cast(Dict[str, Any], metadata)
+    return metadata
+
+
+def _intern_type(metadata: PynamodbMetadataDict, data: SerializedType) -> int:
     """
-    The information persisted in the model type's metadata for each of the model's attributes.
+    Returns the index of a serialized type in the interned types, adding it if needed.
     """
+    types = metadata["types"]
+    try:
+        return types.index(data)
+    except ValueError:
+        types.append(data)
+        return len(types) - 1
 
-    # The type of the attribute in serialized form.
-    type: SerializedType
 
-    # Whether it's a hash key.
-    is_hash_key: bool
+def _get_schema_symbol_name(info: mypy.nodes.TypeInfo, attr_name: str) -> str:
+    """
+    Returns the name of the symbol generated in a class' module for one of its attributes (see `SCHEMA_SYMBOL_SUFFIX`).
+
+    The name has no dots, as dmypy would take a symbol whose name has any for a reference to another module's,
+    and not compare its types.
+    """
+    class_name = info.fullname[len(info.module_name) + 1 :].replace(".", "@")
+    return f"{class_name}@{attr_name}{SCHEMA_SYMBOL_SUFFIX}"
+
+
+def _compact_types(metadata: PynamodbMetadataDict) -> None:
+    """
+    Drops the interned types that are no longer referred to (e.g. the attributes' own types, recorded before
+    their types were resolved), and orders the rest by first reference, so that the metadata only depends on
+    the model's schema rather than on the order it was recorded in, and so does the incremental cache.
+    """
+    types = metadata["types"]
+    compacted: list[SerializedType] = []
+    indexes: dict[int, int] = {}
+
+    def _reintern(type_idx: int) -> int:
+        if type_idx not in indexes:
+            indexes[type_idx] = len(compacted)
+            compacted.append(types[type_idx])
+        return indexes[type_idx]
+
+    metadata["attributes"] = {
+        attr_name: [_reintern(type_idx), flags] for attr_name, (type_idx, flags) in metadata["attributes"].items()
+    }
+    init_signature = metadata["init_signature"]
+    if init_signature:
+        init_signature["arg_types"] = [_reintern(type_idx) for type_idx in init_signature["arg_types"]]
+    metadata["types"] = compacted
+
+
+def _init_signature_fingerprint(info: mypy.nodes.TypeInfo, default_signature: mypy.types.CallableType) -> str:
+    """
+    Fingerprints everything a model's initializer signature is built from: the attributes of the model
+    and each of its bases, and the initializer's own (default) signature.
+    """
+    attributes = []
+    for base in info.mro:
+        metadata = _read_pynamodb_metadata(base)
+        if metadata and metadata["attributes"]:
+            types = metadata["types"]
+            attributes.append(
+                (
+                    base.fullname,
+                    {
+                        attr_name: (types[type_idx], flags)
+                        for attr_name, (type_idx, flags) in metadata["attributes"].items()
+                    },
+                )
+            )
+    data = [default_signature.serialize(), attributes]
+    return hash_digest(json.dumps(data, sort_keys=True).encode())
+
+
+def _find_key_attribute(
+    info: mypy.nodes.TypeInfo,
+    flag: AttributeFlags,
+) -> tuple[mypy.nodes.TypeInfo, str, PynamodbMetadataDict] | None:
+    """
+    Finds a model's (or an index's) hash or range key attribute, among its own and its bases' attributes.
+
+    :return: the class declaring the attribute, the attribute's name and the class's metadata
+    """
+    for base in info.mro:
+        metadata = _read_pynamodb_metadata(base)
+        if metadata:
+            for attr_name, (_, flags) in metadata["attributes"].items():
+                if flags & flag:
+                    return base, attr_name, metadata
+    return None
+
+
+def _is_typed_map_attribute(info: mypy.nodes.TypeInfo) -> bool:
+    """
+    Tells whether a type is a map attribute with declared attributes (e.g. `class Address(MapAttribute)`),
+    rather than a raw or a dynamic one, which hold any attributes.
+    """
+    return (
+        info.has_base(PYNAMODB_MAP_ATTRIBUTE_FULL_NAME)
+        and info.fullname != PYNAMODB_MAP_ATTRIBUTE_FULL_NAME
+        and not info.has_base(PYNAMODB_DYNAMIC_MAP_ATTRIBUTE_FULL_NAME)
+    )
+
+
+def _get_call_args(
+    arg_names: Sequence[str | None],
+    args: list[list[mypy.nodes.Expression]],
+    name: str,
+) -> list[mypy.nodes.Expression]:
+    """
+    Returns the actual arguments of a call passed for a named formal argument (if any).
+    """
+    return args[arg_names.index(name)] if name in arg_names else []
+
+
+def _is_key_in_module(module_prefix: str, key: str | tuple[str, str]) -> bool:
+    """
+    Tells whether a memo's key (a class fullname, or a tuple led by one) is of a class in a module.
+    """
+    return (key[0] if isinstance(key, tuple) else key).startswith(module_prefix)
+
+
+def _get_named_arg(ctx: FunctionContext, arg_name: str) -> mypy.nodes.Expression | None:
+    """
+    Returns the expression passed for a keyword argument of a call (if any).
+    """
+    for names, args in zip(ctx.arg_names, ctx.args):
+        for name, arg in zip(names, args):
+            if name == arg_name:
+                return arg
+    return None
+
+
+def _check_literal_bool(ctx: FunctionContext, arg_name: str, default: bool) -> bool:
+    arg_expr = _get_named_arg(ctx, arg_name)
+    if arg_expr is None:
+        return default
+    if not isinstance(arg_expr, NameExpr) or arg_expr.fullname not in ("builtins.False", "builtins.True"):
+        ctx.api.fail(f"'{arg_name}' argument is not constant False or True", ctx.context)
+        return default
+
+    return arg_expr.fullname == "builtins.True"
+
+
+def _get_declared_attribute(stmt: mypy.nodes.Statement) -> tuple[str, mypy.types.Instance, AttributeFlags] | None:
+    """
+    Tells whether a (semantically analyzed) class body statement declares a PynamoDB attribute,
+    e.g. `my_attr = NumberAttribute(null=True)`, returning the attribute's name, own type and flags.
+
+    The attribute's type arguments are only known when given explicitly (e.g. `ListAttribute[str]()`);
+    otherwise, they're Any until the type checker infers them.
+    """
+    if not (
+        isinstance(stmt, mypy.nodes.AssignmentStmt)
+        and len(stmt.lvalues) == 1
+        and isinstance(stmt.lvalues[0], NameExpr)
+        and isinstance(stmt.rvalue, mypy.nodes.CallExpr)
+    ):
+        return None
+    call = stmt.rvalue
+    callee = call.callee
+    type_args: list[mypy.types.Type] | None = None
+    if isinstance(callee, mypy.nodes.IndexExpr) and isinstance(callee.analyzed, mypy.nodes.TypeApplication):
+        type_args = callee.analyzed.types
+        callee = callee.base
+    if not (
+        isinstance(callee, mypy.nodes.RefExpr)
+        and isinstance(callee.node, TypeInfo)
+        and callee.node.has_base(PYNAMODB_ATTRIBUTE_FULL_NAME)
+    ):
+        return None
+    attr_info = callee.node
+    if type_args is None or len(type_args) != len(attr_info.defn.type_vars):
+        type_args = [mypy.types.AnyType(mypy.types.TypeOfAny.special_form)] * len(attr_info.defn.type_vars)
+
+    # arguments that aren't constant are reported once the class body is checked
+    flags = AttributeFlags.LAZY
+    for arg_name, flag in (
+        ("null", AttributeFlags.NULLABLE),
+        ("hash_key", AttributeFlags.HASH_KEY),
+        ("range_key", AttributeFlags.RANGE_KEY),
+    ):
+        arg = _get_call_args(call.arg_names, [[arg] for arg in call.args], arg_name)
+        if arg and isinstance(arg[0], NameExpr) and arg[0].fullname == "builtins.True":
+            flags |= flag
+    return stmt.lvalues[0].name, mypy.types.Instance(attr_info, list(type_args)), flags
+
+
+def _condition_attribute_name(expr: mypy.nodes.Expression) -> str | None:
+    """
+    Returns the name of the model attribute a condition operand refers to (e.g. `MyModel.my_attr`), if any.
+    """
+    if (
+        isinstance(expr, mypy.nodes.MemberExpr)
+        and isinstance(expr.expr, mypy.nodes.RefExpr)
+        and isinstance(expr.expr.node, TypeInfo)
+        and expr.expr.node.has_base(PYNAMODB_MODEL_FULL_NAME)
+    ):
+        return expr.name
+    return None
+
+
+def _get_key_conditions(expr: mypy.nodes.Expression, key_names: set[str]) -> list[str] | None:
+    """
+    Breaks a condition down into the key attributes its conjuncts constrain, in ways a key condition could,
+    e.g. ['my_hash_key', 'my_range_key'] for `(MyModel.my_hash_key == 'foo') & (MyModel.my_range_key > 42)`.
+    Returns None if any of its conjuncts is other than that.
+    """
+    if isinstance(expr, mypy.nodes.OpExpr) and expr.op == "&":
+        left = _get_key_conditions(expr.left, key_names)
+        right = _get_key_conditions(expr.right, key_names)
+        return left + right if left is not None and right is not None else None
+    attr_name = None
+    if isinstance(expr, mypy.nodes.ComparisonExpr) and expr.operators in (["=="], ["<"], ["<="], [">"], [">="]):
+        attr_name = _condition_attribute_name(expr.operands[0])
+    elif isinstance(expr, mypy.nodes.CallExpr) and isinstance(expr.callee, mypy.nodes.MemberExpr):
+        if expr.callee.name in ("between", "startswith"):
+            attr_name = _condition_attribute_name(expr.callee.expr)
+    return [attr_name] if attr_name is not None and attr_name in key_names else None
 
-    # Whether it's a range key.
-    is_range_key: bool
 
+def _get_index_projection(info: mypy.nodes.TypeInfo) -> list[str] | None:
+    """
+    Determines an index's projection from the index's Meta class (in the format of `PynamodbMetadataDict`),
+    e.g. ['INCLUDE', 'my_attr'] for `projection = IncludeProjection(['my_attr'])`. Returns None if it can't tell.
+    """
+    meta = info.names.get("Meta")
+    if meta is None or not isinstance(meta.node, TypeInfo):
+        return None
+    for stmt in meta.node.defn.defs.body:
+        if (
+            isinstance(stmt, mypy.nodes.AssignmentStmt)
+            and any(isinstance(lvalue, NameExpr) and lvalue.name == "projection" for lvalue in stmt.lvalues)
+            and isinstance(stmt.rvalue, mypy.nodes.CallExpr)
+            and isinstance(stmt.rvalue.callee, mypy.nodes.RefExpr)
+            and isinstance(stmt.rvalue.callee.node, TypeInfo)
+        ):
+            projection_class, args = stmt.rvalue.callee.node, stmt.rvalue.args
+            break
+    else:
+        return None
 
-def _pynamodb_attributes_metadata(info: mypy.nodes.TypeInfo) -> dict[str, PynamodbAttributeDict]:
-    return info.metadata.setdefault("pynamodb_attributes", {})
+    projection_type = next(
+        (PROJECTION_TYPES[base.fullname] for base in projection_class.mro if base.fullname in PROJECTION_TYPES),
+        None,
+    )
+    if projection_type != "INCLUDE":
+        return [projection_type] if projection_type else None
+    # the non-key attributes are only known when they're listed in place
+    non_key_attributes = args[0] if args else None
+    if not isinstance(non_key_attributes, mypy.nodes.ListExpr) or not all(
+        isinstance(item, mypy.nodes.StrExpr) for item in non_key_attributes.items
+    ):
+        return None
+    return [projection_type, *(cast(mypy.nodes.StrExpr, item).value for item in non_key_attributes.items)]
 
 
 def _rehydrate_type(api: mypy.plugin.CheckerPluginInterface, data: SerializedType) -> mypy.types.Type:
@@ -60,64 +493,892 @@ def _rehydrate_type(api: mypy.plugin.CheckerPluginInterface, data: SerializedTyp
     return typ
 
 
+def _python_class(cls: _C) -> _C:
+    """
+    Has mypyc (see setup.py) compile a class as a Python class, with compiled methods, rather than as a native class,
+    which can't derive from a native class compiled separately (such as mypy's `Plugin`, in mypy's own compiled
+    wheels), whose layout it doesn't know of.
+
+    mypyc creates such a class deriving from each of the classes of its MRO, looked up by name in the module's globals,
+    so they all need to be imported; and it can't compile closures (e.g. lambdas) within its methods.
+    """
+    return cls
+
+
+@_python_class
 class PynamodbPlugin(Plugin):
+    def __init__(self, options: mypy.options.Options) -> None:
+        super().__init__(options)
+        self._lazy = os.environ.get(LAZY_ENV_VAR, "").lower() not in ("", "0", "false", "no")
+        if os.environ.get(UNBOUNDED_READ_ENV_VAR, "").lower() not in ("", "0", "false", "no"):
+            # the code can't be enabled through mypy's config file, which is read before plugins are loaded
+            options.enabled_error_codes.add(UNBOUNDED_READ)
+        # Rehydrated attribute types, keyed by (model fullname, attribute name), tokened by the serialized type
+        # they were rehydrated from, so that rewritten or reloaded metadata is never served a stale type.
+        self._attribute_types: Memo[tuple[str, str], mypy.types.Type] = Memo("attribute_types", MEMO_MAXSIZE)
+        # Model initializer signatures, keyed by model fullname, tokened by the revisions of the model's (and its
+        # bases') attributes they were built for (see `_init_signature_token`).
+        self._init_signatures: Memo[str, mypy.types.CallableType] = Memo("init_signatures", MEMO_MAXSIZE)
+        # The revision of each class' attributes, keyed by class fullname: a number drawn anew whenever the plugin
+        # writes the class' attributes (or first asks of a class it has none for), so that it never recurs. As a
+        # forgotten class is drawn a new one, what's kept for a module's classes is let go of once it's reparsed.
+        self._attribute_revisions: dict[str, int] = {}
+        self._last_revision = 0
+        # Class bodies' assignment statements, keyed by class fullname (see `_get_class_assignments`).
+        self._class_assignments: Memo[str, dict[int, mypy.nodes.AssignmentStmt]] = Memo(
+            "class_assignments", MEMO_MAXSIZE
+        )
+        # Which PynamoDB base class each looked-up type derives from (see `_lookup_pynamodb_type`).
+        self._pynamodb_types: Memo[str, tuple[str, mypy.nodes.TypeInfo] | None] = Memo("pynamodb_types", MEMO_MAXSIZE)
+        # The types of models' (and indexes') hash and range keys, keyed by the fullname of the model (or index),
+        # tokened by the key attributes they were typed after (see `_get_key_types`).
+        self._key_types: Memo[str, tuple[mypy.types.Type, mypy.types.Type | None]] = Memo("key_types", MEMO_MAXSIZE)
+        # The calls within loops in modules' trees, keyed by module fullname (see `_get_calls_in_loops`).
+        self._calls_in_loops: Memo[str, set[int]] = Memo("calls_in_loops", MEMO_MAXSIZE)
+        # The types that reading attributes gives, keyed by the attributes' own types (e.g. 'UnicodeAttribute'),
+        # which is all they depend on (see `_get_descriptor_access_type`).
+        self._descriptor_types: Memo[mypy.types.Instance, mypy.types.Type | None] = Memo(
+            "descriptor_types", MEMO_MAXSIZE
+        )
+        self._memos: list[Memo[Any, Any]] = [
+            self._attribute_types,
+            self._init_signatures,
+            self._class_assignments,
+            self._pynamodb_types,
+            self._key_types,
+            self._calls_in_loops,
+            self._descriptor_types,
+        ]
+
     #
     # plugin callbacks which express interest in specific types (that the plugin handles) and provides return hooks
     # to handle them
     #
     # see: https://mypy.readthedocs.io/en/stable/extending_mypy.html#current-list-of-plugin-hooks
 
+    def get_additional_deps(self, file: mypy.nodes.MypyFile) -> list[tuple[int, str, int]]:
+        # Called whenever a module is (re)parsed, e.g. when dmypy picks up a changed module: the classes in it
+        # could have been added, removed or rebased, so the verdicts of `_lookup_pynamodb_type` could be stale.
+        self._pynamodb_types.clear()
+        self._descriptor_types.clear()
+        # What's memoized for the module's classes (and its tree) is about to be superseded, so it's let go of
+        # rather than left for eviction (holding on to the module's previous tree, in the meantime).
+        module_prefix = file.fullname + "."
+        memos: list[Memo[Any, Any]] = [
+            self._attribute_types,
+            self._init_signatures,
+            self._class_assignments,
+            self._key_types,
+        ]
+        for memo in memos:
+            memo.discard_if(functools.partial(_is_key_in_module, module_prefix))
+        self._calls_in_loops.discard(file.fullname)
+        for fullname in [name for name in self._attribute_revisions if name.startswith(module_prefix)]:
+            del self._attribute_revisions[fullname]
+        return []
+
+    def set_modules(self, modules: dict[str, mypy.nodes.MypyFile]) -> None:
+        # Called once per build (and dmypy update), once its modules are (re)parsed
+        super().set_modules(modules)
+        if self.options.verbosity >= 1:
+            # e.g. in a dmypy daemon's log (`dmypy start --log-file ... -- -v`), for telling its footprint over time
+            print(f"LOG:  pynamodb-mypy memos: {json.dumps(self.memo_stats())}", file=sys.stderr)
+
+    def memo_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Returns the number of entries (and the bound thereof) of each of the plugin's memos, along with their hits,
+        misses and evictions.
+        """
+        return {memo.name: memo.stats() for memo in self._memos}
+
+    def report_config_data(self, ctx: ReportConfigContext) -> Any:
+        # Becomes part of each module's cache: mypy only fingerprints the plugin's entry point module,
+        # so this is what invalidates incremental caches holding metadata of another layout version.
+        return {"metadata_version": METADATA_VERSION}
+
     def get_function_signature_hook(
         self,
         fullname: str,
     ) -> Callable[[FunctionSigContext], mypy.types.FunctionLike] | None:
-        sym = self.lookup_fully_qualified(fullname)
-        if sym and isinstance(sym.node, TypeInfo) and sym.node.has_base(PYNAMODB_MODEL_FULL_NAME):
+        pynamodb_type = self._lookup_pynamodb_type(fullname)
+        if pynamodb_type and (
+            pynamodb_type[0] == PYNAMODB_MODEL_FULL_NAME or _is_typed_map_attribute(pynamodb_type[1])
+        ):
             return self._get_function_signature_hook__pynamodb_model__init__
         return None
 
     def get_attribute_hook(self, fullname: str) -> Callable[[AttributeContext], mypy.types.Type] | None:
         class_name, _, attr_name = fullname.rpartition(".")
-        sym = self.lookup_fully_qualified(class_name)
-        if sym and isinstance(sym.node, TypeInfo) and sym.node.has_base(PYNAMODB_MODEL_FULL_NAME):
-            return functools.partial(self._get_attribute_hook__pynamodb_model, sym.node, attr_name)
+        pynamodb_type = self._lookup_pynamodb_type(class_name)
+        if pynamodb_type and (
+            pynamodb_type[0] == PYNAMODB_MODEL_FULL_NAME or _is_typed_map_attribute(pynamodb_type[1])
+        ):
+            return functools.partial(self._get_attribute_hook__pynamodb_model, pynamodb_type[1], attr_name)
         return None
 
     def get_function_hook(self, fullname: str) -> Callable[[FunctionContext], mypy.types.Type] | None:
-        sym = self.lookup_fully_qualified(fullname)
-        if not sym:  # pragma: no cover
-            return None
-        if isinstance(sym.node, TypeInfo) and sym.node.has_base(PYNAMODB_ATTRIBUTE_FULL_NAME):
+        if fullname in MATERIALIZING_FUNCTIONS:
+            return functools.partial(self._get_function_hook__materializing, fullname.rpartition(".")[2])
+        pynamodb_type = self._lookup_pynamodb_type(fullname)
+        if pynamodb_type and pynamodb_type[0] == PYNAMODB_ATTRIBUTE_FULL_NAME:
             return self._get_function_hook__pynamodb_attribute__init__
         return None
 
+    def get_method_signature_hook(
+        self,
+        fullname: str,
+    ) -> Callable[[MethodSigContext], mypy.types.FunctionLike] | None:
+        class_name, _, method_name = fullname.rpartition(".")
+        if method_name == "query":
+            pynamodb_type = self._lookup_pynamodb_type(class_name)
+            if pynamodb_type and pynamodb_type[0] in (PYNAMODB_MODEL_FULL_NAME, PYNAMODB_INDEX_FULL_NAME):
+                return functools.partial(self._get_method_signature_hook__pynamodb_query, pynamodb_type[1])
+        elif method_name in KEYED_READ_METHODS:
+            pynamodb_type = self._lookup_pynamodb_type(class_name)
+            if pynamodb_type and pynamodb_type[0] == PYNAMODB_MODEL_FULL_NAME:
+                return functools.partial(
+                    self._get_method_signature_hook__pynamodb_model__keyed_read, pynamodb_type[1], method_name
+                )
+        elif method_name in UPDATE_ACTION_METHODS:
+            pynamodb_type = self._lookup_pynamodb_type(class_name)
+            if pynamodb_type and pynamodb_type[0] == PYNAMODB_ATTRIBUTE_FULL_NAME:
+                return functools.partial(self._get_method_signature_hook__pynamodb_attribute__update, method_name)
+        return None
+
+    def get_base_class_hook(self, fullname: str) -> Callable[[ClassDefContext], None] | None:
+        pynamodb_type = self._lookup_pynamodb_type(fullname)
+        if pynamodb_type:
+            return self._get_base_class_hook__pynamodb
+        return None
+
+    def get_method_hook(self, fullname: str) -> Callable[[MethodContext], mypy.types.Type] | None:
+        class_name, _, method_name = fullname.rpartition(".")
+        # an attribute's "delete" builds an update action, whereas a model's deletes an item
+        if method_name in UPDATE_ACTION_METHODS:
+            pynamodb_type = self._lookup_pynamodb_type(class_name)
+            if pynamodb_type and pynamodb_type[0] == PYNAMODB_ATTRIBUTE_FULL_NAME:
+                return functools.partial(self._get_method_hook__pynamodb_attribute__update, method_name)
+        if method_name in SINGLE_ITEM_OPERATIONS:
+            pynamodb_type = self._lookup_pynamodb_type(class_name)
+            if pynamodb_type and pynamodb_type[0] == PYNAMODB_MODEL_FULL_NAME:
+                return functools.partial(
+                    self._get_method_hook__pynamodb_model__single_item_operation,
+                    pynamodb_type[1],
+                    method_name,
+                )
+        elif method_name == "query":
+            pynamodb_type = self._lookup_pynamodb_type(class_name)
+            if pynamodb_type and pynamodb_type[0] in (PYNAMODB_MODEL_FULL_NAME, PYNAMODB_INDEX_FULL_NAME):
+                return functools.partial(self._get_method_hook__pynamodb_query, pynamodb_type[1])
+        elif method_name == "scan":
+            pynamodb_type = self._lookup_pynamodb_type(class_name)
+            if pynamodb_type and pynamodb_type[0] in (PYNAMODB_MODEL_FULL_NAME, PYNAMODB_INDEX_FULL_NAME):
+                return functools.partial(self._get_method_hook__pynamodb_scan, pynamodb_type[1])
+        elif method_name == "batch_get":
+            pynamodb_type = self._lookup_pynamodb_type(class_name)
+            if pynamodb_type and pynamodb_type[0] == PYNAMODB_MODEL_FULL_NAME:
+                return functools.partial(self._get_method_hook__pynamodb_model__batch_get, pynamodb_type[1])
+        return None
+
     #
     # hooks for specific types
     #
 
+    def _get_base_class_hook__pynamodb(self, ctx: ClassDefContext) -> None:
+        """
+        Called once a class deriving from a model, an index or an attribute (e.g. a map attribute) is semantically
+        analyzed, to record the attributes declared in its body.
+
+        The attributes are recorded before any of the program is type-checked, so that the model's initializer
+        and attributes are typed even where they're used ahead of the class body being checked (e.g. in a function
+        defined above the class, or in a module of an import cycle). They're recorded lazily (see `LAZY_ENV_VAR`),
+        and once the class body is checked, `_inspect_pynamodb_attribute_init` records them anew.
+        """
+        info = ctx.cls.info
+        attributes = {}
+        attr_names = {}
+        for stmt in ctx.cls.defs.body:
+            declared_attribute = _get_declared_attribute(stmt)
+            if declared_attribute is None:
+                continue
+            attr_name, attr_instance, flags = declared_attribute
+            attributes[attr_name] = (attr_instance, flags)
+            assert isinstance(stmt, mypy.nodes.AssignmentStmt) and isinstance(stmt.rvalue, mypy.nodes.CallExpr)
+            stored_name = _get_call_args(stmt.rvalue.arg_names, [[arg] for arg in stmt.rvalue.args], "attr_name")
+            if stored_name and isinstance(stored_name[0], mypy.nodes.StrExpr) and stored_name[0].value != attr_name:
+                attr_names[attr_name] = stored_name[0].value
+        self._add_schema_dependencies(ctx, {attr_name: flags for attr_name, (_, flags) in attributes.items()})
+        if not attributes:
+            return
+
+        metadata = _write_pynamodb_metadata(info)
+        self._bump_attribute_revision(info)
+        metadata["attributes"] = {
+            attr_name: [_intern_type(metadata, attr_instance.serialize()), int(flags)]
+            for attr_name, (attr_instance, flags) in attributes.items()
+        }
+        metadata["attr_names"] = attr_names
+        if info.has_base(PYNAMODB_INDEX_FULL_NAME):
+            metadata["projection"] = _get_index_projection(info)
+
+    def _add_schema_dependencies(self, ctx: ClassDefContext, attributes: dict[str, AttributeFlags]) -> None:
+        """
+        Generates the symbols of a class' attributes' flags (see `SCHEMA_SYMBOL_SUFFIX`), and has the members
+        depending on the flags of the class' attributes (including the ones it inherits) depend on the symbols.
+
+        Under dmypy, a change to an attribute's flags then only rechecks the code that initializes or queries
+        the model, or that reads the attribute, rather than all of the code that refers to the model.
+        """
+        info = ctx.cls.info
+        module = ctx.api.modules[info.module_name]
+        int_type = ctx.api.named_type("builtins.int")
+        for attr_name, flags in attributes.items():
+            var = mypy.nodes.Var(_get_schema_symbol_name(info, attr_name))
+            var.type = mypy.types.LiteralType(int(flags & ~AttributeFlags.LAZY), int_type)
+            var._fullname = f"{module.fullname}.{var.name}"
+            module.names[var.name] = mypy.nodes.SymbolTableNode(
+                mypy.nodes.GDEF, var, module_public=False, plugin_generated=True
+            )
+            ctx.api.add_plugin_dependency(make_trigger(var.fullname), make_trigger(f"{info.fullname}.{attr_name}"))
+            for member in SCHEMA_DEPENDENT_MEMBERS:
+                ctx.api.add_plugin_dependency(make_trigger(var.fullname), make_trigger(f"{info.fullname}.{member}"))
+
+        # the triggers of the inherited attributes themselves are propagated to the subclass' by mypy
+        for base in info.mro[1:]:
+            metadata = _read_pynamodb_metadata(base)
+            for attr_name in metadata["attributes"] if metadata else ():
+                for member in SCHEMA_DEPENDENT_MEMBERS:
+                    ctx.api.add_plugin_dependency(
+                        make_trigger(f"{base.module_name}.{_get_schema_symbol_name(base, attr_name)}"),
+                        make_trigger(f"{info.fullname}.{member}"),
+                    )
+
     def _get_function_signature_hook__pynamodb_model__init__(self, ctx: FunctionSigContext) -> mypy.types.FunctionLike:
         """
-        Called when a model is initialized (e.g. MyModel(foo='bar')).
+        Called when a model (or a map attribute) is initialized (e.g. MyModel(foo='bar')).
         """
         model_instance = ctx.default_signature.ret_type
         if not isinstance(model_instance, mypy.types.Instance):  # pragma: no cover
             return ctx.default_signature
 
-        args = {}
-        for model_cls in model_instance.type.mro:
-            args.update({
-                attr_name: _rehydrate_type(ctx.api, attr_data["type"])
-                for attr_name, attr_data in _pynamodb_attributes_metadata(model_cls).items()
-            })
+        model_typeinfo = model_instance.type
+        token = self._init_signature_token(model_typeinfo, ctx.default_signature)
+        try:
+            return self._init_signatures.lookup(model_typeinfo.fullname, token)
+        except KeyError:
+            pass
+
+        # The signature is also persisted in the model type's metadata, for warm incremental runs to reuse;
+        # the fingerprint tells whether it's still current (see `_init_signature_fingerprint`).
+        fingerprint = _init_signature_fingerprint(model_typeinfo, ctx.default_signature)
+        metadata = _read_pynamodb_metadata(model_typeinfo)
+        init_signature_data = metadata["init_signature"] if metadata else None
+        if metadata and init_signature_data and init_signature_data["fingerprint"] == fingerprint:
+            types = metadata["types"]
+            signature_data = {
+                **init_signature_data["signature"],
+                "arg_types": [types[type_idx] for type_idx in init_signature_data["arg_types"]],
+            }
+            signature = self._rehydrate_type(ctx.api, signature_data)
+            assert isinstance(signature, mypy.types.CallableType)
+            signature = signature.copy_modified(definition=ctx.default_signature.definition)
+        else:
+            if model_typeinfo.has_base(PYNAMODB_MODEL_FULL_NAME):
+                built_signature = self._build_model_init_signature(ctx, model_typeinfo)
+            else:
+                built_signature = self._build_map_attribute_init_signature(ctx, model_typeinfo)
+            if built_signature is None:
+                return ctx.default_signature
+            signature = built_signature
+            metadata = _write_pynamodb_metadata(model_typeinfo)
+            metadata["init_signature"] = PynamodbInitSignatureDict(
+                fingerprint=fingerprint,
+                signature={**signature.serialize(), "arg_types": []},
+                arg_types=[_intern_type(metadata, arg_type.serialize()) for arg_type in signature.arg_types],
+            )
+            _compact_types(metadata)
+
+        return self._init_signatures.store(model_typeinfo.fullname, signature, token)
+
+    def _get_function_hook__pynamodb_attribute__init__(self, ctx: FunctionContext) -> mypy.types.Type:
+        """
+        Handles attribute instantiation, e.g. MyAttribute(null=True)
+        """
+        self._inspect_pynamodb_attribute_init(ctx)
+        return ctx.default_return_type
+
+    def _get_attribute_hook__pynamodb_model(
+        self,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        attr_name: str,
+        ctx: AttributeContext,
+    ) -> mypy.types.Type:
+        """
+        Called when a model's (or a map attribute's) attribute is referenced, used to determine the attribute's type:
+        this generally works well even without the plugin (thanks for mypy supporting the Descriptor protocol),
+        the nullability (support for `null=True`) is what's being added here.
+        """
+        metadata = _read_pynamodb_metadata(model_typeinfo)
+        if not metadata or attr_name not in metadata["attributes"]:  # pragma: no cover
+            return ctx.default_attr_type
+
+        # items fetched through a projection (e.g. of an index) only have some of their attributes
+        item_type = ctx.type
+        item_metadata = _read_pynamodb_metadata(item_type.type) if isinstance(item_type, mypy.types.Instance) else None
+        if item_metadata and item_metadata["projection"] and attr_name not in item_metadata["projection"][1:]:
+            assert isinstance(item_type, mypy.types.Instance)
+            ctx.api.fail(
+                f'Attribute "{attr_name}" is not projected into "{item_type.type.name}" items, so it is not fetched',
+                ctx.context,
+                code=PROJECTION,
+            )
+
+        return self._get_attribute_type(ctx.api, model_typeinfo, attr_name, metadata, ctx.context)
+
+    def _get_method_hook__pynamodb_model__single_item_operation(
+        self,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        method_name: str,
+        ctx: MethodContext,
+    ) -> mypy.types.Type:
+        """
+        Called when a model's single-item operation is called (e.g. MyModel.get(...) or my_model.save()),
+        to flag the calls made within loops, i.e. a request per iteration where a batch request would do,
+        and the saves of items fetched through a projection. An item got with `attributes_to_get` is narrowed
+        to those attributes.
+        """
+        internal_api = ctx.api
+        assert isinstance(internal_api, mypy.checker.TypeChecker)
+
+        metadata = _read_pynamodb_metadata(model_typeinfo)
+        if metadata and metadata["projection"]:
+            if method_name == "save":
+                # the attributes that weren't fetched would be written as absent
+                ctx.api.fail(
+                    f'"{model_typeinfo.name}" items only have some of their attributes fetched, so saving them '
+                    f'would remove the others; use "update" instead',
+                    ctx.context,
+                    code=PROJECTION,
+                )
+            model_typeinfo = model_typeinfo.bases[0].type  # an item fetched through a projection
+
+        if id(ctx.context) in self._get_calls_in_loops(internal_api.tree):
+            model_name = model_typeinfo.name
+            ctx.api.fail(
+                f'"{model_name}.{method_name}" called within a loop, making a request per iteration; '
+                f'consider "{model_name}.{SINGLE_ITEM_OPERATIONS[method_name]}" instead',
+                ctx.context,
+                code=N_PLUS_ONE,
+            )
+        return self._project_attributes_to_get(model_typeinfo, ctx)
+
+    def _get_method_signature_hook__pynamodb_query(
+        self,
+        typeinfo: mypy.nodes.TypeInfo,
+        ctx: MethodSigContext,
+    ) -> mypy.types.FunctionLike:
+        """
+        Called when a model or an index is queried (e.g. MyModel.query(...) or MyModel.my_index.query(...)),
+        to type the hash key argument after the hash key attribute.
+        """
+        arg_names = ctx.default_signature.arg_names
+        if _get_call_args(arg_names, ctx.args, "index_name"):
+            return ctx.default_signature  # querying an index by name, rather than the model
+
+        key_types = self._get_key_types(ctx, typeinfo)
+        if key_types is None or "hash_key" not in arg_names:
+            return ctx.default_signature
+
+        arg_types = ctx.default_signature.arg_types.copy()
+        arg_types[arg_names.index("hash_key")] = key_types[0]
+        return ctx.default_signature.copy_modified(arg_types=arg_types)
+
+    def _get_method_signature_hook__pynamodb_model__keyed_read(
+        self,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        method_name: str,
+        ctx: MethodSigContext,
+    ) -> mypy.types.FunctionLike:
+        """
+        Called when a model's items are read by their keys (e.g. MyModel.get(...), MyModel.count(...)
+        or MyModel.batch_get(...)), to type the keys after the key attributes: a batch's keys are hash keys,
+        or (for models with a range key) pairs of hash and range keys, as tuples or lists.
+        """
+        arg_names = ctx.default_signature.arg_names
+        if _get_call_args(arg_names, ctx.args, "index_name"):
+            return ctx.default_signature  # counting an index's items by name, rather than the model's
+
+        key_types = self._get_key_types(ctx, model_typeinfo)
+        if key_types is None:
+            return ctx.default_signature
+        hash_key_type, range_key_type = key_types
+        if method_name == "get":
+            key_arg_types = {"hash_key": hash_key_type, "range_key": range_key_type or mypy.types.NoneType()}
+        elif method_name == "count":
+            # without a hash key, the whole table's items are counted
+            key_arg_types = {"hash_key": make_optional_type(hash_key_type)}
+        else:
+            item_type = hash_key_type
+            if range_key_type is not None:
+                # pynamodb indexes the pairs, so lists are taken as well (though not any sequence, e.g. a string)
+                item_type = mypy.types.UnionType(
+                    [
+                        mypy.types.TupleType(
+                            [hash_key_type, range_key_type],
+                            ctx.api.named_generic_type(
+                                "builtins.tuple", [mypy.types.AnyType(mypy.types.TypeOfAny.special_form)]
+                            ),
+                        ),
+                        ctx.api.named_generic_type(
+                            "builtins.list", [mypy.types.UnionType([hash_key_type, range_key_type])]
+                        ),
+                    ]
+                )
+            key_arg_types = {"items": ctx.api.named_generic_type("typing.Iterable", [item_type])}
+
+        arg_types = ctx.default_signature.arg_types.copy()
+        for arg_name, arg_type in key_arg_types.items():
+            if arg_name in arg_names:
+                arg_types[arg_names.index(arg_name)] = arg_type
+        return ctx.default_signature.copy_modified(arg_types=arg_types)
+
+    def _get_method_hook__pynamodb_query(self, typeinfo: mypy.nodes.TypeInfo, ctx: MethodContext) -> mypy.types.Type:
+        """
+        Called when a model or an index is queried, to flag filter conditions that would do as key conditions
+        (a query reads, and is billed for, all the items matching its key condition, before filtering them),
+        or that only restate the hash key the query's made with.
+        """
+        filter_condition = _get_call_args(ctx.callee_arg_names, ctx.args, "filter_condition")
+        if filter_condition and not _get_call_args(ctx.callee_arg_names, ctx.args, "index_name"):
+            hash_key = _find_key_attribute(typeinfo, AttributeFlags.HASH_KEY)
+            range_key = _find_key_attribute(typeinfo, AttributeFlags.RANGE_KEY)
+            hash_key_name = hash_key[1] if hash_key else None
+            range_key_name = range_key[1] if range_key else None
+            key_conditions = _get_key_conditions(
+                filter_condition[0], {key_name for key_name in (hash_key_name, range_key_name) if key_name}
+            )
+            if key_conditions is not None:
+                self._check_key_conditions(ctx, filter_condition[0], key_conditions, range_key_name)
+
+        if typeinfo.has_base(PYNAMODB_INDEX_FULL_NAME):
+            return self._project_index_query_results(typeinfo, ctx)
+        return self._project_attributes_to_get(typeinfo, ctx)
+
+    def _check_key_conditions(
+        self,
+        ctx: MethodContext,
+        filter_condition: mypy.nodes.Expression,
+        key_conditions: list[str],
+        range_key_name: str | None,
+    ) -> None:
+        """
+        Flags a query's filter condition that only constrains key attributes (see `_get_key_conditions`).
+        """
+        if range_key_name is None or range_key_name not in key_conditions:
+            ctx.api.fail(
+                "Filter condition only constrains the hash key, making it redundant with the query's hash key value",
+                filter_condition,
+                code=KEY_CONDITION,
+            )
+        # a query takes a single range key condition, so only a filter on a single one could be replaced by it
+        elif key_conditions.count(range_key_name) == 1 and not _get_call_args(
+            ctx.callee_arg_names, ctx.args, "range_key_condition"
+        ):
+            ctx.api.fail(
+                "Filter condition only constrains key attributes; use a range key condition to read only "
+                "the matching items, rather than the whole partition",
+                filter_condition,
+                code=KEY_CONDITION,
+            )
+
+    def _get_method_hook__pynamodb_scan(self, typeinfo: mypy.nodes.TypeInfo, ctx: MethodContext) -> mypy.types.Type:
+        """
+        Called when a model or an index is scanned (e.g. MyModel.scan(...)), to flag the scans of the whole table
+        made without capping how much each of their requests reads (with a "page_size"), nor how many items
+        they read overall (with a "limit").
+        """
+        if not any(_get_call_args(ctx.callee_arg_names, ctx.args, name) for name in ("limit", "page_size")):
+            ctx.api.fail(
+                'Scan without a "limit" or "page_size" reads the whole table',
+                ctx.context,
+                code=UNBOUNDED_READ,
+            )
+        if typeinfo.has_base(PYNAMODB_INDEX_FULL_NAME):
+            return ctx.default_return_type
+        return self._project_attributes_to_get(typeinfo, ctx)
+
+    def _get_method_hook__pynamodb_model__batch_get(
+        self,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        ctx: MethodContext,
+    ) -> mypy.types.Type:
+        """
+        Called when a model's items are got in a batch (e.g. MyModel.batch_get(...)), to narrow the items
+        to the attributes to get.
+        """
+        return self._project_attributes_to_get(model_typeinfo, ctx)
+
+    def _get_method_signature_hook__pynamodb_attribute__update(
+        self,
+        method_name: str,
+        ctx: MethodSigContext,
+    ) -> mypy.types.FunctionLike:
+        """
+        Called when an update action (or its operand) is built for a model's attribute, e.g. MyModel.my_attr.set(42),
+        to type the values it takes after the attribute's type.
+        """
+        updated_attribute = self._get_updated_attribute(ctx)
+        if updated_attribute is None or len(ctx.default_signature.arg_types) != 1:
+            return ctx.default_signature
+        value_type = self._get_update_value_type(ctx, method_name, *updated_attribute)
+        if value_type is None:
+            return ctx.default_signature
+        return ctx.default_signature.copy_modified(arg_types=[value_type])
+
+    def _get_method_hook__pynamodb_attribute__update(self, method_name: str, ctx: MethodContext) -> mypy.types.Type:
+        """
+        Called when an update action (or its operand) is built for a model's attribute, to flag the actions
+        that DynamoDB would reject, or that would leave items without their non-nullable attributes.
+        """
+        updated_attribute = self._get_updated_attribute(ctx)
+        if updated_attribute is None:
+            return ctx.default_return_type
+        model_typeinfo, attr_name, metadata = updated_attribute
+        _, flags = metadata["attributes"][attr_name]
+        supported_by = UPDATE_ACTION_METHODS[method_name]
+        if flags & (AttributeFlags.HASH_KEY | AttributeFlags.RANGE_KEY):
+            ctx.api.fail(
+                f'Attribute "{attr_name}" of "{model_typeinfo.name}" is a key attribute, so it cannot be updated',
+                ctx.context,
+                code=UPDATE_ACTION,
+            )
+        elif method_name == "remove" and not flags & AttributeFlags.NULLABLE:
+            ctx.api.fail(
+                f'Attribute "{attr_name}" of "{model_typeinfo.name}" is not nullable, so it cannot be removed',
+                ctx.context,
+                code=UPDATE_ACTION,
+            )
+        elif supported_by and self._get_update_value_type(ctx, method_name, *updated_attribute) is None:
+            ctx.api.fail(
+                f'"{method_name}" is only supported by {supported_by} attributes',
+                ctx.context,
+                code=UPDATE_ACTION,
+            )
+        return ctx.default_return_type
+
+    def _get_function_hook__materializing(self, function_name: str, ctx: FunctionContext) -> mypy.types.Type:
+        """
+        Called when an iterable is read into memory (e.g. list(...)), to flag reading all of a query's
+        or scan's results, rather than paging through them.
+        """
+        for arg_types, args in zip(ctx.arg_types, ctx.args):
+            for arg_type, arg in zip(arg_types, args):
+                arg_type = mypy.types.get_proper_type(arg_type)
+                if (
+                    isinstance(arg_type, mypy.types.Instance)
+                    and arg_type.type.has_base(PYNAMODB_RESULT_ITERATOR_FULL_NAME)
+                    # A query or scan that's limited in place is bounded. Unlike for the scan check (see
+                    # `_get_method_hook__pynamodb_scan`), a "page_size" doesn't count: it only caps how much each
+                    # of the requests reads, while all of the pages are held in memory at once here.
+                    and not (isinstance(arg, mypy.nodes.CallExpr) and "limit" in arg.arg_names)
+                ):
+                    ctx.api.fail(
+                        f'"{function_name}" reads all of the results into memory; iterate over them instead, '
+                        f'or pass a "limit"',
+                        arg,
+                        code=UNBOUNDED_READ,
+                    )
+        return ctx.default_return_type
+
+    # utils
+
+    def _project_index_query_results(self, index_typeinfo: mypy.nodes.TypeInfo, ctx: MethodContext) -> mypy.types.Type:
+        """
+        Narrows the items an index's query returns to the index's projection (unless it projects all attributes),
+        so that reading the attributes that aren't projected can be flagged.
+        """
+        projection = next(
+            (
+                metadata["projection"]
+                for base in index_typeinfo.mro
+                if (metadata := _read_pynamodb_metadata(base)) and metadata["projection"]
+            ),
+            None,
+        )
+        if not projection or projection[0] == "ALL":
+            return ctx.default_return_type
+
+        # besides the model's keys, an index projects its own keys
+        index_key_names = [
+            key[1]
+            for flag in (AttributeFlags.HASH_KEY, AttributeFlags.RANGE_KEY)
+            if (key := _find_key_attribute(index_typeinfo, flag))
+        ]
+        return self._project_results(
+            ctx, f"@{index_typeinfo.name}", [*index_key_names, *projection[1:]], with_model_keys=True
+        )
+
+    def _project_attributes_to_get(self, model_typeinfo: mypy.nodes.TypeInfo, ctx: MethodContext) -> mypy.types.Type:
+        """
+        Narrows the items a model's read operation returns (e.g. MyModel.get(..., attributes_to_get=[...]))
+        to the attributes to get, when they're listed in place, so that reading any other attribute can be flagged:
+        the items are missing them (the keys included, unless listed), which reads as None or the default.
+        """
+        attributes_to_get = _get_call_args(ctx.callee_arg_names, ctx.args, "attributes_to_get")
+        if not attributes_to_get:
+            return ctx.default_return_type
+        names_expr = attributes_to_get[0]
+        if not isinstance(names_expr, (mypy.nodes.ListExpr, mypy.nodes.TupleExpr)) or not all(
+            isinstance(item, mypy.nodes.StrExpr) for item in names_expr.items
+        ):
+            return ctx.default_return_type
+
+        # the attributes are got by their names in DynamoDB, or by paths of their nested attributes
+        attr_names: dict[str, str] = {}
+        for base in model_typeinfo.mro:
+            metadata = _read_pynamodb_metadata(base)
+            if metadata:
+                for attr_name in metadata["attributes"]:
+                    attr_names.setdefault(metadata["attr_names"].get(attr_name, attr_name), attr_name)
+        projected_attr_names = []
+        for item in names_expr.items:
+            assert isinstance(item, mypy.nodes.StrExpr)
+            top_level_name = item.value.split(".")[0].split("[")[0]
+            if top_level_name not in attr_names:
+                ctx.api.fail(
+                    f'No attribute of "{model_typeinfo.name}" is named "{top_level_name}" in DynamoDB',
+                    item,
+                    code=PROJECTION,
+                )
+                return ctx.default_return_type
+            projected_attr_names.append(attr_names[top_level_name])
+
+        suffix = f"@[{', '.join(sorted(set(projected_attr_names)))}]"
+        return self._project_results(ctx, suffix, projected_attr_names, with_model_keys=False)
+
+    def _project_results(
+        self,
+        ctx: MethodContext,
+        suffix: str,
+        attribute_names: list[str],
+        *,
+        with_model_keys: bool,
+    ) -> mypy.types.Type:
+        """
+        Narrows the item (or the items) a read operation returns to some of the model's attributes
+        (see `_get_projected_model_type`), naming the narrowed type after the model's, with a suffix.
+        """
+        results_type = mypy.types.get_proper_type(ctx.default_return_type)
+        if not isinstance(results_type, mypy.types.Instance):  # pragma: no cover
+            return ctx.default_return_type
+        if results_type.type.has_base(PYNAMODB_MODEL_FULL_NAME):
+            item_type: mypy.types.ProperType = results_type
+        elif len(results_type.args) == 1:
+            item_type = mypy.types.get_proper_type(results_type.args[0])
+        else:  # pragma: no cover
+            return ctx.default_return_type
+        if not isinstance(item_type, mypy.types.Instance):
+            return ctx.default_return_type  # e.g. the index's model is not known
+
+        model_typeinfo = item_type.type
+        if with_model_keys:
+            attribute_names = [
+                *attribute_names,
+                *(
+                    key[1]
+                    for flag in (AttributeFlags.HASH_KEY, AttributeFlags.RANGE_KEY)
+                    if (key := _find_key_attribute(model_typeinfo, flag))
+                ),
+            ]
+        internal_api = ctx.api
+        assert isinstance(internal_api, mypy.checker.TypeChecker)
+        projected_typeinfo = self._get_projected_model_type(
+            internal_api, model_typeinfo, model_typeinfo.name + suffix, attribute_names
+        )
+        if projected_typeinfo is None:  # pragma: no cover
+            return ctx.default_return_type
+        projected_type = mypy.types.Instance(projected_typeinfo, [])
+        if results_type is item_type:
+            return projected_type
+        return results_type.copy_modified(args=[projected_type])
+
+    def _get_updated_attribute(
+        self,
+        ctx: MethodContext | MethodSigContext,
+    ) -> tuple[mypy.nodes.TypeInfo, str, PynamodbMetadataDict] | None:
+        """
+        Tells which model attribute an update action is built for, e.g. `MyModel.my_attr` of `MyModel.my_attr.set(42)`
+        (or `cls.my_attr.set(42)`), returning the class declaring the attribute, the attribute's name
+        and the class's metadata, or None if the action isn't built for a model's attribute.
+        """
+        call = ctx.context
+        if not (
+            isinstance(call, mypy.nodes.CallExpr)
+            and isinstance(call.callee, mypy.nodes.MemberExpr)
+            and isinstance(call.callee.expr, mypy.nodes.MemberExpr)
+        ):
+            return None
+        internal_api = ctx.api
+        assert isinstance(internal_api, mypy.checker.TypeChecker)
+        owner_type = mypy.types.get_proper_type(internal_api.lookup_type_or_none(call.callee.expr.expr))
+        if isinstance(owner_type, mypy.types.CallableType) and owner_type.is_type_obj():
+            owner_type = mypy.types.get_proper_type(owner_type.ret_type)
+        elif isinstance(owner_type, mypy.types.TypeType):
+            owner_type = owner_type.item
+        if not (isinstance(owner_type, mypy.types.Instance) and owner_type.type.has_base(PYNAMODB_MODEL_FULL_NAME)):
+            return None
+
+        attr_name = call.callee.expr.name
+        for base in owner_type.type.mro:
+            metadata = _read_pynamodb_metadata(base)
+            if metadata and attr_name in metadata["attributes"]:
+                return base, attr_name, metadata
+        return None
+
+    def _get_update_value_type(
+        self,
+        ctx: MethodContext | MethodSigContext,
+        method_name: str,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        attr_name: str,
+        metadata: PynamodbMetadataDict,
+    ) -> mypy.types.Type | None:
+        """
+        Returns the type of the values an update action (or its operand) takes for a model's attribute,
+        or None if the attribute doesn't support the action (e.g. adding to a string attribute).
+        """
+        attr_type = mypy.types.remove_optional(
+            self._get_attribute_type(ctx.api, model_typeinfo, attr_name, metadata, ctx.context)
+        )
+        if method_name == "set":
+            # an attribute can also be set to an expression, e.g. `MyModel.my_attr + 1`, or to another attribute
+            # (the checker's own lookups don't see the names of submodules that aren't imported by their packages)
+            operand_sym = self.lookup_fully_qualified(PYNAMODB_OPERAND_FULL_NAME)
+            attribute_sym = self.lookup_fully_qualified(PYNAMODB_ATTRIBUTE_FULL_NAME)
+            assert operand_sym and isinstance(operand_sym.node, TypeInfo)
+            assert attribute_sym and isinstance(attribute_sym.node, TypeInfo)
+            any_type = mypy.types.AnyType(mypy.types.TypeOfAny.special_form)
+            value_types = [
+                attr_type,
+                mypy.types.Instance(operand_sym.node, []),
+                mypy.types.Instance(attribute_sym.node, [any_type]),
+            ]
+            # a map attribute's value is the map itself, which it also serializes from a plain mapping
+            proper_type = mypy.types.get_proper_type(attr_type)
+            if isinstance(proper_type, mypy.types.Instance) and proper_type.type.has_base(
+                PYNAMODB_MAP_ATTRIBUTE_FULL_NAME
+            ):
+                str_type = ctx.api.named_generic_type("builtins.str", [])
+                value_types.append(ctx.api.named_generic_type("typing.Mapping", [str_type, any_type]))
+            return mypy.types.UnionType(value_types)
+
+        proper_type = mypy.types.get_proper_type(attr_type)
+        if isinstance(proper_type, mypy.types.AnyType):
+            return attr_type
+        if not isinstance(proper_type, mypy.types.Instance):
+            return None
+        # adding (or deleting) takes a set's elements, one by one or as a set
+        if method_name == "add" and proper_type.type.fullname in ("builtins.float", "builtins.int"):
+            return attr_type
+        if method_name in ("add", "delete") and proper_type.type.fullname == "builtins.set":
+            return mypy.types.UnionType([proper_type.args[0], attr_type])
+        if method_name in ("append", "prepend") and proper_type.type.fullname == "builtins.list":
+            return ctx.api.named_generic_type("typing.Iterable", [proper_type.args[0]])
+        return None
+
+    def _get_projected_model_type(
+        self,
+        chk: mypy.checker.TypeChecker,
+        model_typeinfo: mypy.nodes.TypeInfo,
+        name: str,
+        attribute_names: list[str],
+    ) -> mypy.nodes.TypeInfo | None:
+        """
+        Returns a subtype of a model for the model's items that only have some of their attributes fetched
+        (along with their keys). Reading any other attribute of such items is flagged.
+
+        The subtype is defined in the module being checked, where it's reused by other items of the same projection,
+        and from where it's persisted along with the module (in case it outlives the check, e.g. as a variable's type).
+        """
+        module = chk.tree
+        projection = ["INCLUDE", *sorted(set(attribute_names))]
+
+        sym = module.names.get(name)
+        if sym is not None:
+            # defined already, unless (unlikely) the name's already taken
+            if (
+                isinstance(sym.node, TypeInfo)
+                and sym.node.bases[0].type == model_typeinfo
+                and (metadata := _read_pynamodb_metadata(sym.node))
+                and metadata["projection"] == projection
+            ):
+                return sym.node
+            return None  # pragma: no cover
+
+        class_def = mypy.nodes.ClassDef(name, mypy.nodes.Block([]))
+        class_def.fullname = f"{module.fullname}.{name}"
+        info = TypeInfo(mypy.nodes.SymbolTable(), class_def, module.fullname)
+        class_def.info = info
+        info.bases = [mypy.types.Instance(model_typeinfo, [])]
+        info.metaclass_type = model_typeinfo.metaclass_type
+        calculate_mro(info)
+        _write_pynamodb_metadata(info)["projection"] = projection
+        module.names[name] = mypy.nodes.SymbolTableNode(mypy.nodes.GDEF, info, plugin_generated=True)
+        return info
+
+    def _bump_attribute_revision(self, info: mypy.nodes.TypeInfo) -> int:
+        """
+        Records that the plugin (re)wrote a class' attributes (see `_init_signature_token`).
+        """
+        self._last_revision += 1
+        self._attribute_revisions[info.fullname] = self._last_revision
+        return self._last_revision
+
+    def _get_attribute_revision(self, info: mypy.nodes.TypeInfo) -> int:
+        """
+        Returns the revision of a class' attributes, drawing one for a class that has none (e.g. as its module was
+        reparsed since), so that it can't be taken for an earlier revision.
+        """
+        revision = self._attribute_revisions.get(info.fullname)
+        if revision is None:
+            revision = self._bump_attribute_revision(info)
+        return revision
+
+    def _init_signature_token(
+        self,
+        info: mypy.nodes.TypeInfo,
+        default_signature: mypy.types.CallableType,
+    ) -> tuple[object, ...]:
+        """
+        A cheap stand-in for `_init_signature_fingerprint`, for telling whether a memoized initializer signature
+        is still current: the classes of the model's MRO (compared by identity, as a class reloaded from the cache
+        is a new object) along with the revisions of their attributes, and the initializer's definition.
+        """
+        token: list[object] = [default_signature.definition]
+        for base in info.mro:
+            token.append((base, self._get_attribute_revision(base)))
+        return tuple(token)
+
+    def _build_model_init_signature(
+        self,
+        ctx: FunctionSigContext,
+        model_typeinfo: mypy.nodes.TypeInfo,
+    ) -> mypy.types.CallableType | None:
+        """
+        Builds a model's initializer signature from the attributes of the model and its bases.
+        """
+        args = self._get_init_attribute_types(ctx, model_typeinfo)
 
         # substitute hash/range key types
         hash_key_type: mypy.types.Type = mypy.types.NoneTyp()
         range_key_type: mypy.types.Type = mypy.types.NoneTyp()
-        for attr_data in _pynamodb_attributes_metadata(model_instance.type).values():
-            if attr_data["is_hash_key"]:
-                hash_key_type = _rehydrate_type(ctx.api, attr_data["type"])
-            if attr_data["is_range_key"]:
-                range_key_type = _rehydrate_type(ctx.api, attr_data["type"])
+        metadata = _read_pynamodb_metadata(model_typeinfo)
+        if metadata:
+            for attr_name, (_, flags) in metadata["attributes"].items():
+                if flags & AttributeFlags.HASH_KEY:
+                    hash_key_type = self._get_attribute_type(ctx.api, model_typeinfo, attr_name, metadata, ctx.context)
+                if flags & AttributeFlags.RANGE_KEY:
+                    range_key_type = self._get_attribute_type(ctx.api, model_typeinfo, attr_name, metadata, ctx.context)
 
         # substitute the **kwargs with the named arguments based on model's attributes
         try:
@@ -125,9 +1386,12 @@ class PynamodbPlugin(Plugin):
             range_key_idx = ctx.default_signature.arg_names.index("range_key")
             kwargs_idx = ctx.default_signature.arg_kinds.index(ArgKind.ARG_STAR2)
         except ValueError:
-            ctx.api.fail(f"Unexpected signature '{ctx.default_signature}' for a PynamoDB model initializer: "
-                         "expecting 'hash_key', 'range_key' and a keywords argument", ctx.context)
-            return ctx.default_signature
+            ctx.api.fail(
+                f"Unexpected signature '{ctx.default_signature}' for a PynamoDB model initializer: "
+                "expecting 'hash_key', 'range_key' and a keywords argument",
+                ctx.context,
+            )
+            return None
         else:
             arg_kinds = ctx.default_signature.arg_kinds.copy()
             arg_names = ctx.default_signature.arg_names.copy()
@@ -143,30 +1407,232 @@ class PynamodbPlugin(Plugin):
                 arg_types=arg_types,
             )
 
-    def _get_function_hook__pynamodb_attribute__init__(self, ctx: FunctionContext) -> mypy.types.Type:
+    def _build_map_attribute_init_signature(
+        self,
+        ctx: FunctionSigContext,
+        map_typeinfo: mypy.nodes.TypeInfo,
+    ) -> mypy.types.CallableType | None:
         """
-        Handles attribute instantiation, e.g. MyAttribute(null=True)
+        Builds a map attribute's initializer signature from the attributes of the map and its bases, along with
+        the arguments of an attribute's initializer (e.g. 'null'), as a map is initialized both as a value
+        (e.g. `Address(city='Paris')`) and as a model's attribute (e.g. `address = Address(null=True)`).
         """
-        self._inspect_pynamodb_attribute_init(ctx)
-        return ctx.default_return_type
+        if ctx.default_signature.arg_kinds != [ArgKind.ARG_STAR2]:
+            return None  # the map's initializer is overridden
+        internal_api = ctx.api
+        assert isinstance(internal_api, mypy.checker.TypeChecker)
 
-    def _get_attribute_hook__pynamodb_model(
+        attribute_typeinfo = next(base for base in map_typeinfo.mro if base.fullname == PYNAMODB_ATTRIBUTE_FULL_NAME)
+        attribute_init = mypy.checkmember.type_object_type(attribute_typeinfo, internal_api.named_type)
+        assert isinstance(attribute_init, mypy.types.CallableType)
+        # the map's attributes come first, and prevail over the initializer's arguments of the same names
+        args = self._get_init_attribute_types(ctx, map_typeinfo)
+        for arg_name, arg_type in zip(attribute_init.arg_names, attribute_init.arg_types):
+            assert arg_name is not None
+            args.setdefault(arg_name, erase_typevars(arg_type))
+        return ctx.default_signature.copy_modified(
+            arg_kinds=[ArgKind.ARG_NAMED_OPT] * len(args),
+            arg_names=list(args.keys()),
+            arg_types=list(args.values()),
+        )
+
+    def _get_init_attribute_types(
         self,
+        ctx: FunctionSigContext,
+        typeinfo: mypy.nodes.TypeInfo,
+    ) -> dict[str, mypy.types.Type]:
+        """
+        Returns the types of the attributes of a model (or a map attribute) and its bases, as initializer arguments.
+        """
+        args = {}
+        for cls in typeinfo.mro:
+            metadata = _read_pynamodb_metadata(cls)
+            if metadata:
+                args.update(
+                    {
+                        attr_name: self._get_attribute_type(ctx.api, cls, attr_name, metadata, ctx.context)
+                        for attr_name in metadata["attributes"]
+                    }
+                )
+        return args
+
+    def _get_key_types(
+        self,
+        ctx: MethodSigContext,
+        typeinfo: mypy.nodes.TypeInfo,
+    ) -> tuple[mypy.types.Type, mypy.types.Type | None] | None:
+        """
+        Returns the types of a model's (or an index's) hash and range keys (None if there's no range key),
+        or None if it has no hash key, memoized for the lifetime of the plugin.
+
+        The memoized types are only reused while the key attributes are the same ones, of the same serialized
+        types and flags, e.g. until a key attribute is changed, or becomes a key attribute of another class.
+        """
+        keys = [_find_key_attribute(typeinfo, flag) for flag in (AttributeFlags.HASH_KEY, AttributeFlags.RANGE_KEY)]
+        token = []
+        for key in keys:
+            if key:
+                info, attr_name, metadata = key
+                type_idx, flags = metadata["attributes"][attr_name]
+                token.append((info.fullname, attr_name, metadata["types"][type_idx], flags))
+        try:
+            return self._key_types.lookup(typeinfo.fullname, token)
+        except KeyError:
+            pass
+
+        hash_key, range_key = keys
+        if hash_key is None:
+            return None
+        hash_key_type = self._get_attribute_type(ctx.api, *hash_key, ctx.context)
+        range_key_type = self._get_attribute_type(ctx.api, *range_key, ctx.context) if range_key else None
+        return self._key_types.store(typeinfo.fullname, (hash_key_type, range_key_type), token)
+
+    def _get_attribute_type(
+        self,
+        api: mypy.plugin.CheckerPluginInterface,
         model_typeinfo: mypy.nodes.TypeInfo,
         attr_name: str,
-        ctx: AttributeContext,
+        metadata: PynamodbMetadataDict,
+        context: mypy.nodes.Context,
     ) -> mypy.types.Type:
         """
-        Called when a model's attribute is referenced, used to determine the attribute's type:
-        this generally works well even without the plugin (thanks for mypy supporting the Descriptor protocol),
-        the nullability (support for `null=True`) is what's being added here.
+        Returns the rehydrated type of a model's attribute, memoized for the lifetime of the plugin.
+        An attribute recorded lazily is resolved here, the first time it's needed.
+
+        The memoized type is only reused while the metadata still holds the same serialized type and flags:
+        metadata rewritten by `_inspect_pynamodb_attribute_init`, or reloaded from the incremental cache
+        (e.g. after a dmypy update), gets rehydrated afresh when it differs.
         """
-        attr_data = _pynamodb_attributes_metadata(model_typeinfo).get(attr_name)
-        if not attr_data:  # pragma: no cover
-            return ctx.default_attr_type
-        return _rehydrate_type(ctx.api, attr_data["type"])
+        type_idx, flags = metadata["attributes"][attr_name]
+        data = metadata["types"][type_idx]
+        key = (model_typeinfo.fullname, attr_name)
+        token = (data, flags)
+        try:
+            return self._attribute_types.lookup(key, token)
+        except KeyError:
+            pass
 
-    # utils
+        attr_type = self._rehydrate_type(api, data)
+        if flags & AttributeFlags.LAZY:
+            assert isinstance(api, mypy.checker.TypeChecker)
+            resolved_type = self._resolve_attribute_type(context, api, attr_type, AttributeFlags(flags))
+            if not resolved_type:  # pragma: no cover
+                return mypy.types.AnyType(mypy.types.TypeOfAny.from_error)
+            attr_type = resolved_type
+        return self._attribute_types.store(key, attr_type, token)
+
+    def _resolve_attribute_type(
+        self,
+        context: mypy.nodes.Context,
+        chk: mypy.checker.TypeChecker,
+        attr_instance: mypy.types.Type,
+        flags: AttributeFlags,
+    ) -> mypy.types.Type | None:
+        """
+        Resolves the type of a model's attribute from the attribute's own type, e.g. 'Optional[builtins.float]'
+        from a nullable 'NumberAttribute'.
+        """
+        # A PynamoDB attribute is a Python descriptor (https://docs.python.org/3/howto/descriptor.html)
+        attr_type = self._get_descriptor_access_type(context, chk, attr_instance)
+        if not attr_type:  # pragma: no cover
+            chk.fail("PynamoDB attribute does not act as a data descriptor (does it have __get__?)", context)
+            return None
+        if flags & AttributeFlags.NULLABLE:
+            attr_type = make_optional_type(attr_type)
+        return attr_type
+
+    # Module-level helpers are called through these, so that they can be instrumented (see `_profiling`).
+
+    def _rehydrate_type(self, api: mypy.plugin.CheckerPluginInterface, data: SerializedType) -> mypy.types.Type:
+        return _rehydrate_type(api, data)
+
+    def _analyze_descriptor_access(
+        self,
+        ctx: mypy.nodes.Context,
+        chk: mypy.checker.TypeChecker,
+        descriptor: mypy.types.Type,
+    ) -> mypy.types.Type | None:
+        return get_descriptor_access_type(ctx, chk, descriptor)
+
+    def _get_descriptor_access_type(
+        self,
+        ctx: mypy.nodes.Context,
+        chk: mypy.checker.TypeChecker,
+        descriptor: mypy.types.Type,
+    ) -> mypy.types.Type | None:
+        """
+        Returns the type that reading an attribute gives, i.e. that its descriptor's `__get__` returns.
+
+        It only depends on the attribute's type (its class and type arguments), so it's only analyzed once per
+        attribute type (and not at all for the built-in attributes), rather than for each attribute.
+        Like `_lookup_pynamodb_type`'s verdicts, the types are memoized until a module is (re)parsed.
+        """
+        descriptor_instance = mypy.types.get_proper_type(descriptor)
+        if not isinstance(descriptor_instance, mypy.types.Instance):  # pragma: no cover
+            return self._analyze_descriptor_access(ctx, chk, descriptor)
+        try:
+            return self._descriptor_types.lookup(descriptor_instance)
+        except KeyError:
+            pass
+
+        builtin_type = BUILTIN_DESCRIPTOR_TYPES.get(descriptor_instance.type.fullname)
+        if builtin_type is not None and not descriptor_instance.args:
+            attr_type: mypy.types.Type | None = self._rehydrate_type(chk, builtin_type)
+        else:
+            attr_type = self._analyze_descriptor_access(ctx, chk, descriptor)
+        return self._descriptor_types.store(descriptor_instance, attr_type)
+
+    def _lookup_pynamodb_type(self, fullname: str) -> tuple[str, mypy.nodes.TypeInfo] | None:
+        """
+        Looks up a type by its fullname and tells which PynamoDB base class (model or attribute) it derives from.
+
+        Returns the base class fullname along with the type's info, or None if it's not a PynamoDB type
+        (or not a type at all). Mypy asks the plugin about every call and attribute access in the program,
+        most of which have nothing to do with PynamoDB, so verdicts (negative ones included) are memoized
+        until a module is (re)parsed.
+        """
+        try:
+            return self._pynamodb_types.lookup(fullname)
+        except KeyError:
+            pass
+
+        pynamodb_type = None
+        sym = self.lookup_fully_qualified(fullname)
+        if sym and isinstance(sym.node, TypeInfo):
+            for base_fullname in (PYNAMODB_MODEL_FULL_NAME, PYNAMODB_ATTRIBUTE_FULL_NAME, PYNAMODB_INDEX_FULL_NAME):
+                if sym.node.has_base(base_fullname):
+                    pynamodb_type = (base_fullname, sym.node)
+                    break
+        return self._pynamodb_types.store(fullname, pynamodb_type)
+
+    def _get_class_assignments(self, info: mypy.nodes.TypeInfo) -> dict[int, mypy.nodes.AssignmentStmt]:
+        """
+        Returns the assignment statements in a class body, indexed by the identity of their r.h.s. expressions.
+
+        The index is built once per class body (on the first attribute the checker meets in it) rather than
+        scanning the body for each attribute. A re-parsed class (e.g. in a dmypy update) has a new body and
+        gets a new index.
+        """
+        body = info.defn.defs
+        try:
+            return self._class_assignments.lookup(info.fullname, body)
+        except KeyError:
+            pass
+        assignments = {id(stmt.rvalue): stmt for stmt in body.body if isinstance(stmt, mypy.nodes.AssignmentStmt)}
+        return self._class_assignments.store(info.fullname, assignments, body)
+
+    def _get_calls_in_loops(self, tree: mypy.nodes.MypyFile) -> set[int]:
+        """
+        Returns the identities of the call expressions within loops in a module (see `find_calls_in_loops`).
+
+        The module's tree is traversed once (on the first single-item operation the checker meets in it).
+        A re-parsed module (e.g. in a dmypy update) has a new tree and gets traversed anew.
+        """
+        try:
+            return self._calls_in_loops.lookup(tree.fullname, tree)
+        except KeyError:
+            pass
+        return self._calls_in_loops.store(tree.fullname, find_calls_in_loops(tree), tree)
 
     def _inspect_pynamodb_attribute_init(self, ctx: FunctionContext) -> None:
         """
@@ -187,50 +1653,52 @@ class PynamodbPlugin(Plugin):
             return
 
         # Determine which class var name we're assigned to (to know the attribute's pythonic name)
-        for stmt in scope_cls.defn.defs.body:
-            if isinstance(stmt, mypy.nodes.AssignmentStmt) and stmt.rvalue is ctx.context:
-                if len(stmt.lvalues) != 1:  # pragma: no cover
-                    ctx.api.fail(f"PynamoDB attribute assigned to {len(stmt.lvalues)} names in a model", stmt)
-                    continue
-                lvalue = stmt.lvalues[0]
-                if not isinstance(lvalue, mypy.nodes.NameExpr):  # pragma: no cover
-                    ctx.api.fail("PynamoDB attribute assigned to non-name", stmt)
-                    continue
-
-                attr_name = lvalue.name
-                break
-        else:
+        stmt = self._get_class_assignments(scope_cls).get(id(ctx.context))
+        if stmt is None:
             ctx.api.fail("PynamoDB attribute not assigned to a class variable", ctx.context)
             return
-
-        # A PynamoDB attribute is a Python descriptor (https://docs.python.org/3/howto/descriptor.html)
-        attr_type = get_descriptor_access_type(ctx.context, internal_api, attr_instance)
-        if not attr_type:  # pragma: no cover
-            ctx.api.fail("PynamoDB attribute does not act as a data descriptor (does it have __get__?)", ctx.context)
+        if len(stmt.lvalues) != 1:  # pragma: no cover
+            ctx.api.fail(f"PynamoDB attribute assigned to {len(stmt.lvalues)} names in a model", stmt)
+            ctx.api.fail("PynamoDB attribute not assigned to a class variable", ctx.context)
             return
+        lvalue = stmt.lvalues[0]
+        if not isinstance(lvalue, mypy.nodes.NameExpr):  # pragma: no cover
+            ctx.api.fail("PynamoDB attribute assigned to non-name", stmt)
+            ctx.api.fail("PynamoDB attribute not assigned to a class variable", ctx.context)
+            return
+        attr_name = lvalue.name
 
-        def _get_named_arg(arg_name: str) -> mypy.nodes.Expression | None:
-            for names, args in zip(ctx.arg_names, ctx.args):
-                for name, arg in zip(names, args):
-                    if name == arg_name:
-                        return arg
-            return None
-
-        def _check_literal_bool(arg_name: str, default: bool) -> bool:
-            arg_expr = _get_named_arg(arg_name)
-            if arg_expr is None:
-                return default
-            if not isinstance(arg_expr, NameExpr) or arg_expr.fullname not in ("builtins.False", "builtins.True"):
-                ctx.api.fail(f"'{arg_name}' argument is not constant False or True", ctx.context)
-                return default
-
-            return arg_expr.fullname == "builtins.True"
+        flags = AttributeFlags(0)
+        if _check_literal_bool(ctx, "null", False):
+            flags |= AttributeFlags.NULLABLE
+        if _check_literal_bool(ctx, "hash_key", False):
+            flags |= AttributeFlags.HASH_KEY
+        if _check_literal_bool(ctx, "range_key", False):
+            flags |= AttributeFlags.RANGE_KEY
 
-        if _check_literal_bool("null", False):
-            attr_type = make_optional_type(attr_type)
+        if self._lazy:
+            # record the attribute itself, to be resolved once needed (see `_get_attribute_type`)
+            attr_type = attr_instance
+            flags |= AttributeFlags.LAZY
+        else:
+            resolved_type = self._resolve_attribute_type(ctx.context, internal_api, attr_instance, flags)
+            if not resolved_type:  # pragma: no cover
+                return
+            attr_type = resolved_type
 
-        _pynamodb_attributes_metadata(scope_cls)[attr_name] = PynamodbAttributeDict(
-            type=attr_type.serialize(),
-            is_hash_key=_check_literal_bool("hash_key", False),
-            is_range_key=_check_literal_bool("range_key", False),
-        )
+        self._attribute_types.discard((scope_cls.fullname, attr_name))
+        metadata = _write_pynamodb_metadata(scope_cls)
+        self._bump_attribute_revision(scope_cls)
+        if metadata["projection"] is None and scope_cls.has_base(PYNAMODB_INDEX_FULL_NAME):
+            metadata["projection"] = _get_index_projection(scope_cls)
+        metadata["attributes"][attr_name] = [_intern_type(metadata, attr_type.serialize()), int(flags)]
+        attr_name_arg = _get_named_arg(ctx, "attr_name")
+        if isinstance(attr_name_arg, mypy.nodes.StrExpr) and attr_name_arg.value != attr_name:
+            metadata["attr_names"][attr_name] = attr_name_arg.value
+        else:
+            metadata["attr_names"].pop(attr_name, None)
+        # The attributes are recorded in the order they're declared (see `_get_base_class_hook__pynamodb`), so once
+        # the last one is, the types the attributes no longer refer to are dropped, once per class body rather than
+        # on each attribute (which would be quadratic in the number of attributes).
+        if next(reversed(metadata["attributes"])) == attr_name:
+            _compact_types(metadata)
@@ -0,0 +1,362 @@
+"""
+Generates stubs (.pyi files) for modules declaring PynamoDB models, for codebases (or tools) that use the models
+without loading the plugin:
+
+    python -m pynamodb_mypy.stubgen -o stubs app/models
+
+The modules are type-checked with the plugin once. In their stubs, each model (and map attribute) has an explicit
+initializer, typed as the plugin types it (see `_get_function_signature_hook__pynamodb_model__init__`), and each
+attribute is declared such that reading it gives its type, nullable or not, e.g.
+
+    class User(Model):
+        user_id: UnicodeAttribute
+        nickname: _NullableUnicodeAttribute
+        def __init__(self, hash_key: str = ..., range_key: None = ..., _user_instantiated: bool = ..., *,
+                     user_id: str = ..., nickname: str | None = ...) -> None: ...
+
+    class _NullableUnicodeAttribute(UnicodeAttribute):
+        @overload  # type: ignore[override]
+        def __get__(self, instance: None, owner: Any) -> _NullableUnicodeAttribute: ...
+        @overload
+        def __get__(self, instance: Any, owner: Any) -> str | None: ...
+
+The rest of the stubs is as mypy's stubgen generates it. With --check, the stubs are verified to be up to date
+rather than written, e.g. in CI.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from typing import Sequence
+
+import mypy.build
+import mypy.checker
+import mypy.nodes
+import mypy.state
+import mypy.stubgen
+import mypy.types
+from mypy.checkmember import type_object_type
+from mypy.nodes import TypeInfo
+from mypy.plugin import FunctionSigContext
+
+from pynamodb_mypy.plugin import _is_typed_map_attribute
+from pynamodb_mypy.plugin import _read_pynamodb_metadata
+from pynamodb_mypy.plugin import AttributeFlags
+from pynamodb_mypy.plugin import PYNAMODB_INDEX_FULL_NAME
+from pynamodb_mypy.plugin import PYNAMODB_MAP_ATTRIBUTE_FULL_NAME
+from pynamodb_mypy.plugin import PYNAMODB_MODEL_FULL_NAME
+from pynamodb_mypy.plugin import PynamodbPlugin
+
+
+# the class definitions (and their indentation) in mypy's stubgen's output
+CLASS_LINE_RE = re.compile(r"^(?P<indent> *)class (?P<name>\w+)\b.*:(?P<empty> \.\.\.)?$")
+
+# the attribute declarations (in a class' body) in mypy's stubgen's output
+ATTRIBUTE_LINE_RE = re.compile(r"^(?P<indent> *)(?P<name>\w+): ")
+
+
+class _ModelStubGenerator:
+    """
+    Generates a module's stub, declaring its models' (and map attributes') initializers and attributes
+    as the plugin types them.
+
+    The stub is generated by mypy's stubgen, then amended: mypy's own classes are compiled (in its wheels),
+    so they're used as they are rather than derived from.
+    """
+
+    def __init__(
+        self,
+        _all_: list[str] | None,
+        *,
+        plugin: PynamodbPlugin,
+        checker: mypy.checker.TypeChecker,
+    ) -> None:
+        self._stubgen = mypy.stubgen.StubGenerator(_all_, analyzed=True)
+        self._plugin = plugin
+        self._checker = checker
+        # the classes of nullable attributes, by their bases and the types reading them gives
+        self._nullable_attribute_classes: dict[tuple[str, str], str] = {}
+
+    def generate(self, tree: mypy.nodes.MypyFile) -> str:
+        """
+        Returns the stub of a module.
+        """
+        tree.accept(self._stubgen)
+        imports, body = self._split_imports(self._stubgen.output())
+        lines = self._amend_classes(tree, body.splitlines(keepends=True))
+        for (base, value_type), name in self._nullable_attribute_classes.items():
+            lines.append(
+                f"\nclass {name}({base}):\n"
+                f"    @overload  # type: ignore[override]\n"
+                f"    def __get__(self, instance: None, owner: Any) -> {name}: ...\n"
+                f"    @overload\n"
+                f"    def __get__(self, instance: Any, owner: Any) -> {value_type}: ...\n"
+            )
+        body = "".join(lines)
+        if not re.search(r"\bIncomplete\b", body):
+            # the declarations mypy's stubgen couldn't type were all replaced
+            self._stubgen.import_tracker.required_names.discard("Incomplete")
+        imports, _ = self._split_imports(self._stubgen.output())
+        return imports + body
+
+    @staticmethod
+    def _split_imports(stub: str) -> tuple[str, str]:
+        """
+        Splits a stub generated by mypy's stubgen into its imports (which are all at its top) and the rest.
+        """
+        lines = stub.splitlines(keepends=True)
+        num_import_lines = 0
+        while num_import_lines < len(lines) and lines[num_import_lines].startswith(("import ", "from ")):
+            num_import_lines += 1
+        if num_import_lines < len(lines) and num_import_lines and lines[num_import_lines] == "\n":
+            num_import_lines += 1
+        return "".join(lines[:num_import_lines]), "".join(lines[num_import_lines:])
+
+    def _amend_classes(self, tree: mypy.nodes.MypyFile, lines: list[str]) -> list[str]:
+        """
+        Declares the attributes of the classes in a stub's lines, and adds their initializers, as needed.
+        """
+        amended: list[str] = []
+        # the classes whose bodies the line's in, innermost last, along with their indentation and initializers
+        classes: list[tuple[str, TypeInfo | None, str | None]] = []
+        for line in lines:
+            if line.strip():
+                indent = line[: len(line) - len(line.lstrip(" "))]
+                while classes and len(classes[-1][0]) >= len(indent):
+                    self._end_class(amended, *classes.pop())
+            class_match = CLASS_LINE_RE.match(line)
+            attribute_match = ATTRIBUTE_LINE_RE.match(line)
+            if class_match:
+                names = classes[-1][1].names if classes and classes[-1][1] else tree.names
+                symbol = names.get(class_match.group("name"))
+                info = symbol.node if symbol and isinstance(symbol.node, TypeInfo) else None
+                init = self._get_init(info) if info else None
+                if class_match.group("empty") and init:
+                    line = line[: class_match.end(0) - len(" ...")] + "\n"
+                classes.append((class_match.group("indent"), info, init))
+            elif (
+                attribute_match
+                and classes
+                and classes[-1][1]
+                and len(attribute_match.group("indent")) > len(classes[-1][0])
+            ):
+                declaration = self._get_attribute_declaration(classes[-1][1], attribute_match.group("name"))
+                if declaration:
+                    line = f"{attribute_match.group('indent')}{declaration}\n"
+            amended.append(line)
+        while classes:
+            self._end_class(amended, *classes.pop())
+        return amended
+
+    @staticmethod
+    def _end_class(lines: list[str], indent: str, info: TypeInfo | None, init: str | None) -> None:
+        """
+        Adds a class' initializer (if any) at the end of the class' body, i.e. after its last non-blank line.
+        """
+        if init:
+            idx = len(lines)
+            while not lines[idx - 1].strip():
+                idx -= 1
+            lines.insert(idx, f"{indent}    {init}\n")
+
+    def _get_init(self, info: TypeInfo) -> str | None:
+        """
+        Returns a model's (or a typed map attribute's) initializer declaration,
+        unless the initializer is overridden (by the class, or by a base).
+        """
+        init = info.get_method("__init__")
+        if not (
+            init
+            and info is not init.info
+            and (
+                (info.has_base(PYNAMODB_MODEL_FULL_NAME) and init.info.fullname == PYNAMODB_MODEL_FULL_NAME)
+                or (_is_typed_map_attribute(info) and init.info.fullname == PYNAMODB_MAP_ATTRIBUTE_FULL_NAME)
+            )
+        ):
+            return None
+
+        default_signature = type_object_type(info, self._checker.named_type)
+        if not isinstance(default_signature, mypy.types.CallableType):  # pragma: no cover
+            return None
+        ctx = FunctionSigContext(args=[], default_signature=default_signature, context=info.defn, api=self._checker)
+        signature = self._plugin._get_function_signature_hook__pynamodb_model__init__(ctx)
+        assert isinstance(signature, mypy.types.CallableType)
+
+        # the hook leaves the hash and range keys positional, replacing the keywords argument with the attributes
+        args = ["self"]
+        for kind, name, typ in zip(signature.arg_kinds, signature.arg_names, signature.arg_types):
+            if kind.is_named() and "*" not in args:
+                args.append("*")
+            args.append(f"{name}: {self._print_type(typ)}" + (" = ..." if kind.is_optional() else ""))
+        return f"def __init__({', '.join(args)}) -> None: ..."
+
+    def _get_attribute_declaration(self, info: TypeInfo, attr_name: str) -> str | None:
+        metadata = _read_pynamodb_metadata(info)
+        symbol = info.names.get(attr_name)
+        if not (metadata and symbol and isinstance(symbol.node, mypy.nodes.Var)):
+            return None
+        attr_type = mypy.types.get_proper_type(symbol.node.type)
+        if not isinstance(attr_type, mypy.types.Instance):
+            return None
+        if attr_name not in metadata["attributes"]:
+            # e.g. a model's index, which isn't an attribute, but is typed after its class alone
+            if attr_type.type.has_base(PYNAMODB_INDEX_FULL_NAME):
+                return f"{attr_name}: {self._print_type(attr_type)}"
+            return None
+
+        attr_class = self._print_type(attr_type)
+        _, flags = metadata["attributes"][attr_name]
+        if flags & AttributeFlags.NULLABLE:
+            value_type = self._plugin._get_attribute_type(self._checker, info, attr_name, metadata, symbol.node)
+            attr_class = self._get_nullable_attribute_class(attr_type, attr_class, self._print_type(value_type))
+        return f"{attr_name}: {attr_class}"
+
+    def _get_nullable_attribute_class(self, attr_type: mypy.types.Instance, base: str, value_type: str) -> str:
+        """
+        Returns the name of a class deriving from a nullable attribute's class, such that reading the attribute
+        gives its (optional) type, declaring it if needed.
+        """
+        name = self._nullable_attribute_classes.get((base, value_type))
+        if name is None:
+            name = f"_Nullable{attr_type.type.name}"
+            taken_names = set(self._nullable_attribute_classes.values()) | self._stubgen.defined_names
+            if name in taken_names:
+                name += str(sum(taken_name.startswith(name) for taken_name in taken_names) + 1)
+            self._nullable_attribute_classes[(base, value_type)] = name
+            self._require_name("typing", "overload")
+            self._require_name("typing", "Any")
+        return name
+
+    def _print_type(self, t: mypy.types.Type) -> str:
+        """
+        Prints an (analyzed) type for the stub, importing the types it refers to.
+        """
+        t = mypy.types.get_proper_type(t)
+        if isinstance(t, mypy.types.Instance):
+            s = self._import_type(t.type)
+            if t.args:
+                s += f"[{', '.join(self._print_type(arg) for arg in t.args)}]"
+            return s
+        if isinstance(t, mypy.types.UnionType):
+            return " | ".join(self._print_type(item) for item in t.items)
+        if isinstance(t, mypy.types.NoneType):
+            return "None"
+        if isinstance(t, mypy.types.AnyType):
+            return self._require_name("typing", "Any")
+        if isinstance(t, mypy.types.CallableType):
+            args = "..." if t.is_ellipsis_args else f"[{', '.join(self._print_type(arg) for arg in t.arg_types)}]"
+            return f"{self._require_name('typing', 'Callable')}[{args}, {self._print_type(t.ret_type)}]"
+        return self._require_name("_typeshed", "Incomplete")  # pragma: no cover (as mypy's stubgen would)
+
+    def _require_name(self, module: str, name: str) -> str:
+        self._stubgen.import_tracker.add_import_from(module, [(name, None)])
+        self._stubgen.import_tracker.require_name(name)
+        return name
+
+    def _import_type(self, info: TypeInfo) -> str:
+        """
+        Returns the name a type is referred to by in the stub, importing it if needed.
+        """
+        module = info.module_name
+        name = info.fullname[len(module) + 1 :]
+        if module in ("builtins", self._stubgen.module):
+            return name
+        top_level_name = name.split(".")[0]
+        if top_level_name in self._stubgen.defined_names:
+            # would clash with a name defined in the module
+            self._stubgen.import_tracker.add_import(module)
+            self._stubgen.import_tracker.require_name(module)
+            return f"{module}.{name}"
+        return self._require_name(module, top_level_name) + name[len(top_level_name) :]
+
+
+def generate_stubs(files: Sequence[str], *, output_dir: str = "out") -> dict[str, str]:
+    """
+    Generates the stubs of modules, given as files or directories (of packages), type-checking them with the plugin.
+
+    :return: the stubs' text, by their paths within the output directory
+    """
+    stubgen_options = mypy.stubgen.Options(
+        pyversion=sys.version_info[:2],
+        no_import=True,
+        doc_dir="",
+        search_path=[],
+        interpreter=sys.executable,
+        parse_only=False,
+        ignore_errors=False,
+        include_private=False,
+        output_dir=output_dir,
+        modules=[],
+        packages=[],
+        files=list(files),
+        verbose=False,
+        quiet=True,
+        export_less=False,
+    )
+    options = mypy.stubgen.mypy_options(stubgen_options)
+    # the models' attributes are only typed once the modules (and the modules they import) are type-checked
+    options.semantic_analysis_only = False
+    options.follow_imports = "silent"
+    options.preserve_asts = True
+    py_modules, _ = mypy.stubgen.collect_build_targets(stubgen_options, options)
+    plugin = PynamodbPlugin(options)
+    result = mypy.build.build([module.source for module in py_modules], options, extra_plugins=[plugin])
+
+    stubs = {}
+    for module in py_modules:
+        assert module.path is not None
+        state = result.graph[module.module]
+        assert state.tree is not None
+        generator = _ModelStubGenerator(
+            result.manager.semantic_analyzer.export_map[module.module],
+            plugin=plugin,
+            checker=state.type_checker(),
+        )
+        # the types are built as they are while type-checking, e.g. with unions keeping their "None" items
+        with mypy.state.state.strict_optional_set(options.strict_optional):
+            stub = generator.generate(state.tree)
+        target = module.module.replace(".", "/")
+        target += "/__init__.pyi" if os.path.basename(module.path) == "__init__.py" else ".pyi"
+        stubs[os.path.join(output_dir, target)] = stub
+    return stubs
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m pynamodb_mypy.stubgen",
+        description="Generates stubs for modules declaring PynamoDB models, typed as the plugin types them.",
+    )
+    parser.add_argument("files", nargs="+", help="the files or directories (of packages) to generate stubs for")
+    parser.add_argument("-o", "--output-dir", default="out", help="the directory to write to (default: out)")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="verify that the stubs in the output directory are up to date, rather than writing them",
+    )
+    args = parser.parse_args(argv)
+
+    stubs = generate_stubs(args.files, output_dir=args.output_dir)
+    if args.check:
+        outdated = []
+        for path, text in stubs.items():
+            try:
+                with open(path) as f:
+                    current = f.read() == text
+            except FileNotFoundError:
+                current = False
+            if not current:
+                outdated.append(path)
+                print(f"{path} is out of date", file=sys.stderr)
+        return 1 if outdated else 0
+
+    for path, text in stubs.items():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(text)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -1,3 +1,33 @@
+import os
+
 from setuptools import setup
 
-setup()
+# Set to compile the plugin's hot paths with mypyc (as mypy itself is), e.g. for building platform wheels.
+# mypy needs to be installed in the build environment, e.g. `pip install --no-build-isolation .`
+USE_MYPYC_ENV_VAR = "PYNAMODB_MYPY_USE_MYPYC"
+
+ext_modules = []
+install_requires = None
+if os.environ.get(USE_MYPYC_ENV_VAR, "").lower() not in ("", "0", "false", "no"):
+    from mypy.version import __version__ as mypy_version
+    from mypyc.build import mypycify
+
+    # Only the modules mypy calls into throughout a build; the rest (e.g. the CLIs, or the modules deriving from
+    # mypy's own classes, which mypyc can't derive from when compiled separately) stay interpreted.
+    ext_modules = mypycify(
+        [
+            "pynamodb_mypy/_cache.py",
+            "pynamodb_mypy/plugin.py",
+            # Compiled separately, mypyc reuses mypy's incremental cache, and generates no code for the modules
+            # that are fresh in it (e.g. when setup.py's run again for building a wheel after its metadata).
+            f"--cache-dir={os.devnull}",
+        ],
+        # Compiled as a whole, mypyc would take the plugin's class to have no subclasses other than those it compiles,
+        # and have its methods reject interpreted subclasses' instances (e.g. `ProfilingPynamodbPlugin`).
+        separate=True,
+    )
+    # The compiled modules call into mypy's own compiled modules, which are only compatible with the mypy version
+    # they're compiled against (in place of setup.cfg's requirement, which the pure-Python wheel keeps).
+    install_requires = [f"mypy=={mypy_version}"]
+
+setup(ext_modules=ext_modules, install_requires=install_requires)
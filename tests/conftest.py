@@ -1,10 +1,58 @@
 import pytest
 
+from tests.mypy_helpers import DmypyAssert
 from tests.mypy_helpers import MypyAssert
+from tests.mypy_helpers import MypyBatch
+
+
+@pytest.fixture(scope="session")
+def mypy_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """
+    A mypy cache directory holding only the tests' dependencies (typeshed and pynamodb), so that they're analyzed
+    once per test session rather than once per test. Tests only seed private copies of it, so that their own
+    modules are never found fresh in it (e.g. across plugin changes, or tests monkeypatching the plugin).
+    """
+    from .mypy_helpers import seed_mypy_cache
+
+    cache_dir = str(tmp_path_factory.mktemp("mypy_cache"))
+    seed_mypy_cache(cache_dir)
+    return cache_dir
+
+
+@pytest.fixture(scope="session")
+def mypy_batch(request: pytest.FixtureRequest, mypy_cache_dir: str) -> MypyBatch:
+    """
+    The programs of the tests (of the session) that check nothing but a program, checked in a single mypy run
+    rather than one per test.
+    """
+    from .mypy_helpers import batched_program
+
+    programs = {}
+    for item in request.session.items:
+        program = batched_program(item.function) if isinstance(item, pytest.Function) else None
+        if program is not None:
+            programs[item.nodeid] = program
+    return MypyBatch(programs, cache_dir=mypy_cache_dir)
 
 
 @pytest.fixture
-def assert_mypy_output(pytestconfig: pytest.Config) -> MypyAssert:
+def assert_mypy_output(
+    request: pytest.FixtureRequest,
+    pytestconfig: pytest.Config,
+    mypy_cache_dir: str,
+    mypy_batch: MypyBatch,
+) -> MypyAssert:
     from .mypy_helpers import assert_mypy_output
 
-    return lambda program: assert_mypy_output(program, use_pdb=pytestconfig.getoption("usepdb"))
+    use_pdb = pytestconfig.getoption("usepdb")
+    if request.node.nodeid in mypy_batch and not use_pdb:
+        # batched tests check nothing but their programs (see `batched_program`)
+        return lambda program, modules=None: mypy_batch.assert_mypy_output(request.node.nodeid, program)
+    return lambda program, **kwargs: assert_mypy_output(program, cache_dir=mypy_cache_dir, use_pdb=use_pdb, **kwargs)
+
+
+@pytest.fixture
+def assert_dmypy_output() -> DmypyAssert:
+    from .mypy_helpers import assert_dmypy_output
+
+    return assert_dmypy_output
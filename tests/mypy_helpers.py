@@ -1,3 +1,6 @@
+import ast
+import glob
+import inspect
 import os
 import re
 import shutil
@@ -5,31 +8,132 @@ import sys
 from collections import defaultdict
 from tempfile import TemporaryDirectory
 from textwrap import dedent
+from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Iterable
 from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Protocol
 from typing import Tuple
 
 import mypy.api
+from mypy.config_parser import parse_config_file
+from mypy.dmypy_server import Server
+from mypy.modulefinder import BuildSource
+from mypy.options import Options
 
 ERROR_COMMENT_RE = re.compile(r"(\s+# ([NWE]): .*)?$")
 
+# imports the modules the programs under test depend on, for seeding a mypy cache with them
+SEED_PROGRAM = """
+import datetime
+import typing
 
-def _run_mypy(program: str, *, use_pdb: bool) -> Iterable[str]:
+import typing_extensions
+from pynamodb.attributes import Attribute
+from pynamodb.expressions.condition import Condition
+from pynamodb.indexes import Index
+from pynamodb.models import Model
+"""
+
+
+def _write_modules(dirname: str, modules: Mapping[str, str]) -> List[BuildSource]:
+    sources = []
+    for module_name, module_source in modules.items():
+        path = f"{dirname}/{module_name}.py"
+        with open(path, "w") as f:
+            f.write(dedent(module_source))
+        sources.append(BuildSource(path, module_name))
+    return sources
+
+
+def _annotate_program(
+    program: str,
+    path: str,
+    output_lines: Iterable[str],
+    *,
+    module_name: str = "__main__",
+) -> Iterable[str]:
+    """
+    Reconstructs the "actual" program, i.e. the program annotated with the errors mypy reported for it.
+
+    :param module_name: the name the program was checked as; it's reported as '__main__' regardless
+    """
+    error_pattern = re.compile(
+        rf"^{re.escape(path)}:" r"(?P<line>\d+): (?P<level>note|warning|error): (?P<message>.*)$"
+    )
+    module_name_pattern = re.compile(rf"\b{re.escape(module_name)}\.")
+
+    # Group errors by line
+    messages_by_line: Dict[int, List[Tuple[str, str]]] = defaultdict(list)
+    for line in output_lines:
+        m = error_pattern.match(line)
+        if m:
+            message = module_name_pattern.sub("__main__.", m.group("message"))
+            messages_by_line[int(m.group("line"))].append((m.group("level"), message))
+        elif line:
+            # print(line)  # allow "printf debugging"
+            pass
+
+    # Reconstruct the "actual" program with "error" comments
+    num_extra_lines = 0
+    for line_no, line in enumerate(program.split("\n"), start=1):
+        line = ERROR_COMMENT_RE.sub("", line)
+        if num_extra_lines > 0:
+            if not line.strip():
+                num_extra_lines -= 1
+                continue
+            else:
+                num_extra_lines = 0
+
+        messages = messages_by_line.get(line_no)
+        if messages:
+            for idx, (level, message) in enumerate(messages):
+                cmt = f"{level[0].upper()}: {message}"
+                if idx == 0:
+                    yield f"{line}  # {cmt}"
+                else:
+                    yield f'{" " * len(line)}  # {cmt}'
+                    num_extra_lines += 1
+        else:
+            yield line
+
+
+def _run_mypy(
+    programs: Mapping[str, str],
+    *,
+    modules: Optional[Mapping[str, str]],
+    cache_dir: Optional[str],
+    use_pdb: bool,
+) -> Dict[str, str]:
+    """
+    Checks programs in a single mypy run, each as a module of its own.
+
+    :param programs: the programs, by the names of the modules to check them as
+    :return: the actual programs, i.e. the programs annotated with the errors mypy reported
+    """
     with TemporaryDirectory() as tempdirname:
-        with open(f"{tempdirname}/__main__.py", "w") as f:
-            f.write(program)
         config_file = tempdirname + "/mypy.ini"
         shutil.copyfile(os.path.dirname(__file__) + "/mypy.ini", config_file)
-        error_pattern = re.compile(
-            rf"^{re.escape(f.name)}:" r"(?P<line>\d+): (?P<level>note|warning|error): (?P<message>.*)$"
-        )
+        cache_args = ["--cache-dir", f"{tempdirname}/.mypy_cache"]
+        if cache_dir:
+            # a private copy, so that neither the programs nor the modules are ever found fresh in the shared cache
+            shutil.copytree(cache_dir, f"{tempdirname}/.mypy_cache")
+        if modules:
+            # Check the modules on their own first, so that the programs see them loaded from the incremental cache
+            module_files = [source.path for source in _write_modules(tempdirname, modules) if source.path]
+            stdout, stderr, exit_status = mypy.api.run([*module_files, *cache_args, "--config-file", config_file])
+            assert exit_status == 0, stdout
+
+        sources = _write_modules(tempdirname, programs)
         mypy_args = [
-            f.name,
+            *(source.path for source in sources if source.path),
             "--show-traceback",
             "--raise-exceptions",
             "--show-error-codes",
+            *cache_args,
             "--config-file",
             config_file,
         ]
@@ -39,44 +143,145 @@ def _run_mypy(program: str, *, use_pdb: bool) -> Iterable[str]:
         if stderr:
             print(stderr, file=sys.stderr)  # allow "printf debugging" of the plugin
 
-        # Group errors by line
-        messages_by_line: Dict[int, List[Tuple[str, str]]] = defaultdict(list)
-        for line in stdout.split("\n"):
-            m = error_pattern.match(line)
-            if m:
-                messages_by_line[int(m.group("line"))].append((m.group("level"), m.group("message")))
-            elif line:
-                # print(line)  # allow "printf debugging"
-                pass
-
-        # Reconstruct the "actual" program with "error" comments
-        num_extra_lines = 0
-        for line_no, line in enumerate(program.split("\n"), start=1):
-            line = ERROR_COMMENT_RE.sub("", line)
-            if num_extra_lines > 0:
-                if not line.strip():
-                    num_extra_lines -= 1
-                    continue
-                else:
-                    num_extra_lines = 0
-
-            messages = messages_by_line.get(line_no)
-            if messages:
-                for idx, (level, message) in enumerate(messages):
-                    cmt = f"{level[0].upper()}: {message}"
-                    if idx == 0:
-                        yield f"{line}  # {cmt}"
-                    else:
-                        yield f'{" " * len(line)}  # {cmt}'
-                        num_extra_lines += 1
-            else:
-                yield line
+        output_lines = stdout.split("\n")
+        return {
+            source.module: "\n".join(
+                _annotate_program(programs[source.module], source.path or "", output_lines, module_name=source.module)
+            )
+            for source in sources
+        }
+
+
+def _run_dmypy(program: str, *, modules: Mapping[str, str], updated_modules: Mapping[str, str]) -> Iterable[str]:
+    with TemporaryDirectory() as tempdirname:
+        options = Options()
+        parse_config_file(options, lambda: None, os.path.dirname(__file__) + "/mypy.ini")
+        options.show_error_codes = True
+        server = Server(options, status_file=f"{tempdirname}/.dmypy.json")
+
+        sources = _write_modules(tempdirname, {**modules, "__main__": program})
+        response = server.check(sources, export_types=False, is_tty=False, terminal_width=-1)
+        assert response["status"] != 2, response["err"]
 
+        # the daemon picks up the changes by itself, the way it would in between two 'dmypy check' runs
+        _write_modules(tempdirname, updated_modules)
+        response = server.check(sources, export_types=False, is_tty=False, terminal_width=-1)
+        if response["err"]:
+            print(response["err"], file=sys.stderr)  # allow "printf debugging" of the plugin
 
-def assert_mypy_output(program: str, *, use_pdb: bool = False) -> None:
+        yield from _annotate_program(program, f"{tempdirname}/__main__.py", response["out"].split("\n"))
+
+
+def assert_mypy_output(
+    program: str,
+    *,
+    modules: Optional[Mapping[str, str]] = None,
+    cache_dir: Optional[str] = None,
+    use_pdb: bool = False,
+) -> None:
+    """
+    Asserts mypy's output for a program, given as the program's source annotated with the expected errors.
+
+    :param modules: modules the program can import; they're checked ahead of the program,
+                    so that the program sees them loaded from mypy's incremental cache
+    :param cache_dir: a mypy cache directory to seed the program's (private) cache with,
+                      e.g. one holding its dependencies (see `seed_mypy_cache`)
+    """
+    expected = dedent(program).strip()
+    actual = _run_mypy({"__main__": expected}, modules=modules, cache_dir=cache_dir, use_pdb=use_pdb)["__main__"]
+    assert actual == expected
+
+
+def batched_program(test_function: Callable[..., Any]) -> Optional[str]:
+    """
+    Returns the program a test checks, if that's all the test does, i.e. it takes nothing but the
+    `assert_mypy_output` fixture, and its body is a single call of it with a literal program. Such a test
+    changes nothing about how its program's checked, so the program can be checked along with others'.
+    """
+    if list(inspect.signature(test_function).parameters) != ["assert_mypy_output"]:
+        return None
+    (function_def,) = ast.parse(dedent(inspect.getsource(test_function))).body
+    assert isinstance(function_def, ast.FunctionDef)
+    if len(function_def.body) != 1:
+        return None
+    (statement,) = function_def.body
+    if not (
+        isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Call)
+        and isinstance(statement.value.func, ast.Name)
+        and statement.value.func.id == "assert_mypy_output"
+        and not statement.value.keywords
+        and len(statement.value.args) == 1
+        and isinstance(statement.value.args[0], ast.Constant)
+        and isinstance(statement.value.args[0].value, str)
+    ):
+        return None
+    return dedent(statement.value.args[0].value).strip()
+
+
+class MypyBatch:
+    """
+    Programs checked in a single mypy run (each as a module of its own), upon the first assertion about any of them,
+    with the errors mypy reports mapped back to each of them.
+    """
+
+    def __init__(self, programs: Mapping[str, str], *, cache_dir: Optional[str] = None) -> None:
+        """
+        :param programs: the programs, by test (e.g. pytest node IDs)
+        """
+        self._programs = dict(programs)
+        self._cache_dir = cache_dir
+        self._actual: Optional[Dict[str, str]] = None
+
+    def __contains__(self, test: str) -> bool:
+        return test in self._programs
+
+    def assert_mypy_output(self, test: str, program: str) -> None:
+        expected = dedent(program).strip()
+        assert expected == self._programs[test]
+        if self._actual is None:
+            module_names = {f"case_{idx}": test for idx, test in enumerate(self._programs)}
+            actual = _run_mypy(
+                {module_name: self._programs[test] for module_name, test in module_names.items()},
+                modules=None,
+                cache_dir=self._cache_dir,
+                use_pdb=False,
+            )
+            self._actual = {test: actual[module_name] for module_name, test in module_names.items()}
+        assert self._actual[test] == expected
+
+
+def seed_mypy_cache(cache_dir: str) -> None:
+    """
+    Fills a mypy cache directory with the dependencies of the programs under test (typeshed and pynamodb).
+    """
+    with TemporaryDirectory() as tempdirname:
+        sources = _write_modules(tempdirname, {"seed": SEED_PROGRAM})
+        config_file = os.path.dirname(__file__) + "/mypy.ini"
+        stdout, stderr, exit_status = mypy.api.run(
+            [*(source.path or "" for source in sources), "--cache-dir", cache_dir, "--config-file", config_file]
+        )
+        assert exit_status == 0, stdout
+    # the seed program itself isn't a dependency of any program under test
+    for path in glob.glob(f"{cache_dir}/*/seed.*"):
+        os.remove(path)
+
+
+def assert_dmypy_output(program: str, *, modules: Mapping[str, str], updated_modules: Mapping[str, str]) -> None:
+    """
+    Asserts the output of a mypy daemon (fine-grained incremental mode) for a program,
+    after some of the modules the program imports have been updated.
+    """
     expected = dedent(program).strip()
-    actual = "\n".join(_run_mypy(expected, use_pdb=use_pdb))
+    actual = "\n".join(_run_dmypy(expected, modules=modules, updated_modules=updated_modules))
     assert actual == expected
 
 
-MypyAssert = Callable[[str], None]
+class MypyAssert(Protocol):
+    def __call__(self, program: str, *, modules: Optional[Mapping[str, str]] = None) -> None:
+        ...
+
+
+class DmypyAssert(Protocol):
+    def __call__(self, program: str, *, modules: Mapping[str, str], updated_modules: Mapping[str, str]) -> None:
+        ...
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import importlib
+import json
+
+import mypy.nodes
+import mypy.options
+import pytest
+
+from pynamodb_mypy._cache import Memo
+
+
+def test_memo() -> None:
+    memo: Memo[str, int] = Memo("my_memo", maxsize=2)
+    memo.store("a", 1, token="x")
+    memo.store("b", 2)
+    assert memo.lookup("a", token="x") == 1
+    with pytest.raises(KeyError):
+        memo.lookup("a", token="y")
+
+    # the least recently used entry is evicted
+    memo.store("c", 3)
+    with pytest.raises(KeyError):
+        memo.lookup("b")
+    assert memo.lookup("c") == 3
+
+    memo.discard_if(lambda key: key == "c")
+    assert len(memo) == 1
+    assert memo.stats() == {"entries": 1, "maxsize": 2, "hits": 2, "misses": 2, "evictions": 1}
+
+
+def test_purge_on_parse(capsys: pytest.CaptureFixture[str]) -> None:
+    options = mypy.options.Options()
+    options.verbosity = 1
+    plugin = importlib.import_module("pynamodb_mypy.plugin").PynamodbPlugin(options)
+    plugin._attribute_types.store(("app.models.MyModel", "my_attr"), None)
+    plugin._attribute_types.store(("app.other_models.MyModel", "my_attr"), None)
+    plugin._init_signatures.store("app.models.MyModel", None)
+    plugin._calls_in_loops.store("app.models", set())
+    my_model = mypy.nodes.TypeInfo(mypy.nodes.SymbolTable(), mypy.nodes.ClassDef("MyModel", mypy.nodes.Block([])), "")
+    my_model._fullname = "app.models.MyModel"
+    other_model = mypy.nodes.TypeInfo(
+        mypy.nodes.SymbolTable(), mypy.nodes.ClassDef("MyModel", mypy.nodes.Block([])), ""
+    )
+    other_model._fullname = "app.other_models.MyModel"
+    revision = plugin._bump_attribute_revision(my_model)
+    other_revision = plugin._bump_attribute_revision(other_model)
+
+    file = mypy.nodes.MypyFile([], [])
+    file._fullname = "app.models"
+    plugin.get_additional_deps(file)
+
+    # what's memoized for the module is let go of, and the rest is kept
+    stats = plugin.memo_stats()
+    assert stats["attribute_types"]["entries"] == 1
+    assert stats["init_signatures"]["entries"] == 0
+    assert stats["calls_in_loops"]["entries"] == 0
+    # as are the revisions of the module's classes, which are drawn anew rather than recurring
+    assert list(plugin._attribute_revisions) == ["app.other_models.MyModel"]
+    assert plugin._get_attribute_revision(other_model) == other_revision
+    assert plugin._get_attribute_revision(my_model) not in (revision, other_revision)
+    assert capsys.readouterr().err == ""
+
+    # the memos' stats are logged once per build
+    plugin.set_modules({})
+    prefix = "LOG:  pynamodb-mypy memos: "
+    log_line = capsys.readouterr().err.strip()
+    assert log_line.startswith(prefix)
+    assert json.loads(log_line[len(prefix) :]) == stats
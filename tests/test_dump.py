@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import mypy.api
+import pytest
+
+from .mypy_helpers import _write_modules
+from pynamodb_mypy.dump import main
+from pynamodb_mypy.plugin import METADATA_KEY
+from pynamodb_mypy.plugin import METADATA_VERSION
+
+MODELS = """
+from typing import Any, Callable, Dict, Tuple, Union
+
+from pynamodb.attributes import Attribute
+from pynamodb.attributes import MapAttribute
+from pynamodb.attributes import NumberAttribute
+from pynamodb.attributes import UnicodeAttribute
+from pynamodb.models import Model
+
+class AnyAttribute(Attribute[Any]): ...
+class CallableAttribute(Attribute[Callable[[], None]]): ...
+class DictAttribute(Attribute[Dict[str, int]]): ...
+class TupleAttribute(Attribute[Tuple[int, str]]): ...
+class UnionAttribute(Attribute[Union[int, str]]): ...
+
+class MyMapAttribute(MapAttribute):
+    my_sub_attr = UnicodeAttribute()
+
+class NotAModel:
+    pass
+
+class MyModel(Model):
+    my_hash_key = UnicodeAttribute(hash_key=True)
+    my_range_key = NumberAttribute(range_key=True)
+    my_nullable_attr = NumberAttribute(null=True)
+    my_any_attr = AnyAttribute()
+    my_callable_attr = CallableAttribute()
+    my_dict_attr = DictAttribute()
+    my_tuple_attr = TupleAttribute()
+    my_union_attr = UnionAttribute()
+    my_nullable_union_attr = UnionAttribute(null=True)
+
+class MyDerivedModel(MyModel):
+    my_map_attr = MyMapAttribute()
+
+class MyEmptyDerivedModel(MyDerivedModel):
+    pass
+"""
+
+
+def _check(tmp_path: Path, mypy_cache_dir: str, modules: dict[str, str]) -> str:
+    cache_dir = str(tmp_path / ".mypy_cache")
+    # the shared cache saves re-analyzing typeshed and pynamodb
+    shutil.copytree(mypy_cache_dir, cache_dir)
+    sources = _write_modules(str(tmp_path), modules)
+    config_file = os.path.dirname(__file__) + "/mypy.ini"
+    stdout, _, exit_status = mypy.api.run(
+        [*(source.path or "" for source in sources), "--cache-dir", cache_dir, "--config-file", config_file]
+    )
+    assert exit_status == 0, stdout
+    return cache_dir
+
+
+def _attributes(*attributes: tuple[str, str, bool]) -> list[dict[str, object]]:
+    return [{"name": name, "type": type_, "nullable": nullable} for name, type_, nullable in attributes]
+
+
+MY_MODEL_ATTRIBUTES = [
+    ("my_any_attr", "Any", False),
+    ("my_callable_attr", "CallableType", False),
+    ("my_dict_attr", "builtins.dict[builtins.str, builtins.int]", False),
+    ("my_hash_key", "builtins.str", False),
+    ("my_nullable_attr", "Optional[builtins.float]", True),
+    ("my_nullable_union_attr", "Optional[Union[builtins.int, builtins.str]]", True),
+    ("my_range_key", "builtins.float", False),
+    ("my_tuple_attr", "Tuple[builtins.int, builtins.str]", False),
+    ("my_union_attr", "Union[builtins.int, builtins.str]", False),
+]
+MY_DERIVED_MODEL_ATTRIBUTES = sorted([*MY_MODEL_ATTRIBUTES, ("my_map_attr", "models.MyMapAttribute", False)])
+
+
+def test_dump(tmp_path: Path, mypy_cache_dir: str) -> None:
+    cache_dir = _check(tmp_path, mypy_cache_dir, {"models": MODELS})
+
+    assert main([cache_dir, "--jobs", "1", "--output", str(tmp_path / "models.jsonl")]) == 0
+    assert main([cache_dir, "--jobs", "2", "--output", str(tmp_path / "models-parallel.jsonl")]) == 0
+
+    assert (tmp_path / "models-parallel.jsonl").read_text() == (tmp_path / "models.jsonl").read_text()
+    with open(tmp_path / "models.jsonl") as f:
+        models = [json.loads(line) for line in f]
+    assert models == [
+        {
+            "model": "models.MyDerivedModel",
+            "hash_key": "my_hash_key",
+            "range_key": "my_range_key",
+            "attributes": _attributes(*MY_DERIVED_MODEL_ATTRIBUTES),
+        },
+        {
+            "model": "models.MyEmptyDerivedModel",
+            "hash_key": "my_hash_key",
+            "range_key": "my_range_key",
+            "attributes": _attributes(*MY_DERIVED_MODEL_ATTRIBUTES),
+        },
+        {
+            "model": "models.MyModel",
+            "hash_key": "my_hash_key",
+            "range_key": "my_range_key",
+            "attributes": _attributes(*MY_MODEL_ATTRIBUTES),
+        },
+    ]
+
+
+def test_dump__lazy(
+    tmp_path: Path,
+    mypy_cache_dir: str,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setenv("PYNAMODB_MYPY_LAZY", "1")
+    cache_dir = _check(
+        tmp_path,
+        mypy_cache_dir,
+        {
+            "models": """
+            from pynamodb.attributes import NumberAttribute
+            from pynamodb.models import Model
+
+            class MyModel(Model):
+                my_attr = NumberAttribute(null=True)
+            """,
+        },
+    )
+
+    assert main([cache_dir, "--jobs", "1"]) == 0
+
+    out = capsys.readouterr().out
+    assert [json.loads(line) for line in out.splitlines()] == [
+        {
+            "model": "models.MyModel",
+            "hash_key": None,
+            "range_key": None,
+            "attributes": [
+                {"name": "my_attr", "type": None, "attribute": "pynamodb.attributes.NumberAttribute", "nullable": True},
+            ],
+        },
+    ]
+
+
+def test_dump__capacity(tmp_path: Path, mypy_cache_dir: str, capsys: pytest.CaptureFixture[str]) -> None:
+    cache_dir = _check(
+        tmp_path,
+        mypy_cache_dir,
+        {
+            "models": """
+            from pynamodb.attributes import BinaryAttribute
+            from pynamodb.attributes import BooleanAttribute
+            from pynamodb.attributes import ListAttribute
+            from pynamodb.attributes import NullAttribute
+            from pynamodb.attributes import TTLAttribute
+            from pynamodb.attributes import UnicodeAttribute
+            from pynamodb.attributes import UTCDateTimeAttribute
+            from pynamodb.models import Model
+
+            class MyModel(Model):
+                my_hash_key = UnicodeAttribute(hash_key=True, attr_name='pk')
+                my_flag = BooleanAttribute(attr_name='f')
+                my_timestamp = UTCDateTimeAttribute(null=True)
+                my_null = NullAttribute()
+                my_ttl = TTLAttribute(null=True)
+
+            class MyBlobModel(Model):
+                my_hash_key = UnicodeAttribute(hash_key=True)
+                my_blob = BinaryAttribute(null=True)
+                my_list = ListAttribute()  # type: ignore[var-annotated]
+            """,
+        },
+    )
+
+    assert main([cache_dir, "--jobs", "1", "--capacity"]) == 0
+
+    out = capsys.readouterr().out
+    assert [json.loads(line)["capacity"] for line in out.splitlines()] == [
+        {
+            "typical_size": len("my_hash_key") + 32 + len("my_list") + 64,
+            "max_size": None,
+            "unbounded_attributes": ["my_blob", "my_list"],
+            "assumed_size_attributes": ["my_hash_key"],
+            "lower_bound": False,
+            "exceeds_item_size_limit": False,
+            "read_units": {"typical": 1, "max": 100},
+            "write_units": {"typical": 1, "max": 400},
+        },
+        {
+            "typical_size": len("pk") + 32 + len("f") + 1 + len("my_null") + 1,
+            # the TTL is stored as a number of seconds since the epoch
+            "max_size": len("pk")
+            + 256
+            + len("f")
+            + 1
+            + len("my_null")
+            + 1
+            + len("my_timestamp")
+            + 31
+            + len("my_ttl")
+            + 6,
+            "unbounded_attributes": [],
+            "assumed_size_attributes": ["pk"],
+            "lower_bound": True,
+            "exceeds_item_size_limit": False,
+            "read_units": {"typical": 1, "max": 1},
+            "write_units": {"typical": 1, "max": 1},
+        },
+    ]
+
+
+def test_dump__stale(tmp_path: Path, mypy_cache_dir: str, capsys: pytest.CaptureFixture[str]) -> None:
+    cache_dir = _check(tmp_path, mypy_cache_dir, {"models": MODELS})
+    # as if written by another version of the plugin
+    (data_path,) = Path(cache_dir).glob("*/models.data.json")
+    data = json.loads(data_path.read_text())
+    data["names"]["MyModel"]["node"]["metadata"][METADATA_KEY]["version"] = METADATA_VERSION - 1
+    data_path.write_text(json.dumps(data))
+
+    assert main([cache_dir, "--jobs", "1"]) == 0
+
+    captured = capsys.readouterr()
+    models = [json.loads(line) for line in captured.out.splitlines()]
+    assert [(model["model"], model["attributes"], model.get("stale")) for model in models] == [
+        ("models.MyDerivedModel", _attributes(("my_map_attr", "models.MyMapAttribute", False)), True),
+        ("models.MyEmptyDerivedModel", _attributes(("my_map_attr", "models.MyMapAttribute", False)), True),
+        ("models.MyModel", [], True),
+    ]
+    assert captured.err == (
+        "Warning: the cache holds metadata of another version of pynamodb-mypy for 3 models, so their attributes"
+        " are left out; clear the cache and re-run mypy to dump them:\n"
+        "  models.MyDerivedModel\n"
+        "  models.MyEmptyDerivedModel\n"
+        "  models.MyModel\n"
+    )
+
+
+def test_dump__no_cache(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main([str(tmp_path)]) == 1
+    python_version = f"{sys.version_info[0]}.{sys.version_info[1]}"
+    assert capsys.readouterr().err == f"No mypy cache for Python {python_version} in {tmp_path}\n"
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import importlib
+
+import pytest
+
+from .mypy_helpers import DmypyAssert
 from .mypy_helpers import MypyAssert
 
 
@@ -33,6 +38,38 @@ def test_model_init(assert_mypy_output: MypyAssert) -> None:
     )
 
 
+def test_model_init__incremental(assert_mypy_output: MypyAssert) -> None:
+    assert_mypy_output(
+        """
+    from models import MyDerivedModel
+    from models import MyModel
+
+    MyModel(5.5, my_attr=5.5)
+    MyModel(hash_key='hello', my_attr=5.5)  # E: Argument "hash_key" to "MyModel" has incompatible type "str"; expected "float"  [arg-type]
+    MyModel(foobar=5.5)  # E: Unexpected keyword argument "foobar" for "MyModel"  [call-arg]
+    MyDerivedModel(my_attr=5.5, my_derived_attr=42)
+    MyDerivedModel(my_derived_attr='42')  # E: Argument "my_derived_attr" to "MyDerivedModel" has incompatible type "str"; expected "float"  [arg-type]
+    """,
+        modules={
+            "models": """
+            from pynamodb.attributes import NumberAttribute
+            from pynamodb.models import Model
+
+            class MyModel(Model):
+                my_hash_key = NumberAttribute(hash_key=True)
+                my_attr = NumberAttribute()
+
+            class MyDerivedModel(MyModel):
+                my_derived_attr = NumberAttribute()
+
+            def make_models() -> None:
+                MyModel(my_attr=5.5)
+                MyDerivedModel(my_attr=5.5, my_derived_attr=42)
+            """,
+        },
+    )
+
+
 def test_model_init__no_attributes(assert_mypy_output: MypyAssert) -> None:
     assert_mypy_output(
         """
@@ -92,6 +129,91 @@ def test_model_init__custom_all_args(assert_mypy_output: MypyAssert) -> None:
     )
 
 
+def test_model_init__multiple_inheritance(assert_mypy_output: MypyAssert) -> None:
+    # bases declaring the same attributes with different flags
+    assert_mypy_output(
+        """
+    from typing import Optional
+    from typing_extensions import assert_type
+
+    from pynamodb.attributes import NumberAttribute
+    from pynamodb.attributes import UnicodeAttribute
+    from pynamodb.models import Model
+
+    class TimestampsMixin(Model):
+        key = UnicodeAttribute(hash_key=True)
+        created = NumberAttribute(null=True)
+
+    class AuditMixin(Model):
+        key = UnicodeAttribute()
+        created = NumberAttribute()
+
+    class MyModel(TimestampsMixin, AuditMixin):
+        pass
+
+    assert_type(MyModel().created, Optional[float])
+    """
+    )
+
+
+def test_model_used_ahead_of_class(assert_mypy_output: MypyAssert) -> None:
+    # the attributes are known before the class body is checked
+    assert_mypy_output(
+        """
+    from pynamodb.attributes import ListAttribute
+    from pynamodb.attributes import NumberAttribute
+    from pynamodb.attributes import UnicodeAttribute
+    from pynamodb.models import Model
+
+    def use_my_model() -> None:
+        MyModel('key', my_attr=None, my_list=['foo'])
+        MyModel(42)  # E: Argument 1 to "MyModel" has incompatible type "int"; expected "str"  [arg-type]
+        MyModel(my_other_list=[42])  # E: List item 0 has incompatible type "int"; expected "str"  [list-item]
+        MyModel(my_unknown_attr=42)  # E: Unexpected keyword argument "my_unknown_attr" for "MyModel"  [call-arg]
+        reveal_type(MyModel().my_attr)  # N: Revealed type is "Union[builtins.float, None]"
+        reveal_type(MyModel().my_list)  # N: Revealed type is "builtins.list[builtins.str]"
+
+    class MyModel(Model):
+        my_hash_key = UnicodeAttribute(hash_key=True, attr_name='pk')
+        my_attr = NumberAttribute(null=True)
+        my_list = ListAttribute[str]()
+        my_other_list = ListAttribute[str]()
+    """
+    )
+
+
+def test_lazy_attribute_types(assert_mypy_output: MypyAssert, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PYNAMODB_MYPY_LAZY", "1")
+    assert_mypy_output(
+        """
+    from typing import Optional
+    from typing_extensions import assert_type
+
+    from pynamodb.attributes import NumberAttribute
+    from pynamodb.attributes import UnicodeAttribute
+    from pynamodb.models import Model
+
+    class MyModel(Model):
+        my_hash_key = UnicodeAttribute(hash_key=True)
+        my_attr = NumberAttribute()
+        my_nullable_attr = NumberAttribute(null=True)
+
+    class MyDerivedModel(MyModel):
+        my_derived_attr = UnicodeAttribute(null=True)
+
+    assert_type(MyModel.my_attr, NumberAttribute)
+    assert_type(MyModel().my_attr, float)
+    assert_type(MyModel().my_nullable_attr, Optional[float])
+    assert_type(MyDerivedModel().my_derived_attr, Optional[str])
+
+    MyModel('key', my_attr=5.5, my_nullable_attr=None)
+    MyModel(42)  # E: Argument 1 to "MyModel" has incompatible type "int"; expected "str"  [arg-type]
+    MyModel(my_attr=None)  # E: Argument "my_attr" to "MyModel" has incompatible type "None"; expected "float"  [arg-type]
+    MyDerivedModel(my_attr=5.5, my_derived_attr=42)  # E: Argument "my_derived_attr" to "MyDerivedModel" has incompatible type "int"; expected "Optional[str]"  [arg-type]
+    """
+    )
+
+
 def test_number_attribute(assert_mypy_output: MypyAssert) -> None:
     assert_mypy_output(
         """
@@ -175,6 +297,68 @@ def test_custom_attribute(assert_mypy_output: MypyAssert) -> None:
     )
 
 
+@pytest.mark.parametrize("builtin_descriptor_types", [True, False])
+def test_builtin_attributes(
+    assert_mypy_output: MypyAssert,
+    monkeypatch: pytest.MonkeyPatch,
+    builtin_descriptor_types: bool,
+) -> None:
+    if not builtin_descriptor_types:
+        # the built-in attributes' types must be what analyzing their descriptors would give
+        # (the module is shadowed by the package's `plugin` entry point)
+        monkeypatch.setattr(importlib.import_module("pynamodb_mypy.plugin"), "BUILTIN_DESCRIPTOR_TYPES", {})
+    assert_mypy_output(
+        """
+    from datetime import datetime
+    from typing import List, Optional, Set
+    from typing_extensions import assert_type
+
+    from pynamodb.attributes import BinaryAttribute
+    from pynamodb.attributes import BinarySetAttribute
+    from pynamodb.attributes import BooleanAttribute
+    from pynamodb.attributes import ListAttribute
+    from pynamodb.attributes import NullAttribute
+    from pynamodb.attributes import NumberAttribute
+    from pynamodb.attributes import NumberSetAttribute
+    from pynamodb.attributes import TTLAttribute
+    from pynamodb.attributes import UnicodeAttribute
+    from pynamodb.attributes import UnicodeSetAttribute
+    from pynamodb.attributes import UTCDateTimeAttribute
+    from pynamodb.models import Model
+
+    class MyModel(Model):
+        my_binary = BinaryAttribute()
+        my_binary_set = BinarySetAttribute()
+        my_boolean = BooleanAttribute(null=True)
+        my_null = NullAttribute()
+        my_number = NumberAttribute()
+        my_number_set = NumberSetAttribute()
+        my_ttl = TTLAttribute()
+        my_unicode = UnicodeAttribute()
+        my_other_unicode = UnicodeAttribute(null=True)
+        my_unicode_set = UnicodeSetAttribute()
+        my_utc_datetime = UTCDateTimeAttribute()
+        my_list = ListAttribute[str]()
+        my_other_list = ListAttribute[str]()
+
+    my_model = MyModel()
+    assert_type(my_model.my_binary, bytes)
+    assert_type(my_model.my_binary_set, Set[bytes])
+    assert_type(my_model.my_boolean, Optional[bool])
+    assert_type(my_model.my_null, None)
+    assert_type(my_model.my_number, float)
+    assert_type(my_model.my_number_set, Set[float])
+    assert_type(my_model.my_ttl, datetime)
+    assert_type(my_model.my_unicode, str)
+    assert_type(my_model.my_other_unicode, Optional[str])
+    assert_type(my_model.my_unicode_set, Set[str])
+    assert_type(my_model.my_utc_datetime, datetime)
+    assert_type(my_model.my_list, List[str])
+    assert_type(my_model.my_other_list, List[str])
+    """
+    )
+
+
 def test_map_attribute(assert_mypy_output: MypyAssert) -> None:
     assert_mypy_output(
         """
@@ -199,6 +383,487 @@ def test_map_attribute(assert_mypy_output: MypyAssert) -> None:
     )
 
 
+def test_map_attribute__typed(assert_mypy_output: MypyAssert) -> None:
+    assert_mypy_output(
+        """
+    from typing import Optional
+    from typing_extensions import assert_type
+
+    from pynamodb.attributes import DynamicMapAttribute, MapAttribute, NumberAttribute, UnicodeAttribute
+    from pynamodb.models import Model
+
+    class MyGeoAttribute(MapAttribute):
+        my_lat = NumberAttribute()
+        my_lng = NumberAttribute(null=True)
+
+    class MyAddressAttribute(MapAttribute):
+        my_city = UnicodeAttribute()
+        my_zip_code = UnicodeAttribute(null=True)
+        my_geo = MyGeoAttribute(null=True)
+
+    class MyCustomAttribute(MapAttribute):
+        my_sub_attr = UnicodeAttribute()
+
+        def __init__(self, my_sub_attr: str) -> None:
+            super().__init__(my_sub_attr=my_sub_attr)
+
+    class MyDynamicAttribute(DynamicMapAttribute):
+        my_sub_attr = UnicodeAttribute()
+
+    class MyModel(Model):
+        my_address = MyAddressAttribute(null=True, attr_name='address')
+
+    my_address = MyModel().my_address
+    assert my_address is not None
+    assert_type(my_address.my_city, str)
+    assert_type(my_address.my_zip_code, Optional[str])
+    assert my_address.my_geo is not None
+    assert_type(my_address.my_geo.my_lng, Optional[float])
+
+    MyAddressAttribute(my_city='Springfield', my_geo=MyGeoAttribute(my_lat=42, my_lng=None))
+    MyAddressAttribute(my_city=None)  # E: Argument "my_city" to "MyAddressAttribute" has incompatible type "None"; expected "str"  [arg-type]
+    MyAddressAttribute(my_town='Springfield')  # E: Unexpected keyword argument "my_town" for "MyAddressAttribute"  [call-arg]
+    MyCustomAttribute(42)  # E: Argument 1 to "MyCustomAttribute" has incompatible type "int"; expected "str"  [arg-type]
+    MyDynamicAttribute(my_sub_attr='foo', my_other_attr=42)
+    MapAttribute(my_attr=42)
+    """
+    )
+
+
+def test_single_item_operations_in_loops(assert_mypy_output: MypyAssert) -> None:
+    assert_mypy_output(
+        """
+    from typing import List
+
+    from pynamodb.attributes import UnicodeAttribute
+    from pynamodb.models import Model
+
+    class MyModel(Model):
+        my_key = UnicodeAttribute(hash_key=True)
+
+    def get_keys() -> List[str]:
+        return []
+
+    keys = get_keys()
+    models = [MyModel.get(key) for key in keys]  # E: "MyModel.get" called within a loop, making a request per iteration; consider "MyModel.batch_get" instead  [pynamodb-n-plus-one]
+    models_by_key = {key: MyModel.get(key) for key in keys if key}  # E: "MyModel.get" called within a loop, making a request per iteration; consider "MyModel.batch_get" instead  [pynamodb-n-plus-one]
+    more_models = [MyModel.get(key) for keys in [keys] for key in keys]  # E: "MyModel.get" called within a loop, making a request per iteration; consider "MyModel.batch_get" instead  [pynamodb-n-plus-one]
+    chars = [char for char in MyModel.get('key').my_key]
+
+    for model in models:
+        model.save()  # E: "MyModel.save" called within a loop, making a request per iteration; consider "MyModel.batch_write" instead  [pynamodb-n-plus-one]
+        model.refresh()  # E: "MyModel.refresh" called within a loop, making a request per iteration; consider "MyModel.batch_get" instead  [pynamodb-n-plus-one]
+        model.delete()  # type: ignore[pynamodb-n-plus-one]
+
+        def save_later() -> None:
+            model.save()
+    else:
+        MyModel.get('key')
+
+    for char in MyModel.get('key').my_key:
+        pass
+
+    while MyModel.get('key'):  # E: "MyModel.get" called within a loop, making a request per iteration; consider "MyModel.batch_get" instead  [pynamodb-n-plus-one]
+        pass
+    else:
+        MyModel.get('key').save()
+
+    while keys:
+        keys.pop().upper()
+
+    with MyModel.batch_write() as batch:
+        for model in models:
+            batch.save(model)
+    """
+    )
+
+
+def test_query(assert_mypy_output: MypyAssert) -> None:
+    assert_mypy_output(
+        """
+    from pynamodb.attributes import NumberAttribute
+    from pynamodb.attributes import UnicodeAttribute
+    from pynamodb.indexes import AllProjection
+    from pynamodb.indexes import GlobalSecondaryIndex
+    from pynamodb.models import Model
+
+    class MyIndex(GlobalSecondaryIndex['MyModel']):
+        class Meta:
+            projection = AllProjection()
+
+        my_attr = NumberAttribute(hash_key=True)
+
+    class MyModel(Model):
+        my_hash_key = UnicodeAttribute(hash_key=True)
+        my_range_key = NumberAttribute(range_key=True)
+        my_attr = NumberAttribute()
+        my_index = MyIndex()
+
+    class MyDerivedModel(MyModel):
+        pass
+
+    class MyKeylessModel(Model):
+        pass
+
+    MyModel.query('foo')
+    MyModel.query(42)  # E: Argument 1 to "query" of "Model" has incompatible type "int"; expected "str"  [arg-type]
+    MyModel.query(hash_key=42)  # E: Argument "hash_key" to "query" of "Model" has incompatible type "int"; expected "str"  [arg-type]
+    MyDerivedModel.query(42)  # E: Argument 1 to "query" of "Model" has incompatible type "int"; expected "str"  [arg-type]
+    MyKeylessModel.query(42)
+    MyModel.query(42, index_name='my_index')
+    MyModel.my_index.query(42)
+    MyModel.my_index.query('foo')  # E: Argument 1 to "query" of "Index" has incompatible type "str"; expected "float"  [arg-type]
+
+    MyModel.query('foo', range_key_condition=MyModel.my_range_key > 42)
+    MyModel.query('foo', filter_condition=MyModel.my_attr > 42)
+    MyModel.query('foo', filter_condition=MyModel.my_range_key != 42)
+    MyModel.query('foo', filter_condition=MyModel.my_range_key > 42)  # E: Filter condition only constrains key attributes; use a range key condition to read only the matching items, rather than the whole partition  [pynamodb-key-condition]
+    MyModel.query('foo', filter_condition=MyModel.my_range_key.between(1, 2))  # E: Filter condition only constrains key attributes; use a range key condition to read only the matching items, rather than the whole partition  [pynamodb-key-condition]
+    MyModel.query('foo', filter_condition=(MyModel.my_hash_key == 'foo') & (MyModel.my_range_key <= 42))  # E: Filter condition only constrains key attributes; use a range key condition to read only the matching items, rather than the whole partition  [pynamodb-key-condition]
+    MyModel.query('foo', filter_condition=(MyModel.my_range_key > 42) & (MyModel.my_attr > 42))
+    MyModel.query('foo', filter_condition=MyModel.my_hash_key == 'foo')  # E: Filter condition only constrains the hash key, making it redundant with the query's hash key value  [pynamodb-key-condition]
+    MyModel.query('foo', filter_condition=(MyModel.my_range_key > 0) & (MyModel.my_range_key < 42))
+    MyModel.query('foo', range_key_condition=MyModel.my_range_key > 0, filter_condition=MyModel.my_range_key < 42)
+    MyModel.query('foo', filter_condition=MyModel.my_attr.exists())
+    my_range_key = MyModel.my_range_key
+    MyModel.query('foo', filter_condition=my_range_key > 42)
+    MyModel.query('foo', filter_condition=(MyModel.my_range_key > 42) | (MyModel.my_range_key < 0))
+    MyModel.query('foo', filter_condition=MyModel.my_range_key > 42, index_name='my_index')
+    MyModel.my_index.query(42, filter_condition=MyModel.my_attr > 42)  # E: Filter condition only constrains the hash key, making it redundant with the query's hash key value  [pynamodb-key-condition]
+    MyModel.my_index.query(42, filter_condition=MyModel.my_range_key > 42)
+    """
+    )
+
+
+def test_keyed_reads(assert_mypy_output: MypyAssert) -> None:
+    assert_mypy_output(
+        """
+    from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+    from pynamodb.models import Model
+
+    class MyModel(Model):
+        my_hash_key = UnicodeAttribute(hash_key=True)
+        my_range_key = NumberAttribute(range_key=True)
+
+    class MyHashModel(Model):
+        my_hash_key = NumberAttribute(hash_key=True)
+
+    class MyKeylessModel(Model):
+        my_attr = NumberAttribute()
+
+    class MyCustomModel(Model):
+        my_hash_key = UnicodeAttribute(hash_key=True)
+
+        @classmethod
+        def get(cls, key: int) -> 'MyCustomModel':  # type: ignore[override]
+            return super().get(str(key))
+
+    MyModel.get('foo', 42)
+    MyModel.get(42, 'foo')  # E: Argument 1 to "get" of "Model" has incompatible type "int"; expected "str"  [arg-type]
+                            # E: Argument 2 to "get" of "Model" has incompatible type "str"; expected "float"  [arg-type]
+    MyHashModel.get(42)
+    MyHashModel.get(42, 43)  # E: Argument 2 to "get" of "Model" has incompatible type "int"; expected "None"  [arg-type]
+    MyKeylessModel.get('foo')
+    MyCustomModel.get(42)
+
+    MyModel.count()
+    MyModel.count('foo')
+    MyModel.count(42)  # E: Argument 1 to "count" of "Model" has incompatible type "int"; expected "Optional[str]"  [arg-type]
+    MyModel.count(42, index_name='my_index')
+
+    MyModel.batch_get([('foo', 42), ('bar', 43)])
+    MyModel.batch_get([['foo', 42], ['bar', 43]])
+    MyModel.batch_get(['foo'])  # E: List item 0 has incompatible type "str"; expected "Union[Tuple[str, float], List[Union[str, float]]]"  [list-item]
+    MyHashModel.batch_get([42, 43])
+    MyHashModel.batch_get([(42, 43)])  # E: List item 0 has incompatible type "Tuple[int, int]"; expected "float"  [list-item]
+    """
+    )
+
+
+def test_index_projection(assert_mypy_output: MypyAssert) -> None:
+    assert_mypy_output(
+        """
+    from typing import Any
+    from typing_extensions import assert_type
+
+    from pynamodb.attributes import NumberAttribute
+    from pynamodb.attributes import UnicodeAttribute
+    from pynamodb.indexes import GlobalSecondaryIndex
+    from pynamodb.indexes import IncludeProjection
+    from pynamodb.indexes import KeysOnlyProjection
+    from pynamodb.indexes import LocalSecondaryIndex
+    from pynamodb.pagination import ResultIterator
+
+    from pynamodb.models import Model
+
+    class MyKeysOnlyIndex(GlobalSecondaryIndex['MyModel']):
+        class Meta:
+            projection = KeysOnlyProjection()
+
+        my_attr = NumberAttribute(hash_key=True)
+
+    class MyIncludeIndex(LocalSecondaryIndex['MyModel']):
+        class Meta:
+            projection = IncludeProjection(['my_other_attr'])
+
+        my_hash_key = UnicodeAttribute(hash_key=True)
+        my_attr = NumberAttribute(range_key=True)
+
+    non_key_attributes = ['my_other_attr']
+
+    class MyUnknownIndex(GlobalSecondaryIndex['MyModel']):
+        class Meta:
+            projection = IncludeProjection(non_key_attributes)
+
+        my_attr = NumberAttribute(hash_key=True)
+
+    class MyUntypedIndex(GlobalSecondaryIndex):  # type: ignore[type-arg]
+        class Meta:
+            read_capacity_units = 1
+            projection = MyProjection()
+
+        my_attr = NumberAttribute(hash_key=True)
+
+    class MyProjection(KeysOnlyProjection):
+        pass
+
+    class MyMetalessIndex(GlobalSecondaryIndex['MyModel']):
+        my_attr = NumberAttribute(hash_key=True)
+
+    class MyProjectionlessIndex(GlobalSecondaryIndex['MyModel']):
+        class Meta:
+            index_name = 'my_projectionless_index'
+
+        my_attr = NumberAttribute(hash_key=True)
+
+    class MyModel(Model):
+        my_hash_key = UnicodeAttribute(hash_key=True)
+        my_range_key = NumberAttribute(range_key=True)
+        my_attr = NumberAttribute()
+        my_other_attr = UnicodeAttribute()
+        my_third_attr = UnicodeAttribute()
+        my_keys_only_index = MyKeysOnlyIndex()
+        my_include_index = MyIncludeIndex()
+        my_unknown_index = MyUnknownIndex()
+        my_untyped_index = MyUntypedIndex()
+        my_metaless_index = MyMetalessIndex()
+        my_projectionless_index = MyProjectionlessIndex()
+
+    for item in MyModel.my_keys_only_index.query(42):
+        assert_type(item.my_hash_key, str)
+        assert_type(item.my_range_key, float)
+        assert_type(item.my_attr, float)
+        item.my_other_attr  # E: Attribute "my_other_attr" is not projected into "MyModel@MyKeysOnlyIndex" items, so it is not fetched  [pynamodb-projection]
+        item.save()  # E: "MyModel@MyKeysOnlyIndex" items only have some of their attributes fetched, so saving them would remove the others; use "update" instead  [pynamodb-projection]
+                     # E: "MyModel.save" called within a loop, making a request per iteration; consider "MyModel.batch_write" instead  [pynamodb-n-plus-one]
+
+    for other_item in MyModel.my_include_index.query('foo'):
+        assert_type(other_item.my_attr, float)
+        assert_type(other_item.my_other_attr, str)
+        other_item.my_third_attr  # E: Attribute "my_third_attr" is not projected into "MyModel@MyIncludeIndex" items, so it is not fetched  [pynamodb-projection]
+
+    items = MyModel.my_keys_only_index.query(43)
+    assert_type(next(items).my_attr, float)
+    next(items).my_third_attr  # E: Attribute "my_third_attr" is not projected into "MyModel@MyKeysOnlyIndex" items, so it is not fetched  [pynamodb-projection]
+    assert_type(MyModel.query('foo'), ResultIterator[MyModel])
+    assert_type(next(MyModel.my_unknown_index.query(42)).my_third_attr, str)
+    assert_type(MyModel.my_untyped_index.query(42), ResultIterator[Any])
+    assert_type(next(MyModel.my_metaless_index.query(42)).my_third_attr, str)
+    assert_type(next(MyModel.my_projectionless_index.query(42)).my_third_attr, str)
+    """
+    )
+
+
+def test_attributes_to_get(assert_mypy_output: MypyAssert) -> None:
+    assert_mypy_output(
+        """
+    from typing import Iterator, Optional
+    from typing_extensions import assert_type
+
+    from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+    from pynamodb.models import Model
+    from pynamodb.pagination import ResultIterator
+
+    class MyModel(Model):
+        my_hash_key = UnicodeAttribute(hash_key=True)
+        my_attr = NumberAttribute(null=True, attr_name='a')
+        my_other_attr = UnicodeAttribute()
+
+    class MyDerivedModel(MyModel):
+        my_derived_attr = UnicodeAttribute()
+
+    class MyClient:
+        def batch_get(self, items: Iterator[str], attributes_to_get: Optional[Iterator[str]] = None) -> None: ...
+
+    MyClient().batch_get(iter(['foo']), attributes_to_get=iter(['foo']))
+    item = MyModel.get('foo', attributes_to_get=['a', 'my_hash_key'])
+    assert_type(item.my_attr, Optional[float])
+    assert_type(item.my_hash_key, str)
+    item.my_other_attr  # E: Attribute "my_other_attr" is not projected into "MyModel@[my_attr, my_hash_key]" items, so it is not fetched  [pynamodb-projection]
+    item.save()  # E: "MyModel@[my_attr, my_hash_key]" items only have some of their attributes fetched, so saving them would remove the others; use "update" instead  [pynamodb-projection]
+    item.delete()
+
+    for other_item in MyModel.query('foo', attributes_to_get=('my_other_attr',)):
+        other_item.my_hash_key  # E: Attribute "my_hash_key" is not projected into "MyModel@[my_other_attr]" items, so it is not fetched  [pynamodb-projection]
+    for derived_item in MyDerivedModel.scan(limit=10, attributes_to_get=['a', 'my_derived_attr']):
+        assert_type(derived_item.my_derived_attr, str)
+        derived_item.my_other_attr  # E: Attribute "my_other_attr" is not projected into "MyDerivedModel@[my_attr, my_derived_attr]" items, so it is not fetched  [pynamodb-projection]
+    for batch_item in MyModel.batch_get(['foo'], attributes_to_get=['my_other_attr']):
+        batch_item.my_attr  # E: Attribute "my_attr" is not projected into "MyModel@[my_other_attr]" items, so it is not fetched  [pynamodb-projection]
+
+    attributes_to_get = ['my_attr']
+    assert_type(MyModel.get('foo', attributes_to_get=attributes_to_get), MyModel)
+    assert_type(MyModel.get('foo', attributes_to_get=['my_attr']), MyModel)  # E: No attribute of "MyModel" is named "my_attr" in DynamoDB  [pynamodb-projection]
+    assert_type(MyModel.batch_get(['foo']), Iterator[MyModel])
+    assert_type(MyModel.query('foo'), ResultIterator[MyModel])
+    """
+    )
+
+
+def test_update_actions(assert_mypy_output: MypyAssert) -> None:
+    assert_mypy_output(
+        """
+    from pynamodb.attributes import JSONAttribute, ListAttribute, NullAttribute, NumberAttribute
+    from pynamodb.attributes import UnicodeAttribute, UnicodeSetAttribute
+    from pynamodb.models import Model
+
+    class MyHolder:
+        def __init__(self) -> None:
+            self.my_attr = NumberAttribute()
+
+    class MyModel(Model):
+        my_hash_key = UnicodeAttribute(hash_key=True)
+        my_range_key = NumberAttribute(range_key=True)
+        my_counter = NumberAttribute()
+        my_status = UnicodeAttribute(null=True)
+        my_tags = UnicodeSetAttribute(null=True)
+        my_list = ListAttribute[str]()
+        my_json = JSONAttribute(null=True)
+        my_null = NullAttribute(null=True)
+        my_undeclared: NumberAttribute
+
+        def bump(self) -> None:
+            self.update(actions=[type(self).my_counter.add('1')])  # E: Argument 1 to "add" of "Attribute" has incompatible type "str"; expected "float"  [arg-type]
+
+    MyModel('key', 42).update(actions=[
+        MyModel.my_counter.add(1),
+        MyModel.my_counter.add('1'),  # E: Argument 1 to "add" of "Attribute" has incompatible type "str"; expected "float"  [arg-type]
+        MyModel.my_counter.set(MyModel.my_counter + 1),
+        MyModel.my_counter.set(None),  # E: Argument 1 to "set" of "Attribute" has incompatible type "None"; expected "Union[float, _Operand, Attribute[Any]]"  [arg-type]
+        MyModel.my_counter.remove(),  # E: Attribute "my_counter" of "MyModel" is not nullable, so it cannot be removed  [pynamodb-update-action]
+        MyModel.my_status.set(MyModel.my_status | 'foo'),
+        MyModel.my_status.set(MyModel.my_hash_key),
+        MyModel.my_status.remove(),
+        MyModel.my_status.add('foo'),  # E: "add" is only supported by number and set attributes  [pynamodb-update-action]
+        MyModel.my_tags.add('foo'),
+        MyModel.my_tags.add({'foo', 'bar'}),
+        MyModel.my_tags.delete(42),  # E: Argument 1 to "delete" of "Attribute" has incompatible type "int"; expected "Union[str, Set[str]]"  [arg-type]
+        MyModel.my_list.set(MyModel.my_list.append(['foo'])),
+        MyModel.my_list.set(MyModel.my_list.prepend([42])),  # E: List item 0 has incompatible type "int"; expected "str"  [list-item]
+        MyModel.my_json.add(42),
+        MyModel.my_null.delete(None),  # E: "delete" is only supported by set attributes  [pynamodb-update-action]
+        MyModel.my_undeclared.remove(),
+        MyModel.my_hash_key.set('other'),  # E: Attribute "my_hash_key" of "MyModel" is a key attribute, so it cannot be updated  [pynamodb-update-action]
+        MyModel.my_range_key.add(1),  # E: Attribute "my_range_key" of "MyModel" is a key attribute, so it cannot be updated  [pynamodb-update-action]
+        MyHolder().my_attr.remove(),
+    ])
+    my_attr = NumberAttribute()
+    my_attr.set('foo')
+    """
+    )
+
+
+def test_update_actions__map_attributes(assert_mypy_output: MypyAssert) -> None:
+    assert_mypy_output(
+        """
+    from typing import Any
+
+    from pynamodb.attributes import MapAttribute, UnicodeAttribute
+    from pynamodb.models import Model
+
+    class MyAddress(MapAttribute):
+        city = UnicodeAttribute()
+
+    class MyModel(Model):
+        my_hash_key = UnicodeAttribute(hash_key=True)
+        my_raw = MapAttribute[str, Any]()
+        my_address = MyAddress(null=True)
+
+    MyModel('key').update(actions=[
+        MyModel.my_raw.set({'a': 1}),
+        MyModel.my_raw.set(MapAttribute[str, Any]()),
+        MyModel.my_address.set({'city': 'x'}),
+        MyModel.my_address.set(MyAddress(city='x')),
+        MyModel.my_address.set(42),  # E: Argument 1 to "set" of "Attribute" has incompatible type "int"; expected "Union[MyAddress, _Operand, Attribute[Any], Mapping[str, Any]]"  [arg-type]
+        MyModel.my_address.set({42: 'x'}),  # E: Dict entry 0 has incompatible type "int": "str"; expected "str": "Any"  [dict-item]
+    ])
+    """
+    )
+
+
+def test_unbounded_reads(assert_mypy_output: MypyAssert) -> None:
+    assert_mypy_output(
+        """
+    # mypy: enable-error-code="pynamodb-unbounded-read"
+    from pynamodb.attributes import NumberAttribute
+    from pynamodb.attributes import UnicodeAttribute
+    from pynamodb.indexes import AllProjection
+    from pynamodb.indexes import GlobalSecondaryIndex
+    from pynamodb.models import Model
+
+    class MyIndex(GlobalSecondaryIndex['MyModel']):
+        class Meta:
+            projection = AllProjection()
+
+        my_attr = NumberAttribute(hash_key=True)
+
+    class MyModel(Model):
+        my_hash_key = UnicodeAttribute(hash_key=True)
+        my_attr = NumberAttribute()
+        my_index = MyIndex()
+
+    list(MyModel.query('foo'))  # E: "list" reads all of the results into memory; iterate over them instead, or pass a "limit"  [pynamodb-unbounded-read]
+    len(list(MyModel.my_index.query(42)))  # E: "list" reads all of the results into memory; iterate over them instead, or pass a "limit"  [pynamodb-unbounded-read]
+    sorted(MyModel.query('foo'), key=lambda item: item.my_attr)  # E: "sorted" reads all of the results into memory; iterate over them instead, or pass a "limit"  [pynamodb-unbounded-read]
+    results = MyModel.query('foo')
+    tuple(results)  # E: "tuple" reads all of the results into memory; iterate over them instead, or pass a "limit"  [pynamodb-unbounded-read]
+    list(MyModel.query('foo', limit=10))
+    list(range(10))
+    for item in MyModel.query('foo'):
+        pass
+
+    MyModel.scan()  # E: Scan without a "limit" or "page_size" reads the whole table  [pynamodb-unbounded-read]
+    MyModel.my_index.scan()  # E: Scan without a "limit" or "page_size" reads the whole table  [pynamodb-unbounded-read]
+    set(MyModel.scan(limit=10))
+    MyModel.scan(page_size=100)
+    list(MyModel.scan(page_size=100))  # E: "list" reads all of the results into memory; iterate over them instead, or pass a "limit"  [pynamodb-unbounded-read]
+    """
+    )
+
+
+def test_unbounded_reads__enabled(assert_mypy_output: MypyAssert, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PYNAMODB_MYPY_UNBOUNDED_READ", "1")
+    assert_mypy_output(
+        """
+    from batch_job import MyModel
+
+    list(MyModel.scan(page_size=100))  # E: "list" reads all of the results into memory; iterate over them instead, or pass a "limit"  [pynamodb-unbounded-read]
+    """,
+        modules={
+            # a module opting out of the checks
+            "batch_job": """
+            # mypy: disable-error-code="pynamodb-unbounded-read"
+            from pynamodb.models import Model
+
+            class MyModel(Model):
+                pass
+
+            list(MyModel.scan())
+            """,
+        },
+    )
+
+
 def test_unexpected_value_of_null(assert_mypy_output: MypyAssert) -> None:
     assert_mypy_output(
         """
@@ -260,3 +925,70 @@ def test_function_hook_fallback(assert_mypy_output: MypyAssert) -> None:
     foo()
     """
     )
+
+
+def test_dmypy_update__class_becomes_model(assert_dmypy_output: DmypyAssert) -> None:
+    assert_dmypy_output(
+        """
+    from models import MyModel
+
+    MyModel(my_attr=42)
+    MyModel(foobar=42)  # E: Unexpected keyword argument "foobar" for "MyModel"  [call-arg]
+    """,
+        modules={
+            "models": """
+            from typing import Any
+
+            class MyModel:
+                def __init__(self, **kwargs: Any) -> None:
+                    ...
+            """,
+        },
+        updated_modules={
+            "models": """
+            from pynamodb.attributes import NumberAttribute
+            from pynamodb.models import Model
+
+            class MyModel(Model):
+                my_attr = NumberAttribute()
+            """,
+        },
+    )
+
+
+def test_dmypy_update__attribute_flags_change(assert_dmypy_output: DmypyAssert) -> None:
+    # neither function had errors before, so each gets rechecked only for depending on the attributes' flags
+    assert_dmypy_output(
+        """
+    from models import MyModel
+
+    def initialize() -> None:
+        MyModel('key')  # E: Argument 1 to "MyModel" has incompatible type "str"; expected "None"  [arg-type]
+
+    def read() -> None:
+        MyModel().my_attr + 1  # E: Unsupported operand types for + ("None" and "int")  [operator]
+                               # N: Left operand is of type "Optional[float]"
+    """,
+        modules={
+            "models": """
+            from pynamodb.attributes import NumberAttribute
+            from pynamodb.attributes import UnicodeAttribute
+            from pynamodb.models import Model
+
+            class MyModel(Model):
+                my_key = UnicodeAttribute(hash_key=True)
+                my_attr = NumberAttribute()
+            """,
+        },
+        updated_modules={
+            "models": """
+            from pynamodb.attributes import NumberAttribute
+            from pynamodb.attributes import UnicodeAttribute
+            from pynamodb.models import Model
+
+            class MyModel(Model):
+                my_key = UnicodeAttribute()
+                my_attr = NumberAttribute(null=True)
+            """,
+        },
+    )
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import gc
+import json
+from pathlib import Path
+
+import pytest
+
+from .mypy_helpers import MypyAssert
+from pynamodb_mypy._profiling import _format_summary
+
+PROGRAM = """
+from pynamodb.attributes import NumberAttribute
+from pynamodb.models import Model
+
+class MyModel(Model):
+    my_hash_key = NumberAttribute(hash_key=True)
+    my_attr = NumberAttribute(null=True)
+
+class MyOtherModel(Model):
+    my_attr = NumberAttribute()
+
+MyModel(42, my_attr=42)
+MyModel(43, my_attr=None)
+MyModel().my_attr
+MyOtherModel().my_attr
+MyModel.get(42).save()
+MyModel.query(42)
+MyModel.scan(limit=10)
+MyModel.batch_get([42])
+MyModel.my_attr.set(42)
+sorted([42])
+"""
+
+
+def test_profile(assert_mypy_output: MypyAssert, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("PYNAMODB_MYPY_PROFILE", "1")
+    monkeypatch.setenv("PYNAMODB_MYPY_PROFILE_OUTPUT", str(tmp_path / "profile.json"))
+
+    assert_mypy_output(PROGRAM)
+    gc.collect()  # the profile is reported once the plugin is gone
+
+    profile = json.loads((tmp_path / "profile.json").read_text())
+    assert profile["hooks"]["_get_function_signature_hook__pynamodb_model__init__"]["calls"] == 4
+    assert profile["hooks"]["_inspect_pynamodb_attribute_init"]["calls"] == 3
+    # the built-in attributes' types are known without analyzing their descriptors
+    assert "get_descriptor_access_type" not in profile["hooks"]
+    assert profile["memos"]["descriptor_types"] == {"hits": 2, "misses": 1, "hit_rate": 2 / 3, "entries": 1}
+    assert profile["hooks"]["get_function_hook"]["calls"] > 0
+    assert profile["hooks"]["_get_method_hook__pynamodb_model__single_item_operation"]["calls"] == 2
+    assert profile["hooks"]["_get_method_hook__pynamodb_query"]["calls"] == 1
+    assert profile["hooks"]["_get_method_hook__pynamodb_scan"]["calls"] == 1
+    assert profile["hooks"]["_get_method_hook__pynamodb_model__batch_get"]["calls"] == 1
+    assert profile["hooks"]["_get_method_signature_hook__pynamodb_model__keyed_read"]["calls"] == 2
+    # the model's key types are reused by the calls to get, batch_get and query
+    assert profile["memos"]["key_types"] == {"hits": 2, "misses": 1, "hit_rate": 2 / 3, "entries": 1}
+    assert profile["hooks"]["_get_method_signature_hook__pynamodb_attribute__update"]["calls"] == 1
+    assert profile["hooks"]["_get_method_hook__pynamodb_attribute__update"]["calls"] == 1
+    assert profile["hooks"]["_get_function_hook__materializing"]["calls"] > 0
+    assert profile["models"]["__main__.MyModel"]["_get_attribute_hook__pynamodb_model"]["calls"] == 1
+    assert profile["models"]["__main__.MyModel"]["_inspect_pynamodb_attribute_init"]["calls"] == 2
+    assert profile["models"]["__main__.MyModel"]["_get_base_class_hook__pynamodb"]["calls"] == 1
+    assert profile["memos"]["init_signatures"] == {"hits": 2, "misses": 2, "hit_rate": 0.5, "entries": 2}
+
+    # which model is listed depends on the timings (see `test_format_summary`)
+    summary = _format_summary(profile, max_models=1)
+    assert sum(line.startswith("  __main__.") for line in summary.split("\n")) == 1
+    assert "... and 1 more" in summary
+
+
+def test_format_summary() -> None:
+    profile = {
+        "hooks": {"get_function_hook": {"calls": 3, "time": 0.5}},
+        "memos": {
+            "key_types": {"hits": 2, "misses": 1, "hit_rate": 2 / 3, "entries": 1},
+            "init_signatures": {"hits": 0, "misses": 0, "hit_rate": None, "entries": 0},
+        },
+        "models": {
+            "app.MyFastModel": {"_get_attribute_hook__pynamodb_model": {"calls": 10, "time": 0.25}},
+            "app.MySlowModel": {
+                "_get_attribute_hook__pynamodb_model": {"calls": 1, "time": 1.0},
+                "_get_base_class_hook__pynamodb": {"calls": 1, "time": 0.5},
+            },
+            "app.MyFastestModel": {"_get_attribute_hook__pynamodb_model": {"calls": 1, "time": 0.125}},
+        },
+    }
+
+    summary = _format_summary(profile, max_models=2)
+    lines = summary.split("\n")
+    assert lines[2].split() == ["get_function_hook", "3", "0.500"]
+    assert lines[5].split() == ["key_types", "2", "1", "66.7%", "1"]
+    assert lines[6].split() == ["init_signatures", "0", "0", "-", "0"]
+    # the slowest models first, up to max_models of them
+    assert [line.split() for line in lines[9:]] == [
+        ["app.MySlowModel", "2", "1.500"],
+        ["app.MyFastModel", "10", "0.250"],
+        ["...", "and", "1", "more"],
+    ]
+
+
+def test_profile__stderr(
+    assert_mypy_output: MypyAssert,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setenv("PYNAMODB_MYPY_PROFILE", "true")
+    monkeypatch.delenv("PYNAMODB_MYPY_PROFILE_OUTPUT", raising=False)
+
+    assert_mypy_output(
+        """
+    from pynamodb.attributes import NumberAttribute
+    from pynamodb.models import Model
+
+    class MyModel(Model):
+        my_attr = NumberAttribute()
+    """
+    )
+    gc.collect()  # the profile is reported once the plugin is gone
+
+    err = capsys.readouterr().err
+    assert "pynamodb-mypy profile:" in err
+    assert "__main__.MyModel" in err
+
+
+def test_profile__lazy(assert_mypy_output: MypyAssert, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("PYNAMODB_MYPY_PROFILE", "1")
+    monkeypatch.setenv("PYNAMODB_MYPY_PROFILE_OUTPUT", str(tmp_path / "profile.json"))
+    monkeypatch.setenv("PYNAMODB_MYPY_LAZY", "1")
+
+    assert_mypy_output(
+        """
+    from pynamodb.attributes import Attribute
+    from pynamodb.models import Model
+
+    class MyAttribute(Attribute[float]):
+        pass
+
+    class MyOtherAttribute(Attribute[str]):
+        pass
+
+    class MyModel(Model):
+        my_attr = MyAttribute(null=True)
+
+    class MyUnusedModel(Model):
+        my_attr = MyAttribute()
+        my_other_attr = MyOtherAttribute()
+
+    MyModel(my_attr=42)
+    MyModel().my_attr
+    """
+    )
+    gc.collect()  # the profile is reported once the plugin is gone
+
+    profile = json.loads((tmp_path / "profile.json").read_text())
+    assert profile["hooks"]["_inspect_pynamodb_attribute_init"]["calls"] == 3
+    # only the attribute that's used gets resolved
+    assert profile["hooks"]["get_descriptor_access_type"]["calls"] == 1
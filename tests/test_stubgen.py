@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from textwrap import dedent
+
+import mypy.api
+import pytest
+
+from pynamodb_mypy.stubgen import main
+
+MODELS = """
+from typing import TYPE_CHECKING
+
+import pynamodb.attributes
+from pynamodb.attributes import ListAttribute
+from pynamodb.attributes import UnicodeAttribute
+from pynamodb.attributes import UTCDateTimeAttribute
+from pynamodb.indexes import GlobalSecondaryIndex
+from pynamodb.indexes import KeysOnlyProjection
+from pynamodb.models import Model
+
+
+class NumberAttribute(pynamodb.attributes.NumberAttribute):
+    pass
+
+
+class MyMapAttribute(pynamodb.attributes.MapAttribute):
+    my_sub_attr = UnicodeAttribute(null=True)
+
+
+class MyIndex(GlobalSecondaryIndex["MyModel"]):
+    class Meta:
+        projection = KeysOnlyProjection()
+
+    my_attr = NumberAttribute(hash_key=True)
+
+
+class MyModel(Model):
+    class Meta:
+        table_name = "my-table"
+
+    MY_CONSTANT = 42
+    my_default = None
+
+    my_key = UnicodeAttribute(hash_key=True)
+    my_attr = NumberAttribute(null=True)
+    my_other_attr = NumberAttribute(null=True)
+    my_builtin_attr = pynamodb.attributes.NumberAttribute()
+    my_list = ListAttribute[str](null=True)
+    my_other_list = ListAttribute[int](null=True)
+    my_created = UTCDateTimeAttribute()
+    my_index = MyIndex()
+
+    def method(self) -> int:
+        return 42
+
+
+class MyDerivedModel(MyModel):
+    my_range_key = UnicodeAttribute(range_key=True)
+
+
+class MyCustomModel(Model):
+    my_key = UnicodeAttribute(hash_key=True)
+
+    def __init__(self, my_key: str) -> None:
+        super().__init__(my_key)
+
+
+class MyDerivedCustomModel(MyCustomModel):
+    pass
+
+
+my_module_constant = MyModel.MY_CONSTANT
+
+if TYPE_CHECKING:
+    my_checked_constant = MyModel.MY_CONSTANT
+
+
+class MyEmptyDerivedModel(MyDerivedModel):
+    pass
+"""
+
+STUB = """\
+import pynamodb.attributes
+from _typeshed import Incomplete
+from datetime import datetime
+from pynamodb.attributes import ListAttribute, UTCDateTimeAttribute, UnicodeAttribute
+from pynamodb.indexes import GlobalSecondaryIndex
+from pynamodb.models import Model
+from typing import Any, Callable, overload
+
+class NumberAttribute(pynamodb.attributes.NumberAttribute): ...
+
+class MyMapAttribute(pynamodb.attributes.MapAttribute):
+    my_sub_attr: _NullableUnicodeAttribute
+    def __init__(self, *, my_sub_attr: str | None = ..., hash_key: bool = ..., range_key: bool = ..., null: bool | None = ..., default: Any | Callable[..., Any] | None = ..., default_for_new: Any | Callable[..., Any] | None = ..., attr_name: str | None = ...) -> None: ...
+
+class MyIndex(GlobalSecondaryIndex['MyModel']):
+    class Meta:
+        projection: Incomplete
+    my_attr: NumberAttribute
+
+class MyModel(Model):
+    class Meta:
+        table_name: str
+    MY_CONSTANT: int
+    my_default: Incomplete
+    my_key: UnicodeAttribute
+    my_attr: _NullableNumberAttribute
+    my_other_attr: _NullableNumberAttribute
+    my_builtin_attr: pynamodb.attributes.NumberAttribute
+    my_list: _NullableListAttribute
+    my_other_list: _NullableListAttribute2
+    my_created: UTCDateTimeAttribute
+    my_index: MyIndex
+    def method(self) -> int: ...
+    def __init__(self, hash_key: str = ..., range_key: None = ..., _user_instantiated: bool = ..., *, my_key: str = ..., my_attr: float | None = ..., my_other_attr: float | None = ..., my_builtin_attr: float = ..., my_list: list[str] | None = ..., my_other_list: list[int] | None = ..., my_created: datetime = ...) -> None: ...
+
+class MyDerivedModel(MyModel):
+    my_range_key: UnicodeAttribute
+    def __init__(self, hash_key: None = ..., range_key: str = ..., _user_instantiated: bool = ..., *, my_range_key: str = ..., my_key: str = ..., my_attr: float | None = ..., my_other_attr: float | None = ..., my_builtin_attr: float = ..., my_list: list[str] | None = ..., my_other_list: list[int] | None = ..., my_created: datetime = ...) -> None: ...
+
+class MyCustomModel(Model):
+    my_key: UnicodeAttribute
+    def __init__(self, my_key: str) -> None: ...
+
+class MyDerivedCustomModel(MyCustomModel): ...
+
+my_module_constant: Incomplete
+my_checked_constant: Incomplete
+
+class MyEmptyDerivedModel(MyDerivedModel):
+    def __init__(self, hash_key: None = ..., range_key: None = ..., _user_instantiated: bool = ..., *, my_range_key: str = ..., my_key: str = ..., my_attr: float | None = ..., my_other_attr: float | None = ..., my_builtin_attr: float = ..., my_list: list[str] | None = ..., my_other_list: list[int] | None = ..., my_created: datetime = ...) -> None: ...
+
+class _NullableUnicodeAttribute(UnicodeAttribute):
+    @overload  # type: ignore[override]
+    def __get__(self, instance: None, owner: Any) -> _NullableUnicodeAttribute: ...
+    @overload
+    def __get__(self, instance: Any, owner: Any) -> str | None: ...
+
+class _NullableNumberAttribute(NumberAttribute):
+    @overload  # type: ignore[override]
+    def __get__(self, instance: None, owner: Any) -> _NullableNumberAttribute: ...
+    @overload
+    def __get__(self, instance: Any, owner: Any) -> float | None: ...
+
+class _NullableListAttribute(ListAttribute[str]):
+    @overload  # type: ignore[override]
+    def __get__(self, instance: None, owner: Any) -> _NullableListAttribute: ...
+    @overload
+    def __get__(self, instance: Any, owner: Any) -> list[str] | None: ...
+
+class _NullableListAttribute2(ListAttribute[int]):
+    @overload  # type: ignore[override]
+    def __get__(self, instance: None, owner: Any) -> _NullableListAttribute2: ...
+    @overload
+    def __get__(self, instance: Any, owner: Any) -> list[int] | None: ...
+"""
+
+CONSUMER = """
+from app.models import MyDerivedModel
+from app.models import MyMapAttribute
+from app.models import MyModel
+
+reveal_type(MyModel().my_attr)
+reveal_type(MyModel().my_key)
+reveal_type(MyModel.my_attr)
+MyModel('key', my_attr=None)
+MyModel(my_key=None)
+MyDerivedModel('key')
+for item in MyModel.my_index.query(42):
+    reveal_type(item)
+MyMapAttribute(my_sub_attr=42, null=True)
+"""
+
+
+def test_stubgen(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "__init__.py").write_text("")
+    (tmp_path / "app" / "models.py").write_text(dedent(MODELS))
+
+    assert main(["-o", "stubs", "app"]) == 0
+
+    assert (tmp_path / "stubs" / "app" / "__init__.pyi").read_text() == ""
+    assert (tmp_path / "stubs" / "app" / "models.pyi").read_text() == STUB
+
+    # the stubs type the models as the plugin does, without it
+    (tmp_path / "consumer.py").write_text(dedent(CONSUMER))
+    monkeypatch.setenv("MYPYPATH", str(tmp_path / "stubs"))
+    stdout, _, _ = mypy.api.run(["consumer.py", "--cache-dir", os.devnull, "--no-error-summary"])
+    assert stdout.splitlines() == [
+        'consumer.py:6: note: Revealed type is "Union[builtins.float, None]"',
+        'consumer.py:7: note: Revealed type is "builtins.str"',
+        'consumer.py:8: note: Revealed type is "app.models._NullableNumberAttribute"',
+        'consumer.py:10: error: Argument "my_key" to "MyModel" has incompatible type "None"; expected "str"',
+        'consumer.py:11: error: Argument 1 to "MyDerivedModel" has incompatible type "str"; expected "None"',
+        'consumer.py:13: note: Revealed type is "app.models.MyModel"',
+        'consumer.py:14: error: Argument "my_sub_attr" to "MyMapAttribute" has incompatible type "int"; '
+        'expected "Optional[str]"',
+    ]
+
+    assert main(["-o", "stubs", "--check", "app"]) == 0
+
+    (tmp_path / "app" / "models.py").write_text(dedent(MODELS).replace("(null=True)", "()"))
+    (tmp_path / "stubs" / "app" / "__init__.pyi").unlink()
+    assert main(["-o", "stubs", "--check", "app"]) == 1
+    assert capsys.readouterr().err == (
+        f"{os.path.join('stubs', 'app', '__init__.pyi')} is out of date\n"
+        f"{os.path.join('stubs', 'app', 'models.pyi')} is out of date\n"
+    )